@@ -0,0 +1,105 @@
+"""
+Per-request cost of get_current_user_info on a route that does nothing else,
+before (Config, JWTEncoder and UserManager built per request, every token decoded)
+and after (shared instances, verified tokens cached until exp). No database is needed:
+    cd backend && python benchmarks/auth_overhead.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+for name, value in (
+    ('JWT_ACCESS_SECRET_KEY', 'benchmark access secret'),
+    ('JWT_REFRESH_SECRET_KEY', 'benchmark refresh secret'),
+    ('ALGORITHM', 'HS256'),
+    ('SECRET_TOKEN_FOR_EMAIL', 'benchmark email secret'),
+):
+    os.environ.setdefault(name, value)
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from httpx import AsyncClient  # noqa: E402
+
+from app.application.auth.caches.tokens import VerifiedTokenCache  # noqa: E402
+from app.application.auth.encoders.jwt import JWTEncoder  # noqa: E402
+from app.domain.managers.users import UserManager  # noqa: E402
+from app.main.config import Config, load_config  # noqa: E402
+from app.main.di.dependencies.auth import (  # noqa: E402
+    get_access_token_from_headers,
+    get_current_user_info,
+)
+from app.main.di.providers import singleton  # noqa: E402
+
+
+def get_jwt_encoder_per_request(config: Annotated[Config, Depends(load_config)]) -> JWTEncoder:
+    return JWTEncoder(config.ALGORITHM)
+
+
+async def get_current_user_info_before(
+    access_token: Annotated[str, Depends(get_access_token_from_headers)],
+    jwt_encoder: Annotated[JWTEncoder, Depends(get_jwt_encoder_per_request)],
+    config: Annotated[Config, Depends(load_config)],
+) -> dict:
+    """THE BEHAVIOUR BEFORE: ENV READ, NEW ENCODER AND MANAGER, EVERY TOKEN DECODED"""
+    user_manager = UserManager(config.JWT_ACCESS_SECRET_KEY, jwt_encoder, VerifiedTokenCache(0))
+    return user_manager.get_user_info_from_access_token(access_token)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/anonymous')
+    async def anonymous() -> None:
+        return None
+
+    @app.get('/before')
+    async def before(user_info: Annotated[dict, Depends(get_current_user_info_before)]) -> None:
+        return None
+
+    @app.get('/after')
+    async def after(user_info: Annotated[dict, Depends(get_current_user_info)]) -> None:
+        return None
+
+    return app
+
+
+async def measure(app: FastAPI, url: str, token: str, requests: int) -> float:
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        client.headers['Authorization'] = token
+        for _ in range(min(requests, 100)):
+            await client.get(url)
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(url)
+            assert response.status_code == 200
+        return (time.perf_counter() - started) / requests
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = load_config()
+    jwt_encoder = JWTEncoder(config.ALGORITHM)
+    token = jwt_encoder.generate_jwt(
+        data={'sub': 1, 'is_superuser': False},
+        lifetime_seconds=60 * 60,
+        secret=config.JWT_ACCESS_SECRET_KEY,
+    )
+    user_manager = UserManager(config.JWT_ACCESS_SECRET_KEY, jwt_encoder, VerifiedTokenCache(10000))
+    app = create_app()
+    app.dependency_overrides[UserManager] = singleton(user_manager)
+    baseline = await measure(app, '/anonymous', token, args.requests)
+    print(f'{"variant":>8} {"us/request":>11} {"auth us/request":>16}')
+    print(f'{"no auth":>8} {baseline * 1e6:>11.1f} {0:>16.1f}')
+    for name in ('before', 'after'):
+        seconds = await measure(app, f'/{name}', token, args.requests)
+        print(f'{name:>8} {seconds * 1e6:>11.1f} {(seconds - baseline) * 1e6:>16.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+"""
+Dependency resolution cost per request of the real application graph: FastAPI's
+solve_dependencies for a route, without the route itself, its body or the database
+(sessions are opened but never used). Needs the same environment as the app:
+    cd backend && python benchmarks/di_overhead.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.dependencies.utils import solve_dependencies  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from app.application.auth.encoders.jwt import JWTEncoder  # noqa: E402
+from app.main.config import load_config  # noqa: E402
+from app.main.main import app  # noqa: E402
+
+ROUTES = ['get_media', 'get_posts', 'login', 'registration', 'get_user', 'create_post']
+
+
+def create_request(app: FastAPI, route: APIRoute, token: str, stack: AsyncExitStack) -> Request:
+    return Request(
+        {
+            'type': 'http',
+            'app': app,
+            'method': sorted(route.methods)[0],
+            'path': route.path,
+            'path_params': {name: '1' for name in route.param_convertors},
+            'query_string': b'',
+            'headers': [(b'authorization', token.encode())],
+            'fastapi_astack': stack,
+        },
+    )
+
+
+async def resolve(app: FastAPI, route: APIRoute, token: str) -> float:
+    async with AsyncExitStack() as stack:
+        started = time.perf_counter()
+        await solve_dependencies(
+            request=create_request(app, route, token, stack),
+            dependant=route.dependant,
+            dependency_overrides_provider=app,
+        )
+        return time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = load_config()
+    token = JWTEncoder(config.ALGORITHM).generate_jwt(
+        data={'sub': 1, 'is_superuser': False},
+        lifetime_seconds=60 * 60,
+        secret=config.JWT_ACCESS_SECRET_KEY,
+    )
+    routes = {route.name: route for route in app.routes if isinstance(route, APIRoute)}
+    print(f'{"route":>14} {"p50 us":>8} {"mean us":>8}')
+    for name in ROUTES:
+        for _ in range(min(args.requests, 100)):
+            await resolve(app, routes[name], token)
+        timings = [await resolve(app, routes[name], token) for _ in range(args.requests)]
+        print(
+            f'{name:>14} {statistics.median(timings) * 1e6:>8.1f} '
+            f'{statistics.mean(timings) * 1e6:>8.1f}',
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
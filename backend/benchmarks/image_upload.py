@@ -0,0 +1,135 @@
+"""
+Event loop lag while images are uploaded concurrently, with decoding and resizing
+on the event loop (inline) and in the image processor worker processes.
+A probe sleeps 10 ms in a loop, lag is how late it wakes up. No database is needed:
+    cd backend && python benchmarks/image_upload.py --uploads 4 --seconds 5 --size 6000 4000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+from multiprocessing import get_context
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from PIL import Image  # noqa: E402
+
+from app.application.images.processors import (  # noqa: E402
+    IMAGE_FORMATS,
+    IMAGE_QUALITY,
+    IMAGE_VARIANTS,
+    MAX_IMAGE_BYTES,
+    MAX_IMAGE_PIXELS,
+    ImageProcessor,
+    save_variants,
+)
+from app.application.interfaces.images.processors import (  # noqa: E402
+    ImageProcessorInterface,
+)
+
+PROBE_INTERVAL = 0.01
+
+
+class InlineImageProcessor(ImageProcessorInterface):
+    """THE BEHAVIOUR BEFORE THE PROCESS POOL"""
+
+    max_bytes = MAX_IMAGE_BYTES
+
+    async def process(self, data: bytes, root_dir: str, media_dir: str) -> dict[str, dict]:
+        return save_variants(
+            data,
+            root_dir,
+            media_dir,
+            IMAGE_VARIANTS,
+            IMAGE_FORMATS,
+            IMAGE_QUALITY,
+            MAX_IMAGE_PIXELS,
+        )
+
+
+def make_jpeg(size: tuple[int, int]) -> bytes:
+    buffer = BytesIO()
+    Image.effect_noise(size, 64).convert('RGB').save(buffer, 'JPEG', quality=90)
+    return buffer.getvalue()
+
+
+async def upload_loop(
+    image_processor: ImageProcessorInterface,
+    data: bytes,
+    root_dir: str,
+    media_dir: str,
+    deadline: float,
+    timings: list[float],
+) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await image_processor.process(data, root_dir, media_dir)
+        timings.append(time.perf_counter() - started)
+
+
+async def probe_loop(deadline: float, lags: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def run(name: str, image_processor: ImageProcessorInterface, data: bytes, args) -> None:
+    with tempfile.TemporaryDirectory() as root_dir:
+        for phase, uploads in (('idle', 0), ('upload', args.uploads)):
+            deadline = time.perf_counter() + args.seconds
+            lags, timings = [], []
+            await asyncio.gather(
+                probe_loop(deadline, lags),
+                *[
+                    upload_loop(
+                        image_processor,
+                        data,
+                        root_dir,
+                        f'{number}/',
+                        deadline,
+                        timings,
+                    )
+                    for number in range(uploads)
+                ],
+            )
+            lags.sort()
+            print(
+                f'{name:>7} {phase:>6}  loop lag p50={statistics.median(lags) * 1000:7.1f} ms '
+                f'p99={lags[int(len(lags) * 0.99)] * 1000:7.1f} ms '
+                f'max={lags[-1] * 1000:7.1f} ms  '
+                f'uploads/s={len(timings) / args.seconds:5.1f}',
+            )
+
+
+async def main(args: argparse.Namespace) -> None:
+    data = make_jpeg(tuple(args.size))
+    print(f'{args.size[0]}x{args.size[1]} JPEG, {len(data) / 2**20:.1f} MiB')
+    pool_processor = ImageProcessor(
+        partial(ProcessPoolExecutor, max_workers=args.workers, mp_context=get_context('spawn')),
+        max_pending=args.uploads,
+        timeout=60,
+    )
+    try:
+        with tempfile.TemporaryDirectory() as root_dir:
+            await pool_processor.process(data, root_dir, 'warmup/')
+        await run('inline', InlineImageProcessor(), data, args)
+        await run('pool', pool_processor, data, args)
+    finally:
+        pool_processor.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--uploads', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--size', type=int, nargs=2, default=[6000, 4000])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""
+Signing and verification throughput on one core for each supported algorithm.
+"prepared" verifies with the key objects JWTKeySet parses once, "pem" parses the PEM per token,
+"unverified" is the old decode with verify_signature disabled. No database is needed:
+    cd backend && python benchmarks/jwt_verification.py --seconds 1
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+import jwt  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa  # noqa: E402
+from cryptography.hazmat.primitives.serialization import (  # noqa: E402
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+from app.application.auth.encoders.jwt import JWTEncoder  # noqa: E402
+from app.application.auth.encoders.keys import JWTKeySet  # noqa: E402
+
+GENERATE_KEY = {
+    'RS256': lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    'ES256': lambda: ec.generate_private_key(ec.SECP256R1()),
+    'EdDSA': ed25519.Ed25519PrivateKey.generate,
+}
+PAYLOAD = {'sub': '1', 'is_superuser': False}
+
+
+def per_second(func: Callable[[], object], seconds: float) -> float:
+    calls, started = 0, time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(10):
+            func()
+        calls += 10
+    return calls / (time.perf_counter() - started)
+
+
+def create_key_set(algorithm: str, directory: Path) -> tuple[JWTKeySet, str | bytes]:
+    if algorithm == 'HS256':
+        return JWTKeySet.from_secret(algorithm, 'benchmark secret'), 'benchmark secret'
+    private_key = GENERATE_KEY[algorithm]()
+    (directory / f'{algorithm}.pem').write_bytes(
+        private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        Encoding.PEM,
+        PublicFormat.SubjectPublicKeyInfo,
+    )
+    return JWTKeySet.from_pem_dir(algorithm, str(directory), algorithm), public_pem
+
+
+def measure(algorithm: str, directory: Path, seconds: float) -> tuple[float, ...]:
+    jwt_encoder = JWTEncoder('HS256')
+    key_set, public_key = create_key_set(algorithm, directory)
+    token = jwt_encoder.generate_jwt(PAYLOAD, 60 * 60, key_set)
+    return (
+        per_second(lambda: jwt_encoder.generate_jwt(PAYLOAD, 60 * 60, key_set), seconds),
+        per_second(lambda: jwt_encoder.decode_jwt(token, key_set), seconds),
+        per_second(lambda: jwt.decode(token, public_key, algorithms=[algorithm]), seconds),
+        per_second(lambda: jwt.decode(token, options={'verify_signature': False}), seconds),
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f'{"algorithm":>9} {"sign/s":>10} {"prepared/s":>11} {"pem/s":>10} {"unverified/s":>13}',
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for algorithm in ('HS256', 'RS256', 'ES256', 'EdDSA'):
+            sign, prepared, pem, unverified = measure(algorithm, Path(directory), args.seconds)
+            print(
+                f'{algorithm:>9} {sign:>10.0f} {prepared:>11.0f} {pem:>10.0f} {unverified:>13.0f}',
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=1)
+    main(parser.parse_args())
@@ -0,0 +1,127 @@
+"""
+Latency of a non-auth endpoint (GET /tags) while logins run concurrently,
+with PBKDF2 on the event loop (inline) and in the password hasher thread pool.
+
+Uses test_db_uri, tables are created and dropped by the script:
+    cd backend && python benchmarks/login_load.py --logins 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+os.environ['db_uri'] = os.environ['test_db_uri']
+
+from httpx import AsyncClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.application.auth.hashers.passwords import (  # noqa: E402
+    DEFAULT_PASSWORD_HASHING,
+    PasswordHasher,
+    check_password_hash,
+    make_password_hash,
+)
+from app.application.interfaces.hashers.passwords import (  # noqa: E402
+    PasswordHasherInterface,
+)
+from app.domain.managers.users import UserManager  # noqa: E402
+from app.infrastructure.db.base import Base  # noqa: E402
+from app.infrastructure.db.models.users import User  # noqa: E402
+from app.main.di.providers import singleton  # noqa: E402
+from app.main.main import app  # noqa: E402
+
+
+class InlinePasswordHasher(PasswordHasherInterface):
+    """THE BEHAVIOUR BEFORE THE THREAD POOL"""
+
+    async def make_password(self, value: str) -> str:
+        return make_password_hash(value)
+
+    async def check_password(self, input_password: str, password_from_db: str) -> bool:
+        return check_password_hash(input_password, password_from_db)
+
+    def needs_rehash(self, password_from_db: str) -> bool:
+        return DEFAULT_PASSWORD_HASHING.needs_rehash(password_from_db)
+
+
+async def login_loop(client: AsyncClient, deadline: float, statuses: list[int]) -> None:
+    while time.perf_counter() < deadline:
+        response = await client.post(
+            app.url_path_for('login'),
+            json={'email': 'load@test.ru', 'input_password': 'test'},
+        )
+        statuses.append(response.status_code)
+
+
+async def probe_loop(client: AsyncClient, deadline: float, latencies: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(app.url_path_for('get_tags'))
+        assert response.status_code == 200
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+
+
+async def run(name: str, password_hasher: PasswordHasherInterface, args) -> None:
+    app.dependency_overrides[PasswordHasherInterface] = singleton(password_hasher)
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        for phase, logins in (('idle', 0), ('logins', args.logins)):
+            deadline = time.perf_counter() + args.seconds
+            latencies, statuses = [], []
+            await asyncio.gather(
+                probe_loop(client, deadline, latencies),
+                *[login_loop(client, deadline, statuses) for _ in range(logins)],
+            )
+            latencies.sort()
+            median = statistics.median(latencies)
+            print(
+                f'{name:>7} {phase:>6}  GET /tags p50={median * 1000:7.1f} ms '
+                f'p95={latencies[int(len(latencies) * 0.95)] * 1000:7.1f} ms '
+                f'max={latencies[-1] * 1000:7.1f} ms  '
+                f'logins/s={statuses.count(200) / args.seconds:6.1f}  '
+                f'503={statuses.count(503)}',
+            )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(os.environ['test_db_uri'])
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User).values(
+                username='load',
+                email='load@test.ru',
+                password=UserManager.make_password('test'),
+                is_active=True,
+                is_verified=True,
+            ),
+        )
+    pool_hasher = PasswordHasher(
+        ThreadPoolExecutor(max_workers=args.threads),
+        max_pending=args.max_pending,
+    )
+    try:
+        await run('inline', InlinePasswordHasher(), args)
+        await run('pool', pool_hasher, args)
+    finally:
+        pool_hasher.close()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logins', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--threads', type=int, default=min(os.cpu_count() or 1, 4))
+    parser.add_argument('--max-pending', type=int, default=64)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,96 @@
+"""
+Throughput of media files served by the app route and by nginx, on the same files:
+whole files and 64 KiB Range requests, with N concurrent clients.
+
+The script writes content addressed sample files under --root-dir/MEDIA_DIR (the directory
+nginx serves from /media/) and removes them at the end. Without --url only the app is measured,
+in process through ASGI; with running servers:
+    cd backend && python benchmarks/media_serving.py \
+        --url app=http://localhost:8000 --url nginx=http://localhost
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from httpx import AsyncClient  # noqa: E402
+
+from app.application.images.processors import store_blob  # noqa: E402
+from app.main.config import Config  # noqa: E402
+from app.main.main import app  # noqa: E402
+
+RANGE = 'bytes=0-65535'
+
+
+async def client_loop(
+    client: AsyncClient,
+    paths: list[str],
+    headers: dict[str, str],
+    deadline: float,
+    timings: list[float],
+    sizes: list[int],
+) -> None:
+    number = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(f'/{paths[number % len(paths)]}', headers=headers)
+        assert response.status_code in (200, 206), response.status_code
+        timings.append(time.perf_counter() - started)
+        sizes.append(len(response.content))
+        number += 1
+
+
+async def run(name: str, client: AsyncClient, paths: list[str], args) -> None:
+    for mode, headers in (('full', {}), ('range', {'Range': RANGE})):
+        deadline = time.perf_counter() + args.seconds
+        timings, sizes = [], []
+        await asyncio.gather(
+            *[
+                client_loop(client, paths, headers, deadline, timings, sizes)
+                for _ in range(args.concurrency)
+            ],
+        )
+        timings.sort()
+        print(
+            f'{name:>6} {mode:>5}  req/s={len(timings) / args.seconds:8.1f}  '
+            f'MiB/s={sum(sizes) / 2**20 / args.seconds:8.1f}  '
+            f'p50={statistics.median(timings) * 1000:6.2f} ms  '
+            f'p99={timings[int(len(timings) * 0.99)] * 1000:6.2f} ms',
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    paths = [
+        store_blob(os.urandom(args.size), args.root_dir, Config.MEDIA_DIR, 'jpg')
+        for _ in range(args.files)
+    ]
+    print(f'{args.files} files of {args.size / 1024:.0f} KiB, {args.concurrency} clients')
+    try:
+        if not args.url:
+            Config.ROOT_DIR = args.root_dir
+            async with AsyncClient(app=app, base_url='http://test') as client:
+                await run('asgi', client, paths, args)
+        for target in args.url:
+            name, _, base_url = target.partition('=')
+            async with AsyncClient(base_url=base_url) as client:
+                await run(name, client, paths, args)
+    finally:
+        for path in paths:
+            os.remove(f'{args.root_dir}/{path}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', action='append', default=[], help='name=base url')
+    parser.add_argument('--root-dir', default=Config.ROOT_DIR)
+    parser.add_argument('--files', type=int, default=20)
+    parser.add_argument('--size', type=int, default=512 * 1024)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=5)
+    asyncio.run(main(parser.parse_args()))
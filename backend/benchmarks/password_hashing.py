@@ -0,0 +1,71 @@
+"""
+Cost of one password hash (a login verifies one, a rehash makes a second) at each work factor,
+no database is needed. Hashes/s per thread bounds the login throughput of one hasher thread:
+    cd backend && python benchmarks/password_hashing.py --pbkdf2 100000 600000 --scrypt 14 15 16
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from app.application.auth.hashers.passwords import (  # noqa: E402
+    LegacyPBKDF2PasswordHashAlgorithm,
+    PBKDF2PasswordHashAlgorithm,
+    ScryptPasswordHashAlgorithm,
+)
+from app.application.interfaces.hashers.passwords import (  # noqa: E402
+    PasswordHashAlgorithmInterface,
+)
+
+
+def measure(algorithm: PasswordHashAlgorithmInterface, repeat: int) -> float:
+    hashed_password = algorithm.encode('benchmark password')
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        algorithm.verify('benchmark password', hashed_password)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def report(label: str, algorithm: PasswordHashAlgorithmInterface, repeat: int, memory: int) -> None:
+    seconds = measure(algorithm, repeat)
+    print(f'{label:<32} {seconds * 1000:>10.1f} {1 / seconds:>15.1f} {memory / 2**20:>10.1f}')
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f'{"algorithm":<32} {"ms/hash":>10} {"hashes/s/thread":>15} {"MiB/hash":>10}')
+    report('legacy (100000, hex)', LegacyPBKDF2PasswordHashAlgorithm(), args.repeat, 0)
+    for iterations in args.pbkdf2:
+        report(
+            f'pbkdf2_sha256 iterations={iterations}',
+            PBKDF2PasswordHashAlgorithm(iterations),
+            args.repeat,
+            0,
+        )
+    for log_cost in args.scrypt:
+        cost = 2**log_cost
+        report(
+            f'scrypt N=2**{log_cost} r={args.block_size} p=1',
+            ScryptPasswordHashAlgorithm(cost=cost, block_size=args.block_size),
+            args.repeat,
+            128 * args.block_size * (cost + 3),
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--pbkdf2',
+        type=int,
+        nargs='+',
+        default=[100000, 210000, 310000, 600000],
+    )
+    parser.add_argument('--scrypt', type=int, nargs='+', default=[14, 15, 16, 17])
+    parser.add_argument('--block-size', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,115 @@
+"""
+Compare post listing load strategies on a seeded database.
+
+Uses test_db_uri, tables are created and dropped by the script:
+    cd backend && python benchmarks/post_loading.py --posts 2000 --tags-per-post 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.infrastructure.db.base import Base  # noqa: E402
+from app.infrastructure.db.interfaces.repositories.posts import (  # noqa: E402
+    PostLoadStrategy,
+)
+from app.infrastructure.db.models.posts import Post  # noqa: E402
+from app.infrastructure.db.models.tags import PostTag, Tag  # noqa: E402
+from app.infrastructure.db.models.users import User  # noqa: E402
+from app.infrastructure.db.repositories.posts import PostRepository  # noqa: E402
+
+
+class TransferCounter:
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.values = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.queries += 1
+        if cursor.description and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+            self.values += cursor.rowcount * len(cursor.description)
+
+
+async def seed(session_maker: async_sessionmaker, posts: int, tags: int, tags_per_post: int):
+    async with session_maker() as session:
+        await session.execute(
+            insert(User),
+            [
+                {'username': f'user{i}', 'email': f'user{i}@test.ru', 'password': '-'}
+                for i in range(50)
+            ],
+        )
+        await session.execute(
+            insert(Tag),
+            [{'user_id': 1, 'name': f'tag{i}'} for i in range(tags)],
+        )
+        await session.execute(
+            insert(Post),
+            [
+                {'user_id': i % 50 + 1, 'title': f'post{i}', 'content': 'content ' * 100}
+                for i in range(posts)
+            ],
+        )
+        await session.execute(
+            insert(PostTag),
+            [
+                {'post_id': post_id, 'tag_id': (post_id + i) % tags + 1}
+                for post_id in range(1, posts + 1)
+                for i in range(tags_per_post)
+            ],
+        )
+        await session.commit()
+
+
+async def measure(session_maker, counter, strategy: PostLoadStrategy, limit: int, repeat: int):
+    counter.__init__()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        async with session_maker() as session:
+            posts = await PostRepository(session).get_posts(limit, load_strategy=strategy)
+            assert len(posts) == limit
+    elapsed = (time.perf_counter() - started) / repeat
+    print(
+        f'{strategy.value:>9} limit={limit:<5} {elapsed * 1000:8.2f} ms/page  '
+        f'queries={counter.queries // repeat}  rows={counter.rows // repeat}  '
+        f'values={counter.values // repeat}',
+    )
+
+
+async def main(args):
+    engine = create_async_engine(os.environ['test_db_uri'])
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        await seed(session_maker, args.posts, args.tags, args.tags_per_post)
+        counter = TransferCounter()
+        event.listen(engine.sync_engine, 'after_cursor_execute', counter)
+        for limit in args.limits:
+            for strategy in PostLoadStrategy:
+                await measure(session_maker, counter, strategy, limit, args.repeat)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=2000)
+    parser.add_argument('--tags', type=int, default=100)
+    parser.add_argument('--tags-per-post', type=int, default=20)
+    parser.add_argument('--limits', type=int, nargs='+', default=[20, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,85 @@
+"""
+Compare the old response rendering (parse_obj_as + jsonable_encoder + json.dumps)
+with the precompiled serializer on in-memory ORM objects, no database is needed:
+    cd backend && python benchmarks/serialization.py --posts 1000 10000
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import parse_obj_as  # noqa: E402
+
+from app.application.models.posts import PostReadSchema  # noqa: E402
+from app.application.serializers.schemas import serialize  # noqa: E402
+from app.infrastructure.db.base import Base  # noqa: E402, F401
+from app.infrastructure.db.models.posts import Post  # noqa: E402
+from app.infrastructure.db.models.tags import Tag  # noqa: E402
+from app.infrastructure.db.models.users import User  # noqa: E402
+
+
+def make_posts(count: int, tags_per_post: int) -> list[Post]:
+    now = datetime.utcnow()
+    users = [User(id=number, username=f'user{number}') for number in range(100)]
+    tags = [Tag(id=number, name=f'tag{number}', created_at=now) for number in range(100)]
+    return [
+        Post(
+            id=number,
+            title=f'title {number}',
+            content=' '.join(['content'] * 50),
+            published=True,
+            image=f'media/images/{number}.jpg',
+            created_at=now - timedelta(seconds=number),
+            user=users[number % len(users)],
+            tags=[tags[(number + tag) % len(tags)] for tag in range(tags_per_post)],
+        )
+        for number in range(count)
+    ]
+
+
+def render_old(posts: list[Post]) -> bytes:
+    return json.dumps(
+        jsonable_encoder(parse_obj_as(List[PostReadSchema], posts)),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def render_new(posts: list[Post]) -> bytes:
+    return serialize(List[PostReadSchema], posts)
+
+
+def measure(render, posts: list[Post], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(posts)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f'{"posts":>8} {"old, ms":>10} {"new, ms":>10} {"speedup":>8}')
+    for count in args.posts:
+        posts = make_posts(count, args.tags_per_post)
+        assert render_old(posts) == render_new(posts)
+        old = measure(render_old, posts, args.repeat)
+        new = measure(render_new, posts, args.repeat)
+        print(f'{count:>8} {old * 1000:>10.1f} {new * 1000:>10.1f} {old / new:>7.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--tags-per-post', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    main(parser.parse_args())
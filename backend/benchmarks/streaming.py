@@ -0,0 +1,102 @@
+"""
+Compare peak Python memory of a full post dump built in memory and streamed in batches.
+
+Uses test_db_uri, tables are created and dropped by the script:
+    cd backend && python benchmarks/streaming.py --posts 1000 10000 50000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.application.models.posts import PostReadSchema  # noqa: E402
+from app.application.serializers.schemas import serialize  # noqa: E402
+from app.application.serializers.streaming import (  # noqa: E402
+    StreamFormat,
+    stream_serialize,
+)
+from app.domain.utils.pagination import STREAM_BATCH_SIZE  # noqa: E402
+from app.infrastructure.db.base import Base  # noqa: E402
+from app.infrastructure.db.models.posts import Post  # noqa: E402
+from app.infrastructure.db.models.users import User  # noqa: E402
+from app.infrastructure.db.repositories.posts import PostRepository  # noqa: E402
+
+
+async def seed(session_maker: async_sessionmaker, posts: int) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            insert(User),
+            [
+                {'username': f'user{i}', 'email': f'user{i}@test.ru', 'password': '-'}
+                for i in range(50)
+            ],
+        )
+        await session.execute(
+            insert(Post),
+            [
+                {'user_id': i % 50 + 1, 'title': f'post{i}', 'content': 'content ' * 100 + 'end'}
+                for i in range(posts)
+            ],
+        )
+        await session.commit()
+
+
+async def dump_in_memory(session_maker: async_sessionmaker, limit: int) -> int:
+    async with session_maker() as session:
+        posts = await PostRepository(session).get_posts(limit)
+        return len(serialize(List[PostReadSchema], posts))
+
+
+async def dump_streamed(session_maker: async_sessionmaker, limit: int) -> int:
+    size = 0
+    async with session_maker() as session:
+        batches = PostRepository(session).stream_posts(STREAM_BATCH_SIZE)
+        async for chunk in stream_serialize(PostReadSchema, batches, StreamFormat.JSON):
+            size += len(chunk)
+    return size
+
+
+async def measure(dump, session_maker: async_sessionmaker, limit: int) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = await dump(session_maker, limit)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{dump.__name__:>15} posts={limit:<7} {elapsed * 1000:9.1f} ms  '
+        f'peak={peak / 2**20:7.1f} MiB  body={size / 2**20:7.1f} MiB',
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(os.environ['test_db_uri'])
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        for count in args.posts:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+            await seed(session_maker, count)
+            for dump in (dump_in_memory, dump_streamed):
+                await measure(dump, session_maker, count)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, nargs='+', default=[1000, 10000, 50000])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,44 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.application.interfaces.caches.tokens import VerifiedTokenCacheInterface
+
+
+class VerifiedTokenCache(VerifiedTokenCacheInterface):
+    """
+    LRU OF DECODED TOKENS, KEYED BY SHA256 OF THE TOKEN SO RAW TOKENS ARE NOT KEPT IN MEMORY.
+    AN ENTRY LIVES UNTIL THE EXP OF ITS TOKEN, MAX_ENTRIES = 0 DISABLES THE CACHE
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self.make_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value.copy()
+
+    def set(self, token: str, value: dict, expires_at: float) -> None:
+        if not self.max_entries or expires_at <= time.time():
+            return
+        key = self.make_key(token)
+        self._entries[key] = (expires_at, value.copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
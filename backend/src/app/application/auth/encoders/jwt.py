@@ -2,44 +2,55 @@ from datetime import datetime, timedelta
 
 import jwt
 
+from app.application.auth.encoders.keys import JWTKeySet
 from app.application.exceptions.auth import CouldNotValidateCredentials, TokenExpired
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
 
 
 class JWTEncoder(JWTEncoderInterface):
+    """SECRETS PASSED AS STRINGS USE THE ENCODER ALGORITHM AND ARE PREPARED ONCE"""
+
     def __init__(self, algorithm: str):
         self.algorithm = algorithm
+        self.key_sets: dict[str, JWTKeySetInterface] = {}
+
+    def get_key_set(self, secret: str | JWTKeySetInterface) -> JWTKeySetInterface:
+        if isinstance(secret, JWTKeySetInterface):
+            return secret
+        key_set = self.key_sets.get(secret)
+        if key_set is None:
+            key_set = self.key_sets[secret] = JWTKeySet.from_secret(self.algorithm, secret)
+        return key_set
 
     def generate_jwt(
         self,
         data: dict,
         lifetime_seconds: int,
-        secret: str,
+        secret: str | JWTKeySetInterface,
     ) -> str:
+        key_set = self.get_key_set(secret)
         payload = data.copy()
         if lifetime_seconds:
             expires_delta = datetime.utcnow() + timedelta(seconds=lifetime_seconds)
             payload['exp'] = expires_delta
-        return jwt.encode(payload, secret, self.algorithm)
+        return jwt.encode(payload, key_set.signing_key, key_set.algorithm, key_set.headers)
 
     def decode_jwt(
         self,
         encoded_jwt: str,
-        secret: str,
+        secret: str | JWTKeySetInterface,
         soft: bool = False,
     ) -> dict:
+        key_set = self.get_key_set(secret)
         try:
-            decoded_token = jwt.decode(
+            return jwt.decode(
                 encoded_jwt,
-                secret,
-                algorithms=[self.algorithm],
-                options={'verify_signature': False},
+                key_set.get_verifying_key(encoded_jwt),
+                algorithms=[key_set.algorithm],
+                options={'require': ['exp'], 'verify_exp': not soft},
             )
-        except (jwt.exceptions.InvalidSignatureError, jwt.exceptions.DecodeError):
-            raise CouldNotValidateCredentials
-        if decoded_token.get('exp') < datetime.utcnow().timestamp():
-            if soft:
-                """FOR LOGOUT"""
-                return {'sub': decoded_token.get('sub')}
+        except jwt.ExpiredSignatureError:
             raise TokenExpired
-        return decoded_token
+        except jwt.InvalidTokenError:
+            raise CouldNotValidateCredentials
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+
+from app.application.exceptions.auth import CouldNotValidateCredentials
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
+from app.main.config import Config
+
+
+class JWTKeySet(JWTKeySetInterface):
+    """
+    KEYS ARE PARSED INTO KEY OBJECTS ONCE, TOKENS ARE SIGNED WITH THE CURRENT KID
+    AND VERIFIED WITH THE KEY NAMED BY THEIR KID, SO RETIRED KEYS KEEP VERIFYING
+    UNTIL THEIR FILES ARE REMOVED
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        signing_key: Any,
+        verifying_keys: dict[str | None, Any],
+        kid: str | None = None,
+    ):
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.verifying_keys = verifying_keys
+        self.kid = kid
+        self.headers = {'kid': kid} if kid else None
+
+    @classmethod
+    def from_secret(cls, algorithm: str, secret: str) -> 'JWTKeySet':
+        key = jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+        return cls(algorithm, key, {None: key})
+
+    @classmethod
+    def from_pem_dir(cls, algorithm: str, directory: str, kid: str) -> 'JWTKeySet':
+        """<KID>.pem FILES, PRIVATE KEYS CAN SIGN, PUBLIC KEYS ONLY VERIFY"""
+        private_keys, verifying_keys = {}, {}
+        for path in sorted(Path(directory).glob('*.pem')):
+            data = path.read_bytes()
+            if b'PRIVATE KEY' in data:
+                private_keys[path.stem] = load_pem_private_key(data, password=None)
+                verifying_keys[path.stem] = private_keys[path.stem].public_key()
+            else:
+                verifying_keys[path.stem] = load_pem_public_key(data)
+        if kid not in private_keys:
+            raise ValueError(f'private key {kid}.pem is not found in {directory}')
+        return cls(algorithm, private_keys[kid], verifying_keys, kid)
+
+    def get_verifying_key(self, encoded_jwt: str) -> Any:
+        """THE HEADER IS PARSED FOR THE KID ONLY WHEN THERE IS MORE THAN ONE KEY"""
+        if len(self.verifying_keys) == 1:
+            return next(iter(self.verifying_keys.values()))
+        try:
+            return self.verifying_keys[jwt.get_unverified_header(encoded_jwt).get('kid')]
+        except KeyError:
+            raise CouldNotValidateCredentials
+
+    def to_jwks(self) -> dict:
+        """PUBLIC KEYS FOR OTHER SERVICES, SYMMETRIC SECRETS ARE NEVER PUBLISHED"""
+        if self.algorithm.startswith('HS'):
+            return {'keys': []}
+        algorithm = jwt.get_algorithm_by_name(self.algorithm)
+        keys = []
+        for kid, key in self.verifying_keys.items():
+            jwk = algorithm.to_jwk(key, as_dict=True)
+            jwk.update({'kid': kid, 'alg': self.algorithm, 'use': 'sig'})
+            keys.append(jwk)
+        return {'keys': keys}
+
+
+def create_access_key_set(config: Config) -> JWTKeySet:
+    if config.ALGORITHM.startswith('HS'):
+        return JWTKeySet.from_secret(config.ALGORITHM, config.JWT_ACCESS_SECRET_KEY)
+    return JWTKeySet.from_pem_dir(
+        config.ALGORITHM,
+        config.JWT_ACCESS_KEYS_DIR,
+        config.JWT_ACCESS_KEY_ID,
+    )
@@ -0,0 +1,234 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, Iterable, TypeVar
+
+from app.application.exceptions.auth import TooManyPasswordHashes
+from app.application.interfaces.hashers.passwords import (
+    PasswordHashAlgorithmInterface,
+    PasswordHasherInterface,
+)
+from app.main.config import PasswordHasherConfig
+
+T = TypeVar('T')
+
+ITERATIONS = 100000
+SALT_SIZE = 16
+SCRYPT_DKLEN = 32
+
+
+def b64encode(value: bytes) -> str:
+    return base64.b64encode(value).decode('ascii').rstrip('=')
+
+
+def b64decode(value: str) -> bytes:
+    return base64.b64decode(value + '=' * (-len(value) % 4), validate=True)
+
+
+class LegacyPBKDF2PasswordHashAlgorithm(PasswordHashAlgorithmInterface):
+    """
+    HASHES STORED BEFORE THE ALGORITHM PREFIX,
+    FIRST 64 CHARACTERS IS PASSWORD HASH, LAST 64 IS SALT
+    """
+
+    name = 'pbkdf2_sha256_legacy'
+
+    def encode(self, value: str) -> str:
+        salt = os.urandom(32)
+        password_hash = PBKDF2PasswordHashAlgorithm.derive(value, salt, ITERATIONS)
+        return '%s%s' % (password_hash.hex(), salt.hex())
+
+    def verify(self, value: str, encoded: str) -> bool:
+        salt_from_db = bytes.fromhex(encoded[-64:])
+        password_hash = PBKDF2PasswordHashAlgorithm.derive(value, salt_from_db, ITERATIONS)
+        return hmac.compare_digest(f'{password_hash.hex()}{salt_from_db.hex()}', encoded)
+
+    def must_update(self, encoded: str) -> bool:
+        return True
+
+
+class PBKDF2PasswordHashAlgorithm(PasswordHashAlgorithmInterface):
+    """pbkdf2_sha256$<ITERATIONS>$<SALT>$<HASH>, SALT AND HASH IN UNPADDED BASE64"""
+
+    name = 'pbkdf2_sha256'
+
+    def __init__(self, iterations: int = ITERATIONS):
+        self.iterations = iterations
+
+    @staticmethod
+    def derive(value: str, salt: bytes, iterations: int) -> bytes:
+        return hashlib.pbkdf2_hmac('sha256', value.encode('utf-8'), salt, iterations)
+
+    def encode(self, value: str) -> str:
+        salt = os.urandom(SALT_SIZE)
+        password_hash = self.derive(value, salt, self.iterations)
+        return '$'.join(
+            (self.name, str(self.iterations), b64encode(salt), b64encode(password_hash)),
+        )
+
+    def verify(self, value: str, encoded: str) -> bool:
+        _, iterations, salt, password_hash = encoded.split('$')
+        return hmac.compare_digest(
+            self.derive(value, b64decode(salt), int(iterations)),
+            b64decode(password_hash),
+        )
+
+    def must_update(self, encoded: str) -> bool:
+        return int(encoded.split('$')[1]) != self.iterations
+
+
+class ScryptPasswordHashAlgorithm(PasswordHashAlgorithmInterface):
+    """
+    scrypt$<N>$<R>$<P>$<SALT>$<HASH>, SALT AND HASH IN UNPADDED BASE64.
+    N IS THE COST, R THE BLOCK SIZE, P THE PARALLELIZATION,
+    ONE HASH NEEDS 128 * R * (N + P + 2) BYTES OF MEMORY
+    """
+
+    name = 'scrypt'
+
+    def __init__(self, cost: int = 2**14, block_size: int = 8, parallelization: int = 1):
+        self.params = (cost, block_size, parallelization)
+
+    @staticmethod
+    def derive(value: str, salt: bytes, cost: int, block_size: int, parallelization: int) -> bytes:
+        return hashlib.scrypt(
+            value.encode('utf-8'),
+            salt=salt,
+            n=cost,
+            r=block_size,
+            p=parallelization,
+            maxmem=128 * block_size * (cost + parallelization + 2),
+            dklen=SCRYPT_DKLEN,
+        )
+
+    def encode(self, value: str) -> str:
+        salt = os.urandom(SALT_SIZE)
+        password_hash = self.derive(value, salt, *self.params)
+        return '$'.join(
+            (self.name, *map(str, self.params), b64encode(salt), b64encode(password_hash)),
+        )
+
+    def verify(self, value: str, encoded: str) -> bool:
+        _, *params, salt, password_hash = encoded.split('$')
+        if len(params) != 3:
+            raise ValueError('scrypt hash must have 3 parameters')
+        return hmac.compare_digest(
+            self.derive(value, b64decode(salt), *map(int, params)),
+            b64decode(password_hash),
+        )
+
+    def must_update(self, encoded: str) -> bool:
+        return encoded.split('$')[1:4] != list(map(str, self.params))
+
+
+class PasswordHashing:
+    """
+    NEW HASHES USE THE DEFAULT ALGORITHM, STORED HASHES ARE VERIFIED BY THE ALGORITHM
+    NAMED IN THEIR PREFIX WITH THE PARAMETERS STORED IN THE HASH
+    """
+
+    def __init__(
+        self,
+        default: PasswordHashAlgorithmInterface,
+        algorithms: Iterable[PasswordHashAlgorithmInterface] = (),
+    ):
+        self.default = default
+        self.algorithms = {
+            algorithm.name: algorithm
+            for algorithm in (
+                LegacyPBKDF2PasswordHashAlgorithm(),
+                PBKDF2PasswordHashAlgorithm(),
+                ScryptPasswordHashAlgorithm(),
+                *algorithms,
+                default,
+            )
+        }
+
+    def identify(self, encoded: str) -> PasswordHashAlgorithmInterface | None:
+        name, separator, _ = encoded.partition('$')
+        return self.algorithms.get(name if separator else LegacyPBKDF2PasswordHashAlgorithm.name)
+
+    def make_password(self, value: str) -> str:
+        return self.default.encode(value)
+
+    def check_password(self, input_password: str, password_from_db: str) -> bool:
+        algorithm = self.identify(password_from_db)
+        if algorithm is None:
+            return False
+        try:
+            return algorithm.verify(input_password, password_from_db)
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_from_db: str) -> bool:
+        return self.identify(password_from_db) is not self.default or self.default.must_update(
+            password_from_db,
+        )
+
+
+DEFAULT_PASSWORD_HASHING = PasswordHashing(PBKDF2PasswordHashAlgorithm())
+
+
+def make_password_hash(value: str) -> str:
+    return DEFAULT_PASSWORD_HASHING.make_password(value)
+
+
+def check_password_hash(input_password: str, password_from_db: str) -> bool:
+    return DEFAULT_PASSWORD_HASHING.check_password(input_password, password_from_db)
+
+
+def create_password_hashing(config: PasswordHasherConfig) -> PasswordHashing:
+    if config.PASSWORD_HASH_ALGORITHM == ScryptPasswordHashAlgorithm.name:
+        return PasswordHashing(
+            ScryptPasswordHashAlgorithm(
+                cost=config.PASSWORD_SCRYPT_N,
+                block_size=config.PASSWORD_SCRYPT_R,
+                parallelization=config.PASSWORD_SCRYPT_P,
+            ),
+        )
+    return PasswordHashing(PBKDF2PasswordHashAlgorithm(config.PASSWORD_PBKDF2_ITERATIONS))
+
+
+class PasswordHasher(PasswordHasherInterface):
+    """
+    PBKDF2 AND SCRYPT RELEASE THE GIL, SO HASHES RUN IN PARALLEL IN THE EXECUTOR THREADS
+    WHILE THE EVENT LOOP KEEPS SERVING OTHER REQUESTS.
+    HASHES OVER MAX_PENDING (RUNNING AND QUEUED) ARE REJECTED INSTEAD OF QUEUED
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_pending: int,
+        hashing: PasswordHashing = DEFAULT_PASSWORD_HASHING,
+    ):
+        self.executor = executor
+        self.max_pending = max_pending
+        self.hashing = hashing
+        self.pending = 0
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            raise TooManyPasswordHashes
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(func, *args))
+        finally:
+            self.pending -= 1
+
+    async def make_password(self, value: str) -> str:
+        return await self.run(self.hashing.make_password, value)
+
+    async def check_password(self, input_password: str, password_from_db: str) -> bool:
+        return await self.run(self.hashing.check_password, input_password, password_from_db)
+
+    def needs_rehash(self, password_from_db: str) -> bool:
+        return self.hashing.needs_rehash(password_from_db)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -18,3 +18,12 @@ class CouldNotValidateCredentials(HTTPException):
             detail='Could not validate credentials',
             headers={'WWW-Authenticate': 'Bearer'},
         )
+
+
+class TooManyPasswordHashes(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Too many authentication requests, try again later',
+            headers={'Retry-After': '1'},
+        )
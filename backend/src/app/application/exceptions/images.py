@@ -0,0 +1,27 @@
+from starlette import status
+from starlette.exceptions import HTTPException
+
+
+class TooManyImages(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Too many image uploads, try again later',
+            headers={'Retry-After': '1'},
+        )
+
+
+class ImageProcessingTimeout(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Image processing took too long',
+        )
+
+
+class ImageWorkerCrashed(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Image processing failed, try again later',
+        )
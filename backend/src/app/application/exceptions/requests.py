@@ -0,0 +1,10 @@
+from starlette import status
+from starlette.exceptions import HTTPException
+
+
+class RequestBodyTooLarge(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail='Request body too large',
+        )
@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from concurrent.futures import BrokenExecutor, Executor, Future
+from contextlib import suppress
+from io import BytesIO
+from typing import Callable, TypeVar
+
+from PIL import Image, ImageOps, features
+
+from app.application.exceptions.images import (
+    ImageProcessingTimeout,
+    ImageWorkerCrashed,
+    TooManyImages,
+)
+from app.application.interfaces.images.processors import ImageProcessorInterface
+
+T = TypeVar('T')
+
+IMAGE_VARIANTS = {'thumbnail': (400, 400), 'medium': (1000, 1000), 'full': (2000, 1000)}
+IMAGE_FORMATS = ('webp', 'jpeg')
+IMAGE_QUALITY = 80
+MAX_IMAGE_BYTES = 10 * 2**20
+MAX_IMAGE_PIXELS = 40_000_000
+
+DECODERS = ('JPEG', 'PNG', 'WEBP')
+
+EXTENSIONS = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg'}
+SAVE_OPTIONS = {
+    'avif': {'speed': 8},
+    'webp': {'method': 4},
+    'jpeg': {'optimize': True, 'progressive': True},
+}
+
+
+class TooManyPixels(ValueError):
+    pass
+
+
+def limit_image_pixels(max_pixels: int) -> None:
+    """
+    WORKER PROCESS INITIALIZER, PILLOW WARNS OVER MAX_IMAGE_PIXELS AND REFUSES TO OPEN
+    IMAGES OVER TWICE AS MANY, save_variants REFUSES ANYTHING OVER THE LIMIT ITSELF
+    """
+    Image.MAX_IMAGE_PIXELS = max_pixels
+
+
+def fit(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """IMAGES ARE ONLY SCALED DOWN"""
+    scale = min(box[0] / size[0], box[1] / size[1], 1)
+    return max(round(size[0] * scale), 1), max(round(size[1] * scale), 1)
+
+
+def prepare(source: Image.Image, max_side: int) -> Image.Image:
+    """
+    A JPEG IS DECODED AT THE SMALLEST DCT SCALE THAT STILL COVERS THE LARGEST VARIANT,
+    THE EXIF ORIENTATION IS APPLIED AND TRANSPARENCY IS FLATTENED ON WHITE FOR JPEG
+    """
+    source.draft('RGB', (max_side, max_side))
+    img = ImageOps.exif_transpose(source)
+    if img.mode in ('RGB', 'L'):
+        return img
+    img = img.convert('RGBA')
+    background = Image.new('RGB', img.size, 'white')
+    background.paste(img, mask=img.getchannel('A'))
+    return background
+
+
+def blob_path(content: bytes, extension: str) -> str:
+    """TWO LEVELS OF 256 SHARDS KEEP EVERY DIRECTORY SMALL"""
+    digest = hashlib.sha256(content).hexdigest()
+    return f'{digest[:2]}/{digest[2:4]}/{digest}.{extension}'
+
+
+def stage_blob(
+    content: bytes,
+    root_dir: str,
+    media_dir: str,
+    extension: str,
+    staged: list[tuple[str, str]],
+) -> str:
+    """
+    THE PATH IS THE HASH OF THE ENCODED FILE, AN EXISTING BLOB IS NOT WRITTEN AGAIN,
+    ITS MTIME IS REFRESHED SO THE GARBAGE COLLECTOR GRACE PERIOD STARTS OVER.
+    A NEW BLOB IS WRITTEN TO A TEMPORARY FILE, APPENDED TO staged AS (TEMPORARY FILE, FULL PATH)
+    FOR THE CALLER TO RENAME
+    """
+    path = f'{media_dir}{blob_path(content, extension)}'
+    full_path = f'{root_dir}/{path}'
+    try:
+        os.utime(full_path)
+        return path
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    tmp_path = f'{full_path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'wb') as tmp:
+        tmp.write(content)
+    staged.append((tmp_path, full_path))
+    return path
+
+
+def store_blob(content: bytes, root_dir: str, media_dir: str, extension: str) -> str:
+    """THE FILE IS RENAMED INTO PLACE, SO READERS NEVER SEE HALF OF IT"""
+    staged: list[tuple[str, str]] = []
+    path = stage_blob(content, root_dir, media_dir, extension, staged)
+    for tmp_path, full_path in staged:
+        os.replace(tmp_path, full_path)
+    return path
+
+
+def encode_variants(
+    data: bytes,
+    root_dir: str,
+    media_dir: str,
+    variants: dict[str, tuple[int, int]],
+    formats: tuple[str, ...],
+    quality: int,
+    max_pixels: int,
+    staged: list[tuple[str, str]],
+) -> dict[str, dict]:
+    """
+    THE NEW BLOBS ARE LEFT IN staged FOR save_variants TO RENAME.
+    THE DIMENSIONS ARE CHECKED FROM THE HEADER, BEFORE ANY PIXEL IS DECODED
+    """
+    try:
+        with Image.open(BytesIO(data), formats=DECODERS) as source:
+            if source.width * source.height > max_pixels:
+                raise TooManyPixels(f'{source.width}x{source.height} image')
+            img = prepare(source, max(max(box) for box in variants.values()))
+            result = {}
+            for name, box in variants.items():
+                variant = img.resize(fit(img.size, box), Image.LANCZOS, reducing_gap=3.0)
+                result[name] = {'width': variant.width, 'height': variant.height}
+                for image_format in formats:
+                    buffer = BytesIO()
+                    variant.save(
+                        buffer,
+                        image_format.upper(),
+                        quality=quality,
+                        **SAVE_OPTIONS[image_format],
+                    )
+                    result[name][image_format] = stage_blob(
+                        buffer.getvalue(),
+                        root_dir,
+                        media_dir,
+                        EXTENSIONS[image_format],
+                        staged,
+                    )
+            return result
+    except Image.DecompressionBombError as ex:
+        raise TooManyPixels(str(ex)) from None
+    except OSError as ex:
+        raise ValueError(str(ex)) from None
+
+
+def save_variants(
+    data: bytes,
+    root_dir: str,
+    media_dir: str,
+    variants: dict[str, tuple[int, int]],
+    formats: tuple[str, ...],
+    quality: int,
+    max_pixels: int,
+    deadline: float | None = None,
+) -> dict[str, dict]:
+    """
+    RUNS IN THE WORKER PROCESS, ONLY THE RAW BYTES AND THE PATHS CROSS THE PROCESS BOUNDARY.
+    SAVES EVERY VARIANT IN EVERY FORMAT AS A CONTENT ADDRESSED BLOB UNDER <ROOT_DIR>/<MEDIA_DIR>,
+    METADATA (EXIF, ICC, XMP) IS NOT COPIED TO THE VARIANTS.
+    THE NEW BLOBS ARE RENAMED INTO PLACE ONLY WHEN EVERY VARIANT IS ENCODED BEFORE THE DEADLINE
+    (A time.time() VALUE), A FAILED OR TIMED OUT JOB REMOVES ITS TEMPORARY FILES
+    """
+    staged: list[tuple[str, str]] = []
+    try:
+        result = encode_variants(
+            data,
+            root_dir,
+            media_dir,
+            variants,
+            formats,
+            quality,
+            max_pixels,
+            staged,
+        )
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError('Image processing deadline passed')
+        for tmp_path, full_path in staged:
+            os.replace(tmp_path, full_path)
+        return result
+    finally:
+        for tmp_path, _ in staged:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+
+
+class ImageProcessor(ImageProcessorInterface):
+    """
+    DECODING AND RESIZING HOLD THE GIL, SO THEY RUN IN WORKER PROCESSES.
+    IMAGES OVER MAX_PENDING (RUNNING AND QUEUED) ARE REJECTED INSTEAD OF QUEUED,
+    A TIMED OUT IMAGE STAYS PENDING UNTIL ITS WORKER IS REALLY FREE AND WRITES NO FILES.
+    A CRASHED WORKER BREAKS THE POOL, EVEN AN IDLE ONE, IT IS REPLACED BY A NEW ONE
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[], Executor],
+        max_pending: int,
+        timeout: float,
+        variants: dict[str, tuple[int, int]] = IMAGE_VARIANTS,
+        formats: tuple[str, ...] = IMAGE_FORMATS,
+        quality: int = IMAGE_QUALITY,
+        max_bytes: int = MAX_IMAGE_BYTES,
+        max_pixels: int = MAX_IMAGE_PIXELS,
+    ):
+        unsupported = [
+            image_format
+            for image_format in formats
+            if image_format not in EXTENSIONS or not features.check(EXTENSIONS[image_format])
+        ]
+        if unsupported or 'jpeg' not in formats or not variants:
+            raise ValueError(f'Unsupported image formats {unsupported}, jpeg is required')
+        self.executor_factory = executor_factory
+        self.executor = executor_factory()
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.variants = variants
+        self.formats = tuple(formats)
+        self.quality = quality
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.pending = 0
+
+    def release(self, future: Future) -> None:
+        self.pending -= 1
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            raise TooManyImages
+        loop, executor = asyncio.get_running_loop(), self.executor
+        try:
+            future = executor.submit(func, *args)
+            self.pending += 1
+            future.add_done_callback(lambda done: loop.call_soon_threadsafe(self.release, done))
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise ImageProcessingTimeout from None
+        except BrokenExecutor:
+            self.replace_executor(executor)
+            raise ImageWorkerCrashed from None
+
+    def replace_executor(self, broken: Executor) -> None:
+        """EVERY IMAGE OF THE BROKEN POOL FAILS, ONLY THE FIRST ONE REPLACES IT"""
+        if broken is self.executor:
+            self.executor = self.executor_factory()
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def process(self, data: bytes, root_dir: str, media_dir: str) -> dict[str, dict]:
+        return await self.run(
+            save_variants,
+            data,
+            root_dir,
+            media_dir,
+            self.variants,
+            self.formats,
+            self.quality,
+            self.max_pixels,
+            time.time() + self.timeout,
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
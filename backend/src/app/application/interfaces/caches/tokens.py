@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class VerifiedTokenCacheInterface(ABC):
+    @abstractmethod
+    def get(self, token: str) -> dict | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, token: str, value: dict, expires_at: float) -> None:
+        raise NotImplementedError
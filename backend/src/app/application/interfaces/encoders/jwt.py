@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
+
 
 class JWTEncoderInterface(ABC):
     @abstractmethod
@@ -7,7 +9,7 @@ class JWTEncoderInterface(ABC):
         self,
         data: dict,
         lifetime_seconds: int,
-        secret: str,
+        secret: str | JWTKeySetInterface,
     ) -> str:
         raise NotImplementedError
 
@@ -15,7 +17,7 @@ class JWTEncoderInterface(ABC):
     def decode_jwt(
         self,
         encoded_jwt: str,
-        secret: str,
+        secret: str | JWTKeySetInterface,
         soft: bool = False,
     ) -> dict:
         raise NotImplementedError
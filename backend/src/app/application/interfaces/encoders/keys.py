@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class JWTKeySetInterface(ABC):
+    algorithm: str
+    signing_key: Any
+    headers: dict | None
+
+    @abstractmethod
+    def get_verifying_key(self, encoded_jwt: str) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_jwks(self) -> dict:
+        raise NotImplementedError
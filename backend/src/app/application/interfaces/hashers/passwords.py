@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class PasswordHashAlgorithmInterface(ABC):
+    name: str
+
+    @abstractmethod
+    def encode(self, value: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def verify(self, value: str, encoded: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def must_update(self, encoded: str) -> bool:
+        raise NotImplementedError
+
+
+class PasswordHasherInterface(ABC):
+    @abstractmethod
+    async def make_password(self, value: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def check_password(self, input_password: str, password_from_db: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def needs_rehash(self, password_from_db: str) -> bool:
+        raise NotImplementedError
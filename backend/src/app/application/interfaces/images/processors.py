@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class ImageProcessorInterface(ABC):
+    max_bytes: int
+
+    @abstractmethod
+    async def process(self, data: bytes, root_dir: str, media_dir: str) -> dict[str, dict]:
+        """
+        SAVES EVERY VARIANT IN EVERY FORMAT UNDER ROOT_DIR/MEDIA_DIR, RETURNS
+        {VARIANT: {'width': ..., 'height': ..., FORMAT: PATH RELATIVE TO ROOT_DIR}}.
+        RAISES ValueError IF THE DATA IS NOT AN IMAGE, TooManyPixels IF IT IS TOO LARGE
+        """
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class MediaUrlSignerInterface(ABC):
+    @property
+    @abstractmethod
+    def enabled(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_expires(self, now: float | None = None) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def sign(self, path: str, now: float | None = None) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def verify(self, path: str, expires: str, signature: str, now: float | None = None) -> bool:
+        raise NotImplementedError
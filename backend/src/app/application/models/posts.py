@@ -54,11 +54,27 @@ class PostUpdateSchema(BaseModel):
             return get_stripped_value(value)
 
 
+class ImageVariantSchema(BaseModel):
+    """PATHS BY FORMAT, JPEG IS ALWAYS THERE AS THE FALLBACK"""
+
+    width: int
+    height: int
+    jpeg: str
+    webp: str | None
+    avif: str | None
+
+
 class PostReadBaseSchema(CreatedAtBaseSchema, PostBaseSchema):
     id: int
     image: str | None
+    image_variants: dict[str, ImageVariantSchema] | None
 
 
 class PostReadSchema(PostReadBaseSchema):
     user: UserReadBaseSchema
     tags: List[TagReadSchema]
+
+
+class PostPageSchema(BaseModel):
+    items: List[PostReadSchema]
+    next_cursor: str | None
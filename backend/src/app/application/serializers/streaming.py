@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Sequence
+
+import orjson
+
+from app.application.serializers.schemas import Converter, compile_schema
+
+
+class StreamFormat(str, Enum):
+    JSON = 'json'
+    NDJSON = 'ndjson'
+
+    @property
+    def media_type(self) -> str:
+        if self is StreamFormat.NDJSON:
+            return 'application/x-ndjson'
+        return 'application/json'
+
+
+def get_extract(schema: Any, transform: Converter | None) -> Callable[[Any], Any]:
+    extract = compile_schema(schema)
+    if transform is None:
+        return extract
+    return lambda item: transform(extract(item))
+
+
+async def stream_json_array(
+    schema: Any,
+    batches: AsyncIterator[Sequence],
+    transform: Converter | None = None,
+) -> AsyncIterator[bytes]:
+    """ONE CHUNK PER BATCH, THE CONCATENATED CHUNKS EQUAL serialize(List[schema], ALL ROWS)"""
+    extract = get_extract(schema, transform)
+    separator = b'['
+    async for batch in batches:
+        if batch:
+            yield separator + b','.join(orjson.dumps(extract(item)) for item in batch)
+            separator = b','
+    yield b'[]' if separator == b'[' else b']'
+
+
+async def stream_ndjson(
+    schema: Any,
+    batches: AsyncIterator[Sequence],
+    transform: Converter | None = None,
+) -> AsyncIterator[bytes]:
+    extract = get_extract(schema, transform)
+    async for batch in batches:
+        if batch:
+            yield b''.join(
+                orjson.dumps(extract(item), option=orjson.OPT_APPEND_NEWLINE) for item in batch
+            )
+
+
+def stream_serialize(
+    schema: Any,
+    batches: AsyncIterator[Sequence],
+    stream_format: StreamFormat,
+    transform: Converter | None = None,
+) -> AsyncIterator[bytes]:
+    """TRANSFORM GETS EVERY EXTRACTED ITEM DICT BEFORE IT IS ENCODED"""
+    if stream_format is StreamFormat.NDJSON:
+        return stream_ndjson(schema, batches, transform)
+    return stream_json_array(schema, batches, transform)
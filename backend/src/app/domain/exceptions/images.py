@@ -3,3 +3,7 @@ from app.domain.exceptions.base import DomainException
 
 class InvalidImageType(DomainException):
     pass
+
+
+class ImageTooLarge(DomainException):
+    pass
@@ -0,0 +1,5 @@
+from app.domain.exceptions.base import DomainException
+
+
+class RefreshTokenReused(DomainException):
+    pass
@@ -13,6 +13,7 @@ class JWTServiceInterface(ABC):
     async def create_refresh_token(
         self,
         user_id: int,
+        family_id: str,
     ):
         raise NotImplementedError
 
@@ -37,11 +38,3 @@ class JWTServiceInterface(ABC):
         refresh_token: str,
     ):
         raise NotImplementedError
-
-    @staticmethod
-    @abstractmethod
-    async def delete_user_tokens_if_not_exist(
-        token: str,
-        token_data: dict,
-    ):
-        raise NotImplementedError
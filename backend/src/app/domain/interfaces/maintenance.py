@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+
+class MaintenanceServiceInterface(ABC):
+    @abstractmethod
+    async def reap_expired_refresh_tokens(
+        self,
+        batch_size: int,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reap_unverified_users(
+        self,
+        max_age: timedelta,
+        batch_size: int,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reap(
+        self,
+        unverified_max_age: timedelta,
+        batch_size: int,
+    ) -> dict:
+        raise NotImplementedError
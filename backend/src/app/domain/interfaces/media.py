@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+
+class MediaServiceInterface(ABC):
+    @abstractmethod
+    async def get_referenced_paths(
+        self,
+        batch_size: int,
+    ) -> set[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def collect_garbage(
+        self,
+        root_dir: str,
+        media_dir: str,
+        grace: timedelta,
+        batch_size: int,
+        dry_run: bool = False,
+    ) -> dict:
+        raise NotImplementedError
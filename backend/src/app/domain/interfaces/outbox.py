@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class OutboxServiceInterface(ABC):
+    @abstractmethod
+    async def dispatch(
+        self,
+        publish: Callable[[str, list[dict]], None],
+        batch_size: int,
+        lease_seconds: int,
+        retry_seconds: int,
+        max_retry_seconds: int,
+    ) -> int:
+        raise NotImplementedError
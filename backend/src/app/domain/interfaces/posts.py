@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Sequence
 
 
 class PostServiceInterface(ABC):
-    @staticmethod
     @abstractmethod
     async def update_data_image_attr(
+        self,
         data: dict,
     ) -> None:
         raise NotImplementedError
@@ -21,13 +22,23 @@ class PostServiceInterface(ABC):
     async def get_user_posts(
         self,
         user_id: int,
-    ):
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict:
         raise NotImplementedError
 
     @abstractmethod
     async def get_posts(
         self,
-    ):
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_posts(
+        self,
+    ) -> AsyncIterator[Sequence]:
         raise NotImplementedError
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Sequence
 
 
 class UserServiceInterface(ABC):
@@ -17,6 +18,13 @@ class UserServiceInterface(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    def stream_users(
+        self,
+        user_info: dict,
+    ) -> AsyncIterator[Sequence]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_user(
         self,
@@ -35,10 +43,11 @@ class UserServiceInterface(ABC):
 
 class SendVerifyMessageServiceInterface(ABC):
     @abstractmethod
-    def send_verify_message(
+    async def send_verify_message(
         self,
         user_data: dict,
-    ):
+    ) -> None:
+        """ADDS THE MESSAGE TO THE UNIT OF WORK, THE CALLER COMMITS IT WITH ITS OWN CHANGES"""
         raise NotImplementedError
 
 
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class EntityVersionServiceInterface(ABC):
+    @abstractmethod
+    async def get_versions(
+        self,
+        names: Sequence[str],
+    ):
+        raise NotImplementedError
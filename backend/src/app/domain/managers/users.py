@@ -1,57 +1,59 @@
-import hashlib
-import os
-
 from starlette import status
 from starlette.exceptions import HTTPException
 
+from app.application.auth.hashers.passwords import (
+    check_password_hash,
+    make_password_hash,
+)
+from app.application.interfaces.caches.tokens import VerifiedTokenCacheInterface
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
 
 
 class UserManager:
+    """ONE INSTANCE PER APP, VERIFIED ACCESS TOKENS ARE CACHED UNTIL THEIR EXP"""
+
     def __init__(
         self,
-        jwt_access_secret_key: str,
+        jwt_access_key: str | JWTKeySetInterface,
         jwt_encoder: JWTEncoderInterface,
+        token_cache: VerifiedTokenCacheInterface,
     ):
-        self.jwt_access_secret_key = jwt_access_secret_key
+        self.jwt_access_key = jwt_access_key
         self.jwt_encoder = jwt_encoder
+        self.token_cache = token_cache
 
     def get_user_info_from_access_token(self, access_token: str) -> dict:
+        if access_token:
+            user_info = self.token_cache.get(access_token)
+            if user_info is not None:
+                return user_info
         access_token_data = self.jwt_encoder.decode_jwt(
             encoded_jwt=access_token,
-            secret=self.jwt_access_secret_key,
+            secret=self.jwt_access_key,
         )
-        return {
+        user_info = {
             'user_id': int(access_token_data.get('sub')),
             'is_superuser': access_token_data.get('is_superuser'),
         }
+        self.token_cache.set(access_token, user_info, access_token_data['exp'])
+        return user_info
 
     @staticmethod
-    def make_password(value: str) -> str:
+    def validate_password(value: str) -> None:
         if len(value) < 4:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail='Length password must be >= 4',
             )
-        salt = os.urandom(32)
-        password_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            value.encode('utf-8'),
-            salt,
-            100000,
-        )
-        """ first 64 characters is password, last 64 is salt """
-        hashed_password = '%s%s' % (password_hash.hex(), salt.hex())
-        return hashed_password
+
+    @staticmethod
+    def make_password(value: str) -> str:
+        """BLOCKING, ASYNC CODE SHOULD USE PasswordHasherInterface"""
+        UserManager.validate_password(value)
+        return make_password_hash(value)
 
     @staticmethod
     def check_password(input_password: str, password_from_db: str) -> bool:
-        salt_from_db = bytes.fromhex(password_from_db[-64:])
-        user_input_password_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            input_password.encode('utf-8'),
-            salt_from_db,
-            100000,
-        )
-        user_input_full_hashed_password = f'{user_input_password_hash.hex()}{salt_from_db.hex()}'
-        return user_input_full_hashed_password == password_from_db
+        """BLOCKING, ASYNC CODE SHOULD USE PasswordHasherInterface"""
+        return check_password_hash(input_password, password_from_db)
@@ -1,31 +1,50 @@
+import secrets
+
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
+from app.domain.exceptions.jwt import RefreshTokenReused
 from app.domain.interfaces.jwt import JWTServiceInterface
 from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+
+REFRESH_TOKEN_LIFETIME_SECONDS = 60 * 60 * 24 * 7
 
 
 class JWTService(JWTServiceInterface):
     def __init__(
         self,
         jwt_encoder: JWTEncoderInterface,
-        jwt_access_key: str,
+        jwt_access_key: str | JWTKeySetInterface,
         jwt_refresh_key: str,
         uow: UnitOfWorkInterface,
+        refresh_token_repo: RefreshTokenRepositoryInterface,
     ):
         self.jwt_encoder = jwt_encoder
         self.jwt_access_key = jwt_access_key
         self.jwt_refresh_key = jwt_refresh_key
         self.uow = uow
+        self.refresh_token_repo = refresh_token_repo
 
     async def create_auth_tokens(
         self,
         user_id: int,
     ):
-        is_superuser = await self.uow.jwt_repo.is_superuser(user_id)
-
-        access_token = await self.create_access_token(user_id, is_superuser)
-        refresh_token = await self.create_refresh_token(user_id)
+        """LOGIN STARTS A NEW REFRESH TOKEN FAMILY"""
+        family_id = secrets.token_urlsafe(16)
+        access_token = await self.create_access_token(
+            user_id,
+            await self.uow.jwt_repo.is_superuser(user_id),
+        )
+        refresh_token = await self.create_refresh_token(user_id, family_id)
 
-        await self.uow.jwt_repo.save_refresh_token(user_id, refresh_token)
+        await self.refresh_token_repo.save(
+            user_id,
+            family_id,
+            refresh_token,
+            REFRESH_TOKEN_LIFETIME_SECONDS,
+        )
         await self.uow.commit()
 
         return {
@@ -36,11 +55,13 @@ class JWTService(JWTServiceInterface):
     async def create_refresh_token(
         self,
         user_id: int,
+        family_id: str,
     ) -> str:
-        to_encode = {'sub': str(user_id)}
+        """JTI KEEPS TOKENS OF ONE FAMILY ISSUED IN THE SAME SECOND DISTINCT"""
+        to_encode = {'sub': str(user_id), 'fam': family_id, 'jti': secrets.token_urlsafe(8)}
         encoded_jwt = self.jwt_encoder.generate_jwt(
             data=to_encode,
-            lifetime_seconds=60 * 60 * 24 * 7,
+            lifetime_seconds=REFRESH_TOKEN_LIFETIME_SECONDS,
             secret=self.jwt_refresh_key,
         )
         return encoded_jwt
@@ -61,13 +82,36 @@ class JWTService(JWTServiceInterface):
         self,
         refresh_token: str,
     ):
+        """
+        A REUSED REFRESH TOKEN WAS MOST LIKELY STOLEN,
+        ITS FAMILY IS REVOKED AND THE LAST TOKEN OF THE FAMILY STOPS WORKING TOO
+        """
         refresh_token_data = self.jwt_encoder.decode_jwt(
             encoded_jwt=refresh_token,
             secret=self.jwt_refresh_key,
         )
-        await self.delete_user_tokens_if_not_exist(refresh_token, refresh_token_data)
-        tokens = await self.create_auth_tokens(int(refresh_token_data.get('sub')))
-        return tokens
+        user_id = int(refresh_token_data.get('sub'))
+        family_id = refresh_token_data.get('fam', '')
+        new_refresh_token = await self.create_refresh_token(user_id, family_id)
+        rotated = await self.refresh_token_repo.rotate(
+            user_id,
+            family_id,
+            refresh_token,
+            new_refresh_token,
+            REFRESH_TOKEN_LIFETIME_SECONDS,
+        )
+        if not rotated:
+            await self.uow.commit()
+            raise RefreshTokenReused
+        access_token = await self.create_access_token(
+            user_id,
+            await self.uow.jwt_repo.is_superuser(user_id),
+        )
+        await self.uow.commit()
+        return {
+            'access_token': access_token,
+            'refresh_token': new_refresh_token,
+        }
 
     async def delete_refresh_token(
         self,
@@ -78,18 +122,9 @@ class JWTService(JWTServiceInterface):
             secret=self.jwt_refresh_key,
             soft=True,
         )
-        await self.delete_user_tokens_if_not_exist(refresh_token, refresh_token_data)
+        await self.refresh_token_repo.revoke(
+            int(refresh_token_data.get('sub')),
+            refresh_token_data.get('fam', ''),
+            refresh_token,
+        )
         await self.uow.commit()
-
-    async def delete_user_tokens_if_not_exist(
-        self,
-        token: str,
-        token_data: dict,
-    ) -> None:
-        deleted_id = await self.uow.jwt_repo.delete_refresh_token(token)
-        """
-        DELETE TOKEN AND RETURNING ID
-        IF ID IS NONE THAT MEANS ID WAS DELETED EARLY, MOST LIKELY BY HACKER
-        """
-        if not deleted_id:
-            await self.uow.jwt_repo.delete_all_user_refresh_tokens(int(token_data.get('sub')))
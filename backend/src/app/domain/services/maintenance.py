@@ -0,0 +1,63 @@
+import time
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from app.domain.interfaces.maintenance import MaintenanceServiceInterface
+from app.infrastructure.db.models.versions import EntityName
+from app.infrastructure.db.uow import UnitOfWorkInterface
+
+
+class MaintenanceService(MaintenanceServiceInterface):
+    """EVERY BATCH IS COMMITTED ON ITS OWN, SO LOCKS ARE HELD FOR ONE BATCH ONLY"""
+
+    def __init__(
+        self,
+        uow: UnitOfWorkInterface,
+    ):
+        self.uow = uow
+
+    async def reap_expired_refresh_tokens(
+        self,
+        batch_size: int,
+    ) -> int:
+        now, reaped, deleted = datetime.utcnow(), 0, batch_size
+        while deleted == batch_size:
+            deleted = await self.uow.jwt_repo.delete_expired_refresh_tokens(now, batch_size)
+            await self.uow.commit()
+            reaped += deleted
+        return reaped
+
+    async def reap_unverified_users(
+        self,
+        max_age: timedelta,
+        batch_size: int,
+    ) -> int:
+        registered_before, reaped, deleted = datetime.utcnow() - max_age, 0, batch_size
+        while deleted == batch_size:
+            deleted = await self.uow.user_repo.delete_unverified_users(
+                registered_before,
+                batch_size,
+            )
+            if deleted:
+                await self.uow.version_repo.bump(EntityName.USER)
+            await self.uow.commit()
+            reaped += deleted
+        return reaped
+
+    async def reap(
+        self,
+        unverified_max_age: timedelta,
+        batch_size: int,
+    ) -> dict:
+        started = time.perf_counter()
+        report = {
+            'refresh_tokens': await self.reap_expired_refresh_tokens(batch_size),
+            'unverified_users': await self.reap_unverified_users(unverified_max_age, batch_size),
+        }
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        logger.info(
+            f'Reaped {report["refresh_tokens"]} expired refresh tokens and '
+            f'{report["unverified_users"]} unverified accounts in {report["seconds"]} s',
+        )
+        return report
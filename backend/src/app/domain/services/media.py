@@ -0,0 +1,94 @@
+import asyncio
+import os
+import time
+from contextlib import suppress
+from datetime import timedelta
+from typing import Iterator
+
+from loguru import logger
+
+from app.domain.interfaces.media import MediaServiceInterface
+from app.domain.utils.upload_image import get_image_paths
+from app.infrastructure.db.uow import UnitOfWorkInterface
+
+
+def remove_file(path: str) -> bool:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def iter_media_files(media_root: str) -> Iterator[tuple[str, os.stat_result]]:
+    """A TEMPORARY FILE CAN BE RENAMED BY A WORKER BETWEEN THE LISTING AND THE STAT"""
+    for dirpath, _, filenames in os.walk(media_root):
+        for path in [os.path.join(dirpath, name) for name in filenames if name[0] != '.']:
+            with suppress(FileNotFoundError):
+                yield path, os.stat(path)
+
+
+def sweep(
+    root_dir: str,
+    media_dir: str,
+    referenced: set[str],
+    cutoff: float,
+    dry_run: bool,
+) -> dict:
+    """
+    EMPTY SHARD DIRECTORIES ARE KEPT, REMOVING ONE COULD RACE WITH A WORKER WRITING INTO IT
+    """
+    report = {'scanned': 0, 'deleted': 0, 'bytes_reclaimed': 0}
+    for path, stat in iter_media_files(f'{root_dir}/{media_dir}'):
+        report['scanned'] += 1
+        if stat.st_mtime > cutoff or os.path.relpath(path, root_dir) in referenced:
+            continue
+        if dry_run or remove_file(path):
+            report['deleted'] += 1
+            report['bytes_reclaimed'] += stat.st_size
+    return report
+
+
+class MediaService(MediaServiceInterface):
+    """
+    MARK AND SWEEP: A FILE NO POST REFERENCES IS DELETED ONCE IT IS OLDER THAN THE GRACE
+    PERIOD, SO FILES OF AN UPLOAD WHOSE POST IS NOT COMMITTED YET SURVIVE
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWorkInterface,
+    ):
+        self.uow = uow
+
+    async def get_referenced_paths(
+        self,
+        batch_size: int,
+    ) -> set[str]:
+        referenced = set()
+        async for rows in self.uow.post_repo.stream_images(batch_size):
+            for image, image_variants in rows:
+                referenced.update(get_image_paths(image, image_variants))
+        return referenced
+
+    async def collect_garbage(
+        self,
+        root_dir: str,
+        media_dir: str,
+        grace: timedelta,
+        batch_size: int,
+        dry_run: bool = False,
+    ) -> dict:
+        started = time.perf_counter()
+        # TAKEN BEFORE THE MARK, A FILE WRITTEN OR CLAIMED DURING IT IS NEWER THAN THE CUTOFF
+        cutoff = time.time() - grace.total_seconds()
+        referenced = await self.get_referenced_paths(batch_size)
+        report = await asyncio.to_thread(sweep, root_dir, media_dir, referenced, cutoff, dry_run)
+        report['referenced'] = len(referenced)
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        logger.info(
+            f'{"Would reclaim" if dry_run else "Reclaimed"} {report["bytes_reclaimed"]} bytes '
+            f'in {report["deleted"]} of {report["scanned"]} media files, '
+            f'{report["referenced"]} files are referenced, {report["seconds"]} s',
+        )
+        return report
@@ -0,0 +1,120 @@
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Callable
+
+import anyio
+from loguru import logger
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.domain.interfaces.outbox import OutboxServiceInterface
+from app.infrastructure.db.models.outbox import OutboxMessage
+from app.infrastructure.db.uow import UnitOfWork, UnitOfWorkInterface
+
+
+class OutboxService(OutboxServiceInterface):
+    """
+    THE CLAIM IS COMMITTED BEFORE THE BROKER IS CALLED, SO NO ROW LOCK OR TRANSACTION IS HELD
+    WHILE PUBLISHING. DELIVERY IS AT LEAST ONCE: ROWS OF A PROCESS THAT DIES BEFORE DELETING
+    THEM ARE PUBLISHED AGAIN ONCE THEIR LEASE EXPIRES
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWorkInterface,
+    ):
+        self.uow = uow
+
+    async def dispatch(
+        self,
+        publish: Callable[[str, list[dict]], None],
+        batch_size: int,
+        lease_seconds: int,
+        retry_seconds: int,
+        max_retry_seconds: int,
+    ) -> int:
+        """ONE TASK PER TOPIC FOR THE WHOLE BATCH, THE BROKER CALL RUNS IN A THREAD"""
+        now = datetime.utcnow()
+        messages = await self.uow.outbox_repo.claim(
+            now,
+            batch_size,
+            lease_until=now + timedelta(seconds=lease_seconds),
+        )
+        await self.uow.commit()
+        topics: dict[str, list[OutboxMessage]] = {}
+        for message in messages:
+            topics.setdefault(message.topic, []).append(message)
+        for topic, topic_messages in topics.items():
+            ids = [message.id for message in topic_messages]
+            try:
+                await anyio.to_thread.run_sync(
+                    publish,
+                    topic,
+                    [message.payload for message in topic_messages],
+                )
+            except Exception as ex:
+                attempts = max(message.attempts for message in topic_messages)
+                delay = min(retry_seconds * 2**attempts, max_retry_seconds)
+                logger.warning(f'Publishing {len(ids)} {topic} failed, retry in {delay}s: {ex}')
+                await self.uow.outbox_repo.postpone(ids, now + timedelta(seconds=delay))
+                continue
+            await self.uow.outbox_repo.delete(ids)
+        await self.uow.commit()
+        return len(messages)
+
+
+class OutboxDispatcher:
+    """
+    DRAINS THE OUTBOX FROM A BACKGROUND TASK OF EVERY WEB PROCESS. A FULL BATCH IS FOLLOWED
+    BY THE NEXT ONE AT ONCE, OTHERWISE THE OUTBOX IS POLLED EVERY poll_seconds
+    """
+
+    def __init__(
+        self,
+        async_session_maker: async_sessionmaker,
+        publish: Callable[[str, list[dict]], None],
+        batch_size: int,
+        poll_seconds: int,
+        lease_seconds: int,
+        retry_seconds: int,
+        max_retry_seconds: int,
+    ):
+        self.async_session_maker = async_session_maker
+        self.publish = publish
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.task: asyncio.Task | None = None
+
+    async def dispatch(self) -> int:
+        async with self.async_session_maker() as session:
+            return await OutboxService(UnitOfWork(session)).dispatch(
+                self.publish,
+                batch_size=self.batch_size,
+                lease_seconds=self.lease_seconds,
+                retry_seconds=self.retry_seconds,
+                max_retry_seconds=self.max_retry_seconds,
+            )
+
+    async def run(self) -> None:
+        while True:
+            try:
+                claimed = await self.dispatch()
+            except Exception:
+                logger.exception('Outbox dispatch failed')
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def start(self) -> None:
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+        self.task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.task
+        self.task = None
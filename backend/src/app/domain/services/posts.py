@@ -1,28 +1,46 @@
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from starlette.datastructures import UploadFile
 
+from app.application.interfaces.images.processors import ImageProcessorInterface
 from app.domain.exceptions.base import NotFound, PermissionDenied
 from app.domain.exceptions.images import InvalidImageType
 from app.domain.interfaces.posts import PostServiceInterface
+from app.domain.utils.pagination import STREAM_BATCH_SIZE, decode_cursor, get_page
 from app.domain.utils.upload_image import upload_image
-from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.infrastructure.cache import namespaces
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.models.versions import EntityName
+from app.infrastructure.db.uow import UnitOfWork, UnitOfWorkInterface
 
 
 class PostService(PostServiceInterface):
     def __init__(
         self,
         uow: UnitOfWorkInterface,
+        response_cache: ResponseCacheInterface,
+        image_processor: ImageProcessorInterface,
+        stream_session_maker: async_sessionmaker,
     ):
         self.uow = uow
+        self.response_cache = response_cache
+        self.image_processor = image_processor
+        self.stream_session_maker = stream_session_maker
+
+    async def invalidate_cache(self, user_id: int, post_id: int | None = None) -> None:
+        affected = [namespaces.POSTS, namespaces.user_posts(user_id)]
+        if post_id is not None:
+            affected.append(namespaces.post(post_id))
+        await self.response_cache.invalidate(*affected)
 
-    @staticmethod
-    async def update_data_image_attr(data: dict) -> None:
+    async def update_data_image_attr(self, data: dict) -> None:
         image = data.get('image')
         if image:
             if isinstance(image, UploadFile):
-                uploaded_image_path = await upload_image(image)
-                data.update({'image': uploaded_image_path})
+                data.update(await upload_image(image, self.image_processor, self.uow.post_repo))
             elif isinstance(image, str) and image == ' ':
-                data.update({'image': None})
+                data.update({'image': None, 'image_variants': None, 'image_digest': None})
             else:
                 raise InvalidImageType
         else:
@@ -36,21 +54,42 @@ class PostService(PostServiceInterface):
         await self.update_data_image_attr(post)
         post.setdefault('user_id', user_info.get('user_id'))
         created_post = await self.uow.post_repo.create_post(post)
+        await self.uow.version_repo.bump(EntityName.POST)
         await self.uow.commit()
+        await self.invalidate_cache(created_post.user_id)
         return created_post
 
     async def get_user_posts(
         self,
         user_id: int,
-    ):
-        posts = await self.uow.post_repo.get_user_posts(user_id)
-        return posts
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict:
+        posts = await self.uow.post_repo.get_user_posts(
+            user_id,
+            limit + 1,
+            decode_cursor(cursor) if cursor else None,
+        )
+        return get_page(posts, limit)
 
     async def get_posts(
         self,
-    ):
-        posts = await self.uow.post_repo.get_posts()
-        return posts
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict:
+        posts = await self.uow.post_repo.get_posts(
+            limit + 1,
+            decode_cursor(cursor) if cursor else None,
+        )
+        return get_page(posts, limit)
+
+    async def stream_posts(
+        self,
+    ) -> AsyncIterator[Sequence]:
+        """RUNS AFTER THE ENDPOINT HAS RETURNED, SO IT READS IN A SESSION OF ITS OWN"""
+        async with self.stream_session_maker() as session:
+            async for posts in UnitOfWork(session).post_repo.stream_posts(STREAM_BATCH_SIZE):
+                yield posts
 
     async def get_post(
         self,
@@ -74,7 +113,9 @@ class PostService(PostServiceInterface):
             raise PermissionDenied
         await self.update_data_image_attr(update_data)
         post = await self.uow.post_repo.update_post(post_id, update_data)
+        await self.uow.version_repo.bump(EntityName.POST)
         await self.uow.commit()
+        await self.invalidate_cache(instance.user_id, post_id)
         return post
 
     async def delete_post(
@@ -88,4 +129,6 @@ class PostService(PostServiceInterface):
         if user_info.get('user_id') != instance.user_id:
             raise PermissionDenied
         await self.uow.post_repo.delete_post(post_id)
+        await self.uow.version_repo.bump(EntityName.POST)
         await self.uow.commit()
+        await self.invalidate_cache(instance.user_id, post_id)
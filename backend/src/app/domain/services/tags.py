@@ -1,5 +1,8 @@
 from app.domain.exceptions.base import NotFound, PermissionDenied
 from app.domain.interfaces.tags import TagServiceInterface
+from app.infrastructure.cache import namespaces
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.models.versions import EntityName
 from app.infrastructure.db.uow import UnitOfWorkInterface
 
 
@@ -7,8 +10,18 @@ class TagService(TagServiceInterface):
     def __init__(
         self,
         uow: UnitOfWorkInterface,
+        response_cache: ResponseCacheInterface,
     ):
         self.uow = uow
+        self.response_cache = response_cache
+
+    async def invalidate_post_cache(self, post_id: int) -> None:
+        post = await self.uow.post_repo.return_author_id(post_id)
+        await self.response_cache.invalidate(
+            namespaces.POSTS,
+            namespaces.post(post_id),
+            namespaces.user_posts(post.user_id),
+        )
 
     async def get_tags(
         self,
@@ -22,7 +35,9 @@ class TagService(TagServiceInterface):
         user_info: dict,
     ):
         tag.setdefault('user_id', user_info.get('user_id'))
+        await self.uow.version_repo.bump(EntityName.TAG)
         tag = await self.uow.tag_repo.create_tag(tag)
+        await self.response_cache.invalidate(namespaces.TAGS)
         return tag
 
     async def delete_tag(
@@ -35,8 +50,10 @@ class TagService(TagServiceInterface):
             raise NotFound
         if user_info.get('user_id') != tag.user_id:
             raise PermissionDenied
+        await self.uow.version_repo.bump(EntityName.TAG)
         await self.uow.tag_repo.delete_tag(tag_id)
         await self.uow.commit()
+        await self.response_cache.invalidate(namespaces.TAGS, namespaces.TAG_NAMES)
 
     async def edit_tag(
         self,
@@ -49,8 +66,10 @@ class TagService(TagServiceInterface):
             raise NotFound
         if user_info.get('user_id') != tag.user_id:
             raise PermissionDenied
+        await self.uow.version_repo.bump(EntityName.TAG)
         updated_tag = await self.uow.tag_repo.update_tag(tag_id, update_tag_data)
         await self.uow.commit()
+        await self.response_cache.invalidate(namespaces.TAGS, namespaces.TAG_NAMES)
         return updated_tag
 
     async def set_tag_on_post(
@@ -65,8 +84,10 @@ class TagService(TagServiceInterface):
         if user_info.get('user_id') != tag.user_id:
             raise PermissionDenied
         post_tag_data.setdefault('post_id', post_id)
+        await self.uow.version_repo.bump(EntityName.POST)
         post_tag = await self.uow.tag_repo.set_tag_on_post(post_tag_data)
         await self.uow.commit()
+        await self.invalidate_post_cache(post_id)
         return post_tag
 
     async def delete_tag_on_post(
@@ -81,4 +102,6 @@ class TagService(TagServiceInterface):
         if user_info.get('user_id') != post.user_id:
             raise PermissionDenied
         post_tag_id = await self.uow.tag_repo.get_post_tag_id(tag_id, post_id)
+        await self.uow.version_repo.bump(EntityName.POST)
         await self.uow.tag_repo.delete_tag_on_post(post_tag_id)
+        await self.invalidate_post_cache(post_id)
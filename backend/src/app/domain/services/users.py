@@ -1,4 +1,10 @@
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.application.exceptions.auth import TooManyPasswordHashes
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.hashers.passwords import PasswordHasherInterface
 from app.domain.exceptions.base import NotFound
 from app.domain.exceptions.users import (
     AccountAlreadyActivated,
@@ -13,16 +19,25 @@ from app.domain.interfaces.users import (
     UserVerifyServiceInterface,
 )
 from app.domain.managers.users import UserManager
-from app.domain.tasks.users import send_verify_email
-from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.domain.tasks.names import TaskName
+from app.domain.utils.mail import build_verify_email
+from app.domain.utils.pagination import STREAM_BATCH_SIZE
+from app.infrastructure.db.models.versions import EntityName
+from app.infrastructure.db.uow import UnitOfWork, UnitOfWorkInterface
 
 
 class UserService(UserServiceInterface):
     def __init__(
         self,
         uow: UnitOfWorkInterface,
+        password_hasher: PasswordHasherInterface,
+        send_verify_message_service: SendVerifyMessageServiceInterface,
+        stream_session_maker: async_sessionmaker,
     ):
         self.uow = uow
+        self.password_hasher = password_hasher
+        self.send_verify_message_service = send_verify_message_service
+        self.stream_session_maker = stream_session_maker
 
     async def authenticate(
         self,
@@ -30,15 +45,26 @@ class UserService(UserServiceInterface):
         input_password: str,
     ) -> int:
         user = await self.uow.user_repo.get_info_for_authenticate(email)
-        if not user or not UserManager.check_password(
+        if not user or not await self.password_hasher.check_password(
             input_password=input_password,
             password_from_db=user.password,
         ):
             raise InvalidCredentials
         if not user.is_active or not user.is_verified:
             raise AccountIsNotActive
+        if self.password_hasher.needs_rehash(user.password):
+            await self.rehash_password(user.id, input_password)
         return user.id
 
+    async def rehash_password(self, user_id: int, input_password: str) -> None:
+        """BEST EFFORT, THE LOGIN SUCCEEDS EVEN IF THE POOL IS BUSY, NEXT LOGIN RETRIES"""
+        try:
+            hashed_password = await self.password_hasher.make_password(input_password)
+        except TooManyPasswordHashes:
+            return
+        await self.uow.user_repo.update_password(user_id, hashed_password)
+        await self.uow.commit()
+
     async def get_users(
         self,
         user_info: dict,
@@ -48,6 +74,18 @@ class UserService(UserServiceInterface):
         )
         return data
 
+    async def stream_users(
+        self,
+        user_info: dict,
+    ) -> AsyncIterator[Sequence]:
+        """RUNS AFTER THE ENDPOINT HAS RETURNED, SO IT READS IN A SESSION OF ITS OWN"""
+        async with self.stream_session_maker() as session:
+            async for users in UnitOfWork(session).user_repo.stream_users(
+                STREAM_BATCH_SIZE,
+                is_superuser=bool(user_info.get('is_superuser')),
+            ):
+                yield users
+
     async def get_user(
         self,
         user_info: dict,
@@ -65,37 +103,48 @@ class UserService(UserServiceInterface):
         self,
         user_data: dict,
     ) -> dict:
+        """THE USER AND ITS VERIFY MESSAGE ARE ONE COMMIT, NEITHER IS SAVED WITHOUT THE OTHER"""
         user_data.pop('password1')
         user = await self.uow.user_repo.is_user_exists_by_email(user_data.get('email'))
         if user:
             raise UserAlreadyExists
-        hashed_password = UserManager.make_password(user_data.pop('password2'))
+        password = user_data.pop('password2')
+        UserManager.validate_password(password)
+        hashed_password = await self.password_hasher.make_password(password)
         user_id = await self.uow.user_repo.create_user(user_data, hashed_password)
-        await self.uow.commit()
+        await self.uow.version_repo.bump(EntityName.USER)
         user_data.update({'id': user_id})
+        await self.send_verify_message_service.send_verify_message(user_data)
+        await self.uow.commit()
         return user_data
 
 
 class SendVerifyMessageService(SendVerifyMessageServiceInterface):
     def __init__(
         self,
+        uow: UnitOfWorkInterface,
         jwt_encoder: JWTEncoderInterface,
         secret_token_for_email: str,
     ):
+        self.uow = uow
         self.jwt_encoder = jwt_encoder
         self.secret_token_for_email = secret_token_for_email
 
-    def send_verify_message(
+    async def send_verify_message(
         self,
         user_data: dict,
-    ):
+    ) -> None:
+        """THE MESSAGE GOES TO THE OUTBOX, THE BROKER IS NOT CALLED WHILE THE REQUEST WAITS"""
         verify_token = self.jwt_encoder.generate_jwt(
             data=user_data,
             lifetime_seconds=60 * 60 * 24 * 3,
             secret=self.secret_token_for_email,
         )
 
-        send_verify_email.delay(user_data.get('email'), verify_token)
+        await self.uow.outbox_repo.add(
+            TaskName.SEND_EMAILS.value,
+            build_verify_email(user_data.get('email'), verify_token),
+        )
 
 
 class UserVerifyService(UserVerifyServiceInterface):
@@ -124,4 +173,5 @@ class UserVerifyService(UserVerifyServiceInterface):
         if user.is_verified:
             raise AccountAlreadyActivated
         await self.uow.user_repo.update_user_verified_status(email)
+        await self.uow.version_repo.bump(EntityName.USER)
         await self.uow.commit()
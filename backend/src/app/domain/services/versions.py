@@ -0,0 +1,19 @@
+from typing import Sequence
+
+from app.domain.interfaces.versions import EntityVersionServiceInterface
+from app.infrastructure.db.models.versions import EntityName
+from app.infrastructure.db.uow import UnitOfWorkInterface
+
+
+class EntityVersionService(EntityVersionServiceInterface):
+    def __init__(
+        self,
+        uow: UnitOfWorkInterface,
+    ):
+        self.uow = uow
+
+    async def get_versions(
+        self,
+        names: Sequence[EntityName],
+    ):
+        return await self.uow.version_repo.get_versions(names)
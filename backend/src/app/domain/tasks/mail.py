@@ -0,0 +1,68 @@
+from email.message import EmailMessage
+from functools import lru_cache
+
+from celery import Task
+from celery.signals import worker_process_shutdown
+
+from app.domain.tasks.names import TaskName
+from app.infrastructure.mail.exceptions import MailDeliveryError
+from app.infrastructure.mail.interfaces.mailer import MailerInterface
+from app.infrastructure.mail.mailers.smtp import SMTPMailer
+from app.main.celery import celery_app
+from app.main.config import load_mail_config
+
+mail_config = load_mail_config()
+
+
+@lru_cache(maxsize=1)
+def get_mailer() -> MailerInterface:
+    """CREATED ON FIRST USE, SO EVERY PREFORK CHILD OPENS ITS OWN SMTP SESSION"""
+    return SMTPMailer(
+        mail_config.SMTP_HOST,
+        mail_config.SMTP_PORT,
+        username=mail_config.SMTP_USERNAME,
+        password=mail_config.SMTP_PASSWORD,
+        starttls=mail_config.SMTP_STARTTLS,
+        timeout=mail_config.SMTP_TIMEOUT_SECONDS,
+        max_messages_per_connection=mail_config.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        idle_seconds=mail_config.SMTP_IDLE_SECONDS,
+        rate_per_second=mail_config.MAIL_RATE_PER_SECOND,
+        retries=mail_config.MAIL_RETRIES,
+        backoff_seconds=mail_config.MAIL_BACKOFF_SECONDS,
+    )
+
+
+@worker_process_shutdown.connect
+def close_mailer(**kwargs) -> None:
+    if get_mailer.cache_info().currsize:
+        get_mailer().close()
+
+
+def build_message(to: str, subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message['Subject'] = subject
+    message['From'] = mail_config.MAIL_FROM
+    message['To'] = to
+    message.set_content(body)
+    return message
+
+
+@celery_app.task(
+    name=TaskName.SEND_EMAILS.value,
+    bind=True,
+    max_retries=mail_config.MAIL_TASK_RETRIES,
+)
+def send_emails(self: Task, messages: list[dict]) -> int:
+    """
+    MESSAGES ARE {'to', 'subject', 'body'} DICTS, A BATCH GOES OVER ONE SMTP SESSION.
+    ONLY THE UNSENT REST OF A BATCH IS RETRIED, WITH AN EXPONENTIAL BACKOFF
+    """
+    try:
+        return get_mailer().send_batch([build_message(**message) for message in messages])
+    except MailDeliveryError as ex:
+        sent = len(messages) - len(ex.unsent)
+        raise self.retry(
+            args=(messages[sent:],),
+            countdown=mail_config.MAIL_TASK_BACKOFF_SECONDS * 2**self.request.retries,
+            exc=ex,
+        )
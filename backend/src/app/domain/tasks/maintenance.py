@@ -0,0 +1,33 @@
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+
+from app.domain.services.maintenance import MaintenanceService
+from app.domain.tasks.names import TaskName
+from app.infrastructure.db.database import create_db_engine, create_session_maker
+from app.infrastructure.db.uow import UnitOfWork
+from app.main.celery import celery_app
+from app.main.config import load_database_config, load_maintenance_config
+
+
+async def reap() -> dict:
+    maintenance_config = load_maintenance_config()
+    engine = create_db_engine(
+        replace(load_database_config(), DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0),
+        pool_name='maintenance',
+    )
+    try:
+        async with create_session_maker(engine)() as session:
+            return await MaintenanceService(UnitOfWork(session)).reap(
+                unverified_max_age=timedelta(
+                    hours=maintenance_config.UNVERIFIED_ACCOUNT_MAX_AGE_HOURS,
+                ),
+                batch_size=maintenance_config.MAINTENANCE_BATCH_SIZE,
+            )
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name=TaskName.REAP_EXPIRED_ROWS.value)
+def reap_expired_rows() -> dict:
+    return asyncio.run(reap())
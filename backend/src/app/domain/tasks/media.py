@@ -0,0 +1,34 @@
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+
+from app.domain.services.media import MediaService
+from app.domain.tasks.names import TaskName
+from app.infrastructure.db.database import create_db_engine, create_session_maker
+from app.infrastructure.db.uow import UnitOfWork
+from app.main.celery import celery_app
+from app.main.config import Config, load_database_config, load_maintenance_config
+
+
+async def collect(dry_run: bool) -> dict:
+    maintenance_config = load_maintenance_config()
+    engine = create_db_engine(
+        replace(load_database_config(), DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0),
+        pool_name='maintenance',
+    )
+    try:
+        async with create_session_maker(engine)() as session:
+            return await MediaService(UnitOfWork(session)).collect_garbage(
+                Config.ROOT_DIR,
+                Config.MEDIA_DIR,
+                grace=timedelta(hours=maintenance_config.MEDIA_GC_GRACE_HOURS),
+                batch_size=maintenance_config.MAINTENANCE_BATCH_SIZE,
+                dry_run=dry_run,
+            )
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name=TaskName.COLLECT_MEDIA_GARBAGE.value)
+def collect_garbage(dry_run: bool = False) -> dict:
+    return asyncio.run(collect(dry_run))
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class TaskName(str, Enum):
+    """THE WEB PROCESS SENDS TASKS BY NAME, WITHOUT IMPORTING THE MODULES THAT DEFINE THEM"""
+
+    SEND_EMAILS = 'mail.send_batch'
+    REAP_EXPIRED_ROWS = 'maintenance.reap_expired_rows'
+    COLLECT_MEDIA_GARBAGE = 'media.collect_garbage'
@@ -0,0 +1,10 @@
+import os
+
+
+def build_verify_email(email: str, token: str) -> dict:
+    url = f'{os.getenv("domain")}/users/activate/{token}'
+    return {
+        'to': email,
+        'subject': 'VERIFY EMAIL',
+        'body': f'Link for verify your account:\n{url}',
+    }
@@ -0,0 +1,35 @@
+import base64
+from datetime import datetime
+
+from app.domain.exceptions.pagination import InvalidCursor
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+STREAM_BATCH_SIZE = 500
+
+
+def encode_cursor(created_at: datetime, instance_id: int) -> str:
+    raw = '%s,%s' % (created_at.isoformat(), instance_id)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Cursor is opaque for clients: urlsafe base64 of 'created_at,id' without padding"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        created_at, instance_id = raw.split(',')
+        return datetime.fromisoformat(created_at), int(instance_id)
+    except ValueError:
+        raise InvalidCursor
+
+
+def get_page(items: list, limit: int) -> dict:
+    """ITEMS MUST BE FETCHED WITH LIMIT + 1 TO KNOW IF NEXT PAGE EXISTS"""
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return {
+        'items': items,
+        'next_cursor': next_cursor,
+    }
@@ -1,25 +1,86 @@
-import uuid
-from io import BytesIO
+import hashlib
+import os
 
-from fastapi import HTTPException, UploadFile
-from PIL import Image
-from starlette import status
+from fastapi import UploadFile
 
+from app.application.images.processors import TooManyPixels
+from app.application.interfaces.images.processors import ImageProcessorInterface
+from app.domain.exceptions.images import ImageTooLarge, InvalidImageType
+from app.infrastructure.db.interfaces.repositories.posts import PostRepositoryInterface
 from app.main.config import Config
 
+CHUNK_SIZE = 64 * 1024
 
-def check_for_type(content_type: str) -> bool:
-    return content_type in ('image/jpeg', 'image/png')
 
+def sniff_image_type(head: bytes) -> str | None:
+    """THE CLIENT CONTENT TYPE IS NOT TRUSTED, THE FORMAT IS READ FROM THE MAGIC BYTES"""
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
 
-async def upload_image(image: UploadFile):
-    if not check_for_type(image.content_type):
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail='Invalid image type',
-        )
-    path = f'{Config.media_dir}{uuid.uuid4()}.jpg'
-    img = Image.open(BytesIO(await image.read()))
-    img.thumbnail((2000, 1000))
-    img.save(path)
-    return path
+
+async def read_image(image: UploadFile, max_bytes: int) -> bytes:
+    """
+    THE UPLOAD IS READ IN CHUNKS, A FOREIGN FORMAT IS REJECTED AFTER THE FIRST ONE
+    AND THE READING STOPS AS SOON AS THE SIZE PASSES MAX_BYTES
+    """
+    if image.size is not None and image.size > max_bytes:
+        raise ImageTooLarge
+    head = await image.read(CHUNK_SIZE)
+    if sniff_image_type(head) is None:
+        raise InvalidImageType
+    data = bytearray(head)
+    while len(data) <= max_bytes and (chunk := await image.read(CHUNK_SIZE)):
+        data += chunk
+    if len(data) > max_bytes:
+        raise ImageTooLarge
+    return bytes(data)
+
+
+def get_image_paths(image: str | None, image_variants: dict | None) -> list[str]:
+    """EVERY FILE A POST REFERENCES"""
+    paths = [image] if image else []
+    for variant in (image_variants or {}).values():
+        paths.extend(path for key, path in variant.items() if key not in ('width', 'height'))
+    return paths
+
+
+def claim_files(paths: list[str]) -> bool:
+    """
+    REFRESHES THE MTIME OF EVERY FILE, SO THE GARBAGE COLLECTOR GRACE PERIOD PROTECTS THEM
+    UNTIL THE NEW REFERENCE IS COMMITTED. FALSE IF ANY OF THEM IS ALREADY GONE
+    """
+    try:
+        for path in paths:
+            os.utime(f'{Config.ROOT_DIR}/{path}')
+    except FileNotFoundError:
+        return False
+    return True
+
+
+async def upload_image(
+    image: UploadFile,
+    image_processor: ImageProcessorInterface,
+    post_repo: PostRepositoryInterface,
+) -> dict:
+    """
+    AN UPLOAD WITH THE SAME BYTES AS AN EXISTING POST IMAGE REUSES ITS FILES WITHOUT DECODING.
+    THE LARGEST JPEG VARIANT STAYS IN image FOR CLIENTS THAT DO NOT READ image_variants
+    """
+    data = await read_image(image, image_processor.max_bytes)
+    digest = hashlib.sha256(data).hexdigest()
+    existing = await post_repo.get_image_by_digest(digest)
+    if existing and claim_files(get_image_paths(existing['image'], existing['image_variants'])):
+        return {**existing, 'image_digest': digest}
+    try:
+        image_variants = await image_processor.process(data, Config.ROOT_DIR, Config.MEDIA_DIR)
+    except TooManyPixels:
+        raise ImageTooLarge from None
+    except ValueError:
+        raise InvalidImageType from None
+    largest = max(image_variants.values(), key=lambda variant: variant['width'] * variant['height'])
+    return {'image': largest['jpeg'], 'image_variants': image_variants, 'image_digest': digest}
@@ -0,0 +1,43 @@
+import time
+from collections import OrderedDict
+from typing import Sequence
+
+from app.infrastructure.cache.interfaces.backend import CacheBackendInterface
+
+
+class MemoryCacheBackend(CacheBackendInterface):
+    """LRU WITH TTL, LIVES IN ONE PROCESS SO INVALIDATION DOES NOT REACH OTHER WORKERS"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self._get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        self._entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def set_default(self, key: str, value: bytes) -> bytes:
+        stored = self._get(key)
+        if stored is None:
+            await self.set(key, value)
+            return value
+        return stored
@@ -0,0 +1,39 @@
+from typing import Sequence
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.cache.interfaces.backend import CacheBackendInterface
+
+
+class RedisCacheBackend(CacheBackendInterface):
+    """SHARED BY ALL WORKERS, ERRORS ARE LOGGED AND TREATED AS CACHE MISSES"""
+
+    def __init__(self, client: Redis, prefix: str = 'cache:'):
+        self.client = client
+        self.prefix = prefix
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        try:
+            return await self.client.mget([self.prefix + key for key in keys])
+        except RedisError as exc:
+            logger.warning(f'Cache get failed: {exc!r}')
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        try:
+            await self.client.set(self.prefix + key, value, ex=ttl)
+        except RedisError as exc:
+            logger.warning(f'Cache set failed: {exc!r}')
+
+    async def set_default(self, key: str, value: bytes) -> bytes:
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.set(self.prefix + key, value, nx=True)
+                pipe.get(self.prefix + key)
+                _, stored = await pipe.execute()
+        except RedisError as exc:
+            logger.warning(f'Cache set failed: {exc!r}')
+            return value
+        return value if stored is None else stored
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class CacheBackendInterface(ABC):
+    @abstractmethod
+    async def get_many(
+        self,
+        keys: Sequence[str],
+    ) -> list[bytes | None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: int | None = None,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_default(
+        self,
+        key: str,
+        value: bytes,
+    ) -> bytes:
+        """SETS THE KEY ONLY IF IT IS MISSING AND RETURNS THE STORED VALUE"""
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Sequence
+
+
+class ResponseCacheInterface(ABC):
+    @abstractmethod
+    async def get_or_set(
+        self,
+        key: str,
+        namespaces: Sequence[str],
+        factory: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(
+        self,
+        *namespaces: str,
+    ) -> None:
+        raise NotImplementedError
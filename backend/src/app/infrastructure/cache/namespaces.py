@@ -0,0 +1,16 @@
+"""
+EVERY CACHED RESPONSE DEPENDS ON ONE OR MORE NAMESPACES,
+A WRITE INVALIDATES ONLY THE NAMESPACES IT TOUCHES
+"""
+
+POSTS = 'posts'
+TAGS = 'tags'
+TAG_NAMES = 'tag_names'
+
+
+def post(post_id: int) -> str:
+    return f'post:{post_id}'
+
+
+def user_posts(user_id: int) -> str:
+    return f'user_posts:{user_id}'
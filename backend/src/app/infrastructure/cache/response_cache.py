@@ -0,0 +1,163 @@
+import asyncio
+import secrets
+from typing import Awaitable, Callable, Sequence
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from app.infrastructure.cache.backends.memory import MemoryCacheBackend
+from app.infrastructure.cache.backends.redis import RedisCacheBackend
+from app.infrastructure.cache.interfaces.backend import CacheBackendInterface
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.main.config import CacheConfig
+
+
+async def get_response_cache_stub() -> None:
+    raise NotImplementedError
+
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    'response_cache_requests_total',
+    'Response cache lookups',
+    ['name', 'result'],
+)
+
+
+class ResponseCache(ResponseCacheInterface):
+    """
+    EACH NAMESPACE HAS A RANDOM VERSION TOKEN WHICH IS A PART OF THE ENTRY KEY,
+    INVALIDATION REPLACES THE TOKEN SO OLD ENTRIES ARE NEVER READ AGAIN AND EXPIRE BY TTL.
+    VERSIONS ARE READ BEFORE THE FACTORY RUNS, SO A RESPONSE BUILT FROM DATA
+    OLDER THAN A CONCURRENT INVALIDATION IS STORED UNDER THE OLD VERSION
+    """
+
+    def __init__(self, backend: CacheBackendInterface, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def version_key(namespace: str) -> str:
+        return f'version:{namespace}'
+
+    async def get_versions(self, namespaces: Sequence[str]) -> list[str]:
+        versions = await self.backend.get_many([self.version_key(ns) for ns in namespaces])
+        result = []
+        for namespace, version in zip(namespaces, versions):
+            if version is None:
+                version = await self.backend.set_default(
+                    self.version_key(namespace),
+                    secrets.token_hex(8).encode(),
+                )
+            result.append(version.decode())
+        return result
+
+    async def get_or_set(
+        self,
+        key: str,
+        namespaces: Sequence[str],
+        factory: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        name = key.partition(':')[0]
+        versions = await self.get_versions(namespaces)
+        entry_key = f'response:{key}:{":".join(versions)}'
+        [content] = await self.backend.get_many([entry_key])
+        if content is not None:
+            RESPONSE_CACHE_REQUESTS.labels(name, 'hit').inc()
+            return content
+        RESPONSE_CACHE_REQUESTS.labels(name, 'miss').inc()
+
+        return await self.coalesce(entry_key, factory)
+
+    async def coalesce(self, entry_key: str, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        CONCURRENT MISSES WAIT FOR ONE FACTORY CALL. A WAITER WHOSE LEADER WAS CANCELLED
+        (ITS CLIENT DISCONNECTED) TRIES AGAIN INSTEAD OF FAILING ITS OWN REQUEST
+        """
+        in_flight = self._in_flight.get(entry_key)
+        if in_flight is None:
+            return await self.fill(entry_key, factory)
+        try:
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                raise
+        return await self.coalesce(entry_key, factory)
+
+    async def fill(self, entry_key: str, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        """WAITERS GET THE CONTENT BEFORE IT IS STORED, A FAILED WRITE ONLY FAILS THE LEADER"""
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[entry_key] = future
+        try:
+            content = await factory()
+            future.set_result(content)
+            await self.backend.set(entry_key, content, self.ttl)
+            return content
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._in_flight[entry_key]
+
+    async def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            await self.backend.set(self.version_key(namespace), secrets.token_hex(8).encode())
+
+
+class NullResponseCache(ResponseCacheInterface):
+    async def get_or_set(
+        self,
+        key: str,
+        namespaces: Sequence[str],
+        factory: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        return await factory()
+
+    async def invalidate(self, *namespaces: str) -> None:
+        pass
+
+
+class RoutedResponseCache(ResponseCacheInterface):
+    """
+    CLIENTS KEPT ON THE PRIMARY BY PrimaryStickyMiddleware BYPASS THE CACHE TO READ OWN WRITES.
+    OTHER CLIENTS FILL MISSES FROM THE PRIMARY, A MISS RIGHT AFTER AN INVALIDATION WOULD
+    OTHERWISE STORE WHAT A LAGGING REPLICA RETURNS UNDER THE NEW NAMESPACE VERSION
+    """
+
+    def __init__(self, cache: ResponseCacheInterface, uow: UnitOfWorkInterface, bypass: bool):
+        self.cache = cache
+        self.uow = uow
+        self.bypass = bypass
+
+    async def get_or_set(
+        self,
+        key: str,
+        namespaces: Sequence[str],
+        factory: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        if self.bypass:
+            return await factory()
+
+        async def primary_factory() -> bytes:
+            with self.uow.read_from_primary():
+                return await factory()
+
+        return await self.cache.get_or_set(key, namespaces, primary_factory)
+
+    async def invalidate(self, *namespaces: str) -> None:
+        await self.cache.invalidate(*namespaces)
+
+
+def create_response_cache(cache_config: CacheConfig) -> ResponseCacheInterface:
+    if cache_config.CACHE_BACKEND == 'memory':
+        backend = MemoryCacheBackend(cache_config.CACHE_MAX_ENTRIES)
+    elif cache_config.CACHE_BACKEND == 'redis':
+        backend = RedisCacheBackend(Redis.from_url(cache_config.CACHE_REDIS_URL))
+    else:
+        return NullResponseCache()
+    return ResponseCache(backend, cache_config.CACHE_TTL_SECONDS)
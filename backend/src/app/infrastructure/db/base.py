@@ -1,5 +1,7 @@
 from app.infrastructure.db.database import Base
 from app.infrastructure.db.models.jwt import *
+from app.infrastructure.db.models.outbox import *
 from app.infrastructure.db.models.posts import *
 from app.infrastructure.db.models.tags import *
 from app.infrastructure.db.models.users import *
+from app.infrastructure.db.models.versions import *
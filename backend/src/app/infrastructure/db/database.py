@@ -1,8 +1,18 @@
+from dataclasses import replace
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from loguru import logger
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
+from app.infrastructure.db.metrics import InstrumentedAsyncAdaptedQueuePool
+from app.main.config import DatabaseConfig
+
 
 class Base(DeclarativeBase):
     pass
@@ -12,10 +22,42 @@ async def get_session_stub() -> None:
     raise NotImplementedError
 
 
-def create_async_session_maker(db_uri: str) -> async_sessionmaker:
+async def get_read_session_stub() -> None:
+    raise NotImplementedError
+
+
+async def get_stream_session_maker_stub() -> None:
+    raise NotImplementedError
+
+
+def create_db_engine(db_config: DatabaseConfig, pool_name: str = 'primary') -> AsyncEngine:
+    connect_args = {'prepared_statement_cache_size': db_config.DB_PREPARED_STATEMENT_CACHE_SIZE}
+    if db_config.DB_STATEMENT_TIMEOUT_MS:
+        connect_args['server_settings'] = {
+            'statement_timeout': str(db_config.DB_STATEMENT_TIMEOUT_MS),
+        }
     engine = create_async_engine(
-        db_uri,
+        db_config.DB_URI,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name=pool_name,
+        pool_size=db_config.DB_POOL_SIZE,
+        max_overflow=db_config.DB_MAX_OVERFLOW,
+        pool_timeout=db_config.DB_POOL_TIMEOUT,
+        pool_recycle=db_config.DB_POOL_RECYCLE,
+        pool_pre_ping=db_config.DB_POOL_PRE_PING,
+        connect_args=connect_args,
     )
+    logger.info(
+        f'Database pool "{pool_name}": pool_size={db_config.DB_POOL_SIZE}, '
+        f'max_overflow={db_config.DB_MAX_OVERFLOW}, pool_timeout={db_config.DB_POOL_TIMEOUT}, '
+        f'pool_recycle={db_config.DB_POOL_RECYCLE}, pool_pre_ping={db_config.DB_POOL_PRE_PING}, '
+        f'statement_timeout_ms={db_config.DB_STATEMENT_TIMEOUT_MS}, '
+        f'prepared_statement_cache_size={db_config.DB_PREPARED_STATEMENT_CACHE_SIZE}',
+    )
+    return engine
+
+
+def create_session_maker(engine: AsyncEngine) -> async_sessionmaker:
     return async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -23,6 +65,20 @@ def create_async_session_maker(db_uri: str) -> async_sessionmaker:
     )
 
 
+def create_async_session_maker(
+    db_config: DatabaseConfig,
+    pool_name: str = 'primary',
+) -> async_sessionmaker:
+    return create_session_maker(create_db_engine(db_config, pool_name))
+
+
+def create_replica_session_makers(db_config: DatabaseConfig) -> list[async_sessionmaker]:
+    return [
+        create_async_session_maker(replace(db_config, DB_URI=uri), pool_name=f'replica_{number}')
+        for number, uri in enumerate(db_config.DB_REPLICA_URIS)
+    ]
+
+
 async def get_async_session(async_session_maker: async_sessionmaker) -> AsyncGenerator:
     async with async_session_maker() as session:
         yield session
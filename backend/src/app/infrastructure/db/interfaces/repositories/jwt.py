@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
     SQLAlchemyBaseGateway,
@@ -11,13 +12,23 @@ class JWTRepositoryInterface(SQLAlchemyBaseGateway, ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def save_refresh_token(self, user_id: int, token: str) -> None:
+    async def save_refresh_token(
+        self,
+        user_id: int,
+        family_id: str,
+        token: str,
+        expires_at: datetime,
+    ) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_refresh_token(self, token: str) -> int | None:
+    async def delete_refresh_token(self, user_id: int, family_id: str, token: str) -> int | None:
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_all_user_refresh_tokens(self, user_id: int) -> None:
+    async def delete_refresh_token_family(self, user_id: int, family_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired_refresh_tokens(self, expired_before: datetime, batch_size: int) -> int:
         raise NotImplementedError
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+
+from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
+    SQLAlchemyBaseGateway,
+)
+from app.infrastructure.db.models.outbox import OutboxMessage
+
+
+class OutboxRepositoryInterface(SQLAlchemyBaseGateway, ABC):
+    @abstractmethod
+    async def add(self, topic: str, payload: dict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(
+        self,
+        now: datetime,
+        batch_size: int,
+        lease_until: datetime,
+    ) -> Sequence[OutboxMessage]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, ids: list[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def postpone(self, ids: list[int], available_at: datetime) -> None:
+        raise NotImplementedError
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy import Row
 
 from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
     SQLAlchemyBaseGateway,
@@ -7,21 +11,50 @@ from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
 from app.infrastructure.db.models.posts import Post
 
 
+class PostLoadStrategy(str, Enum):
+    """
+    JOINED - ONE QUERY, POST ROW IS REPEATED FOR EVERY TAG
+    SELECTIN - POSTS PAGE FIRST, THEN USERS AND TAGS BY BATCHED IN QUERIES
+    """
+
+    JOINED = 'joined'
+    SELECTIN = 'selectin'
+
+
 class PostRepositoryInterface(SQLAlchemyBaseGateway, ABC):
     @abstractmethod
     async def return_author_id(self, post_id: int):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_user_posts(self, user_id: int) -> List[Post]:
+    async def get_user_posts(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> List[Post]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_posts(
+        self,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> List[Post]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_posts(self) -> List[Post]:
+    def stream_posts(self, batch_size: int) -> AsyncIterator[Sequence[Post]]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_post(self, post_id: int) -> Post:
+    async def get_post(
+        self,
+        post_id: int,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> Post:
         raise NotImplementedError
 
     @abstractmethod
@@ -35,3 +68,11 @@ class PostRepositoryInterface(SQLAlchemyBaseGateway, ABC):
     @abstractmethod
     async def delete_post(self, post_id: int) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_image_by_digest(self, digest: str) -> dict | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_images(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        raise NotImplementedError
@@ -2,5 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class SQLAlchemyBaseGateway:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
+        """READ ONLY QUERIES MAY GO TO A REPLICA, EVERYTHING ELSE GOES TO THE PRIMARY SESSION"""
         self.session = session
+        self.read_session = read_session or session
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import ContextManager
 
 from app.infrastructure.db.repositories.jwt import JWTRepository
+from app.infrastructure.db.repositories.outbox import OutboxRepository
 from app.infrastructure.db.repositories.posts import PostRepository
 from app.infrastructure.db.repositories.tags import TagRepository
 from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.repositories.versions import EntityVersionRepository
 
 
 class UnitOfWorkInterface(ABC):
@@ -11,6 +14,8 @@ class UnitOfWorkInterface(ABC):
     post_repo: PostRepository
     tag_repo: TagRepository
     jwt_repo: JWTRepository
+    version_repo: EntityVersionRepository
+    outbox_repo: OutboxRepository
 
     @abstractmethod
     async def commit(self):
@@ -19,3 +24,7 @@ class UnitOfWorkInterface(ABC):
     @abstractmethod
     async def rollback(self):
         raise NotImplementedError
+
+    @abstractmethod
+    def read_from_primary(self) -> ContextManager[None]:
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
 
 from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
     SQLAlchemyBaseGateway,
@@ -16,6 +17,14 @@ class UserRepositoryInterface(SQLAlchemyBaseGateway, ABC):
     async def get_users(self, is_superuser: bool = False) -> List[User]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream_users(
+        self,
+        batch_size: int,
+        is_superuser: bool = False,
+    ) -> AsyncIterator[Sequence[User]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_user(
         self,
@@ -43,3 +52,11 @@ class UserRepositoryInterface(SQLAlchemyBaseGateway, ABC):
     @abstractmethod
     async def update_user_verified_status(self, email: str) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_unverified_users(self, registered_before: datetime, batch_size: int) -> int:
+        raise NotImplementedError
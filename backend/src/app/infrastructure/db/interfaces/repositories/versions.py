@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from app.infrastructure.db.interfaces.repositories.sqlalchemy_gateway import (
+    SQLAlchemyBaseGateway,
+)
+from app.infrastructure.db.models.versions import EntityName, EntityVersion
+
+
+class EntityVersionRepositoryInterface(SQLAlchemyBaseGateway, ABC):
+    @abstractmethod
+    async def get_versions(self, names: Sequence[EntityName]) -> List[EntityVersion]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bump(self, *names: EntityName) -> None:
+        raise NotImplementedError
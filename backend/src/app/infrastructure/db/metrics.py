@@ -0,0 +1,61 @@
+import time
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the pool',
+    ['pool'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Configured pool size plus max overflow',
+    ['pool'],
+    multiprocess_mode='livesum',
+)
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections',
+    'Connections currently checked out from the pool',
+    ['pool'],
+    multiprocess_mode='livesum',
+)
+POOL_SATURATION = Gauge(
+    'db_pool_saturation',
+    'Checked out connections divided by pool size plus max overflow',
+    ['pool'],
+    multiprocess_mode='livemax',
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Pass pool_logging_name to create_async_engine to label metrics of this pool"""
+
+    @property
+    def metrics_label(self) -> str:
+        return self.logging_name or 'default'
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT_SECONDS.labels(self.metrics_label).observe(
+                time.perf_counter() - started,
+            )
+            self.update_metrics()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self.update_metrics()
+
+    def update_metrics(self) -> None:
+        """POOL_SIZE=0 OR MAX_OVERFLOW=-1 MEANS NO LIMIT, SUCH POOLS REPORT NO SIZE OR SATURATION"""
+        checked_out = self.checkedout()
+        POOL_CHECKED_OUT.labels(self.metrics_label).set(checked_out)
+        if self.size() <= 0 or self._max_overflow < 0:
+            return
+        capacity = self.size() + self._max_overflow
+        POOL_SIZE.labels(self.metrics_label).set(capacity)
+        POOL_SATURATION.labels(self.metrics_label).set(checked_out / capacity)
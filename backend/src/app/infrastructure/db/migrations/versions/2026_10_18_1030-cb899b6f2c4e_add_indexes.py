@@ -0,0 +1,43 @@
+"""add indexes
+
+Revision ID: cb899b6f2c4e
+Revises: 671c1e631b97
+Create Date: 2026-10-18 10:30:12.418273
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'cb899b6f2c4e'
+down_revision = '671c1e631b97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_post_published_created_at_id',
+        'post',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('published IS true'),
+    )
+    op.create_index(
+        'ix_post_published_user_id_created_at_id',
+        'post',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('published IS true'),
+    )
+    op.create_unique_constraint('uq_post_tag_post_id_tag_id', 'post_tag', ['post_id', 'tag_id'])
+    op.create_index('ix_post_tag_tag_id', 'post_tag', ['tag_id'])
+    op.create_index('ix_refresh_token_token', 'refresh_token', ['token'])
+    op.create_index('ix_refresh_token_user_id', 'refresh_token', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_token_user_id', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_token', table_name='refresh_token')
+    op.drop_index('ix_post_tag_tag_id', table_name='post_tag')
+    op.drop_constraint('uq_post_tag_post_id_tag_id', 'post_tag', type_='unique')
+    op.drop_index('ix_post_published_user_id_created_at_id', table_name='post')
+    op.drop_index('ix_post_published_created_at_id', table_name='post')
@@ -0,0 +1,41 @@
+"""add entity version
+
+Revision ID: 5d0e7b3a91f4
+Revises: cb899b6f2c4e
+Create Date: 2026-10-18 12:00:41.902113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5d0e7b3a91f4'
+down_revision = 'cb899b6f2c4e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    entity_version = op.create_table(
+        'entity_version',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.bulk_insert(
+        entity_version,
+        [{'name': name, 'version': 1} for name in ('post', 'tag', 'user')],
+    )
+    op.execute("UPDATE entity_version SET updated_at = timezone('utc', now())")
+    op.alter_column(
+        'entity_version',
+        'updated_at',
+        existing_type=sa.TIMESTAMP(),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('entity_version')
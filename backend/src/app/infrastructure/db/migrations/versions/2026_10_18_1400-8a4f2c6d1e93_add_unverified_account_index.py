@@ -0,0 +1,28 @@
+"""add unverified account index
+
+Revision ID: 8a4f2c6d1e93
+Revises: 5d0e7b3a91f4
+Create Date: 2026-10-18 14:00:27.530194
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8a4f2c6d1e93'
+down_revision = '5d0e7b3a91f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_account_unverified_registered_at',
+        'account',
+        ['registered_at'],
+        postgresql_where=sa.text('is_verified IS false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_account_unverified_registered_at', table_name='account')
@@ -0,0 +1,111 @@
+"""hash refresh tokens
+
+Revision ID: e3b71d0c5a28
+Revises: 8a4f2c6d1e93
+Create Date: 2026-10-18 16:00:09.316842
+
+"""
+import hashlib
+from datetime import datetime
+
+import jwt
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e3b71d0c5a28'
+down_revision = '8a4f2c6d1e93'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+refresh_token = sa.table(
+    'refresh_token',
+    sa.column('id', sa.Integer),
+    sa.column('token', sa.String),
+    sa.column('token_hash', sa.LargeBinary),
+    sa.column('family_id', sa.String),
+    sa.column('expires_at', sa.TIMESTAMP),
+)
+
+
+def backfill_values(token: str) -> dict:
+    """TOKENS ISSUED BEFORE FAMILIES SHARE THE EMPTY FAMILY OF THEIR USER"""
+    try:
+        payload = jwt.decode(token, options={'verify_signature': False})
+    except jwt.InvalidTokenError:
+        payload = {}
+    return {
+        'token_hash': hashlib.sha256(token.encode('utf-8')).digest(),
+        'family_id': str(payload.get('fam', ''))[:32],
+        'expires_at': datetime.utcfromtimestamp(payload.get('exp', 0)),
+    }
+
+
+def upgrade() -> None:
+    op.add_column('refresh_token', sa.Column('token_hash', sa.LargeBinary(length=32)))
+    op.add_column('refresh_token', sa.Column('family_id', sa.String(length=32)))
+    op.add_column('refresh_token', sa.Column('expires_at', sa.TIMESTAMP()))
+
+    conn, last_id = op.get_bind(), 0
+    while True:
+        rows = conn.execute(
+            sa.select(refresh_token.c.id, refresh_token.c.token)
+            .where(refresh_token.c.id > last_id)
+            .order_by(refresh_token.c.id)
+            .limit(BATCH_SIZE),
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            refresh_token.update()
+            .where(refresh_token.c.id == sa.bindparam('row_id'))
+            .values(
+                token_hash=sa.bindparam('token_hash'),
+                family_id=sa.bindparam('family_id'),
+                expires_at=sa.bindparam('expires_at'),
+            ),
+            [{'row_id': row.id, **backfill_values(row.token)} for row in rows],
+        )
+        last_id = rows[-1].id
+    # THE SAME TOKEN SAVED TWICE WOULD BREAK THE UNIQUE INDEX, ONLY ONE COPY CAN BE ROTATED ANYWAY
+    op.execute(
+        'DELETE FROM refresh_token a USING refresh_token b '
+        'WHERE a.token_hash = b.token_hash AND a.id > b.id',
+    )
+
+    for column in ('token_hash', 'family_id', 'expires_at'):
+        op.alter_column('refresh_token', column, nullable=False)
+    op.drop_index('ix_refresh_token_token', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_user_id', table_name='refresh_token')
+    op.drop_column('refresh_token', 'token')
+    op.create_index(
+        'ix_refresh_token_token_hash',
+        'refresh_token',
+        ['token_hash'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_refresh_token_user_id_family_id',
+        'refresh_token',
+        ['user_id', 'family_id'],
+    )
+    op.create_index('ix_refresh_token_expires_at', 'refresh_token', ['expires_at'])
+
+
+def downgrade() -> None:
+    """ONLY HASHES ARE STORED, EXISTING SESSIONS CAN NOT BE RESTORED AND HAVE TO LOG IN AGAIN"""
+    op.execute('DELETE FROM refresh_token')
+    op.drop_index('ix_refresh_token_expires_at', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_user_id_family_id', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_token_hash', table_name='refresh_token')
+    op.drop_column('refresh_token', 'expires_at')
+    op.drop_column('refresh_token', 'family_id')
+    op.drop_column('refresh_token', 'token_hash')
+    op.add_column(
+        'refresh_token',
+        sa.Column('token', sa.String(length=200), nullable=False),
+    )
+    op.create_index('ix_refresh_token_user_id', 'refresh_token', ['user_id'])
+    op.create_index('ix_refresh_token_token', 'refresh_token', ['token'])
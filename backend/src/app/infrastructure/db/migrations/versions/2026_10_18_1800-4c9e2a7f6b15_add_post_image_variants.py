@@ -0,0 +1,27 @@
+"""add post image variants
+
+Revision ID: 4c9e2a7f6b15
+Revises: e3b71d0c5a28
+Create Date: 2026-10-18 18:00:52.104937
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '4c9e2a7f6b15'
+down_revision = 'e3b71d0c5a28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'post',
+        sa.Column('image_variants', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('post', 'image_variants')
@@ -0,0 +1,31 @@
+"""add post image digest
+
+Revision ID: 7b2d9e4f1a36
+Revises: 4c9e2a7f6b15
+Create Date: 2026-10-18 20:00:14.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '7b2d9e4f1a36'
+down_revision = '4c9e2a7f6b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # EXISTING IMAGES STAY WITHOUT A DIGEST, THEIR UPLOADED BYTES ARE NOT KEPT
+    op.add_column('post', sa.Column('image_digest', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_post_image_digest',
+        'post',
+        ['image_digest'],
+        postgresql_where=sa.text('image_digest IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_post_image_digest', table_name='post')
+    op.drop_column('post', 'image_digest')
@@ -0,0 +1,35 @@
+"""add outbox message
+
+Revision ID: 9d3f6a1c8e52
+Revises: 7b2d9e4f1a36
+Create Date: 2026-10-18 22:00:27.513940
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '9d3f6a1c8e52'
+down_revision = '7b2d9e4f1a36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_message',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('topic', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+        sa.Column('available_at', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_outbox_message_available_at', 'outbox_message', ['available_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_message_available_at', table_name='outbox_message')
+    op.drop_table('outbox_message')
@@ -1,12 +1,23 @@
-from sqlalchemy import ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Integer, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.database import Base
 
 
 class RefreshToken(Base):
+    """ONLY THE SHA256 DIGEST OF A TOKEN IS STORED, IT IS ENOUGH TO FIND AND ROTATE IT"""
+
     __tablename__ = 'refresh_token'
+    __table_args__ = (
+        Index('ix_refresh_token_token_hash', 'token_hash', unique=True),
+        Index('ix_refresh_token_user_id_family_id', 'user_id', 'family_id'),
+        Index('ix_refresh_token_expires_at', 'expires_at'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('account.id'), nullable=False)
-    token: Mapped[str] = mapped_column(String(200), nullable=False)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, BigInteger, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.database import Base
+
+
+class OutboxMessage(Base):
+    """
+    ONE ITEM OF A BATCH FOR THE CELERY TASK NAMED BY topic, WRITTEN IN THE SAME TRANSACTION
+    AS THE CHANGE THAT CAUSED IT. THE ROW IS DELETED ONCE THE BROKER HAS ACCEPTED THE TASK
+    """
+
+    __tablename__ = 'outbox_message'
+    __table_args__ = (Index('ix_outbox_message_available_at', 'available_at'),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    topic: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+    )
+
+    def __repr__(self):
+        return f'Object: [id: {self.id}, topic: {self.topic}, attempts: {self.attempts}]'
@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.database import Base
@@ -19,6 +20,8 @@ class Post(Base):
     title: Mapped[str] = mapped_column(String(50), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     image: Mapped[str] = mapped_column(String(150), nullable=True)
+    image_variants: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    image_digest: Mapped[str] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.utcnow)
     published: Mapped[bool] = mapped_column(Boolean, default=True)
     user: Mapped['User'] = relationship(back_populates='posts')
@@ -30,3 +33,23 @@ class Post(Base):
 
     def __repr__(self):
         return f'Object: [id: {self.id}, name:{self.title}]'
+
+
+Index(
+    'ix_post_published_created_at_id',
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=Post.published.is_(True),
+)
+Index(
+    'ix_post_published_user_id_created_at_id',
+    Post.user_id,
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=Post.published.is_(True),
+)
+Index(
+    'ix_post_image_digest',
+    Post.image_digest,
+    postgresql_where=Post.image_digest.is_not(None),
+)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import TIMESTAMP, ForeignKey, Integer, String
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.database import Base
@@ -31,6 +31,10 @@ class Tag(Base):
 
 class PostTag(Base):
     __tablename__ = 'post_tag'
+    __table_args__ = (
+        UniqueConstraint('post_id', 'tag_id', name='uq_post_tag_post_id_tag_id'),
+        Index('ix_post_tag_tag_id', 'tag_id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     post_id: Mapped[int] = mapped_column(Integer, ForeignKey('post.id'))
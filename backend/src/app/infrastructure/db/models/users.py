@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, Boolean, Integer, String
+from sqlalchemy import TIMESTAMP, Boolean, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.database import Base
@@ -8,6 +8,13 @@ from app.infrastructure.db.database import Base
 
 class User(Base):
     __tablename__ = 'account'
+    __table_args__ = (
+        Index(
+            'ix_account_unverified_registered_at',
+            'registered_at',
+            postgresql_where=text('is_verified IS false'),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     username: Mapped[str] = mapped_column(String(50), nullable=False)
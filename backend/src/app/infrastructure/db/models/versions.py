@@ -0,0 +1,37 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import TIMESTAMP, BigInteger, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.database import Base
+
+
+class EntityName(str, Enum):
+    POST = 'post'
+    TAG = 'tag'
+    USER = 'user'
+
+
+class EntityVersion(Base):
+    """
+    ONE ROW PER ENTITY TYPE, BUMPED IN THE SAME TRANSACTION AS EVERY WRITE OF THAT TYPE.
+    THE BUMP HOLDS THE ROW LOCK UNTIL COMMIT, SO CONCURRENT WRITES OF ONE TYPE SERIALIZE ON IT.
+    IT IS THE PRICE OF VALIDATING ANY LISTING BY A PRIMARY KEY LOOKUP, WHICH SUITS A BLOG
+    WHERE READS OUTNUMBER WRITES BY FAR. IF WRITE THROUGHPUT MATTERS, VERSION PER ENTITY
+    (E.G. post:<id>) AND KEEP THE TYPE ROW FOR LISTINGS ONLY
+    """
+
+    __tablename__ = 'entity_version'
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.now(),
+    )
+
+    def __repr__(self):
+        return f'Object: [name: {self.name}, version:{self.version}]'
@@ -1,4 +1,7 @@
-from sqlalchemy import delete, insert, select
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, literal_column, select
 from sqlalchemy.orm import load_only
 
 from app.infrastructure.db.interfaces.repositories.jwt import JWTRepositoryInterface
@@ -12,15 +15,55 @@ class JWTRepository(JWTRepositoryInterface):
         result = await self.session.execute(query)
         return result.scalar_one().is_superuser
 
-    async def save_refresh_token(self, user_id: int, token: str) -> None:
-        stmt = insert(RefreshToken).values(user_id=user_id, token=token)
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    async def save_refresh_token(
+        self,
+        user_id: int,
+        family_id: str,
+        token: str,
+        expires_at: datetime,
+    ) -> None:
+        stmt = insert(RefreshToken).values(
+            user_id=user_id,
+            family_id=family_id,
+            token_hash=self.hash_token(token),
+            expires_at=expires_at,
+        )
         await self.session.execute(stmt)
 
-    async def delete_refresh_token(self, token: str) -> int | None:
-        stmt = delete(RefreshToken).where(RefreshToken.token == token).returning(RefreshToken.id)
+    async def delete_refresh_token(self, user_id: int, family_id: str, token: str) -> int | None:
+        stmt = (
+            delete(RefreshToken)
+            .where(
+                RefreshToken.token_hash == self.hash_token(token),
+                RefreshToken.user_id == user_id,
+                RefreshToken.family_id == family_id,
+            )
+            .returning(RefreshToken.id)
+        )
         result = await self.session.execute(stmt)
-        return result.scalar_one()
+        return result.scalar_one_or_none()
 
-    async def delete_all_user_refresh_tokens(self, user_id: int) -> None:
-        stmt = delete(RefreshToken).where(RefreshToken.user_id == user_id)
+    async def delete_refresh_token_family(self, user_id: int, family_id: str) -> None:
+        stmt = delete(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.family_id == family_id,
+        )
         await self.session.execute(stmt)
+
+    async def delete_expired_refresh_tokens(self, expired_before: datetime, batch_size: int) -> int:
+        """ONE BATCH BY CTID, ROWS LOCKED BY OTHER TRANSACTIONS ARE SKIPPED"""
+        ctid = literal_column('ctid')
+        batch = (
+            select(ctid)
+            .select_from(RefreshToken)
+            .where(RefreshToken.expires_at < expired_before)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(RefreshToken).where(ctid == func.any(func.array(batch.scalar_subquery())))
+        result = await self.session.execute(stmt)
+        return result.rowcount
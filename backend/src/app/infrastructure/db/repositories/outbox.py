@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import delete, insert, select, update
+
+from app.infrastructure.db.interfaces.repositories.outbox import (
+    OutboxRepositoryInterface,
+)
+from app.infrastructure.db.models.outbox import OutboxMessage
+
+
+class OutboxRepository(OutboxRepositoryInterface):
+    async def add(self, topic: str, payload: dict) -> None:
+        await self.session.execute(insert(OutboxMessage).values(topic=topic, payload=payload))
+
+    async def claim(
+        self,
+        now: datetime,
+        batch_size: int,
+        lease_until: datetime,
+    ) -> Sequence[OutboxMessage]:
+        """
+        LEASES THE OLDEST DUE MESSAGES BY MOVING available_at TO lease_until. ROWS LOCKED BY
+        ANOTHER DISPATCHER ARE SKIPPED, AFTER THE COMMIT THE LEASE KEEPS THEM OUT OF OTHER BATCHES
+        """
+        due = (
+            select(OutboxMessage.id)
+            .where(OutboxMessage.available_at <= now)
+            .order_by(OutboxMessage.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due.scalar_subquery()))
+            .values(available_at=lease_until)
+            .returning(OutboxMessage)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda message: message.id)
+
+    async def delete(self, ids: list[int]) -> None:
+        await self.session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(ids)))
+
+    async def postpone(self, ids: list[int], available_at: datetime) -> None:
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(attempts=OutboxMessage.attempts + 1, available_at=available_at)
+        )
+        await self.session.execute(stmt)
@@ -1,9 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
 
-from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import joinedload, load_only
+from sqlalchemy import Result, Row, Select, delete, insert, or_, select, tuple_, update
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
-from app.infrastructure.db.interfaces.repositories.posts import PostRepositoryInterface
+from app.infrastructure.db.interfaces.repositories.posts import (
+    PostLoadStrategy,
+    PostRepositoryInterface,
+)
 from app.infrastructure.db.models.posts import Post
 from app.infrastructure.db.models.tags import Tag
 from app.infrastructure.db.models.users import User
@@ -15,25 +19,51 @@ class PostRepository(PostRepositoryInterface):
         instance = await self.session.execute(query)
         return instance.scalar_one()
 
-    async def get_user_posts(self, user_id: int) -> List[Post]:
-        query = await self.get_query_with_prefetched_user_and_tags()
-        query = query.where(Post.user_id == user_id)
-        result = await self.session.execute(query)
-        return result.unique().scalars().all()
+    async def get_user_posts(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> List[Post]:
+        query = await self.get_query_with_prefetched_user_and_tags(load_strategy)
+        query = self.paginate(query.where(Post.user_id == user_id), limit, cursor)
+        result = await self.read_session.execute(query)
+        return self.get_unique_result(result, load_strategy).scalars().all()
 
-    async def get_posts(self) -> List[Post]:
-        query = await self.get_query_with_prefetched_user_and_tags()
-        result = await self.session.execute(query)
-        return result.unique().scalars().all()
+    async def get_posts(
+        self,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> List[Post]:
+        query = await self.get_query_with_prefetched_user_and_tags(load_strategy)
+        query = self.paginate(query, limit, cursor)
+        result = await self.read_session.execute(query)
+        return self.get_unique_result(result, load_strategy).scalars().all()
 
-    async def get_post(self, post_id: int) -> Post:
-        query = await self.get_query_with_prefetched_user_and_tags()
+    async def stream_posts(self, batch_size: int) -> AsyncIterator[Sequence[Post]]:
+        """SERVER SIDE CURSOR, ONLY ONE BATCH OF POSTS IS IN MEMORY AT A TIME"""
+        query = await self.get_query_with_prefetched_user_and_tags(PostLoadStrategy.SELECTIN)
+        query = query.order_by(Post.created_at.desc(), Post.id.desc()).execution_options(
+            yield_per=batch_size,
+        )
+        result = await self.read_session.stream_scalars(query)
+        async for posts in result.partitions():
+            yield posts
+
+    async def get_post(
+        self,
+        post_id: int,
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ) -> Post:
+        query = await self.get_query_with_prefetched_user_and_tags(load_strategy)
         query = query.where(
             Post.id == post_id,
             Post.published.is_(True),
         )
-        result = await self.session.execute(query)
-        return result.unique().scalar()
+        result = await self.read_session.execute(query)
+        return self.get_unique_result(result, load_strategy).scalar()
 
     async def create_post(self, data: dict) -> Post:
         stmt = insert(Post).values(**data).returning(Post)
@@ -49,8 +79,53 @@ class PostRepository(PostRepositoryInterface):
         stmt = delete(Post).where(Post.id == post_id)
         await self.session.execute(stmt)
 
+    async def get_image_by_digest(self, digest: str) -> dict | None:
+        query = (
+            select(Post.image, Post.image_variants)
+            .where(Post.image_digest == digest, Post.image_variants.is_not(None))
+            .limit(1)
+        )
+        result = await self.read_session.execute(query)
+        row = result.first()
+        return dict(row._mapping) if row else None
+
+    async def stream_images(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        """
+        image AND image_variants OF EVERY POST WITH AN IMAGE, READ FROM THE PRIMARY: A REPLICA
+        BEHIND IT COULD MISS A FRESH REFERENCE AND LET THE GARBAGE COLLECTOR DELETE A LIVE FILE
+        """
+        query = (
+            select(Post.image, Post.image_variants)
+            .where(or_(Post.image.is_not(None), Post.image_variants.is_not(None)))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+    @staticmethod
+    def paginate(
+        query: Select,
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+    ) -> Select:
+        """KEYSET PAGINATION: NEWEST FIRST, ID BREAKS TIES BETWEEN EQUAL created_at"""
+        if cursor:
+            query = query.where(tuple_(Post.created_at, Post.id) < cursor)
+        return query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit)
+
+    @staticmethod
+    def get_unique_result(result: Result, load_strategy: PostLoadStrategy) -> Result:
+        """ONLY JOINED COLLECTIONS DUPLICATE POST ROWS"""
+        if load_strategy is PostLoadStrategy.JOINED:
+            return result.unique()
+        return result
+
     @staticmethod
-    async def get_query_with_prefetched_user_and_tags():
+    async def get_query_with_prefetched_user_and_tags(
+        load_strategy: PostLoadStrategy = PostLoadStrategy.SELECTIN,
+    ):
+        loader = joinedload if load_strategy is PostLoadStrategy.JOINED else selectinload
         return (
             select(Post)
             .where(Post.published.is_(True))
@@ -62,10 +137,11 @@ class PostRepository(PostRepositoryInterface):
                     Post.created_at,
                     Post.published,
                     Post.image,
+                    Post.image_variants,
                 ),
             )
             .options(
-                joinedload(Post.user).options(load_only(User.id, User.username)),
-                joinedload(Post.tags).options(load_only(Tag.id, Tag.name, Tag.created_at)),
+                loader(Post.user).options(load_only(User.id, User.username)),
+                loader(Post.tags).options(load_only(Tag.id, Tag.name, Tag.created_at)),
             )
         )
@@ -16,7 +16,7 @@ class TagRepository(TagRepositoryInterface):
 
     async def get_tags(self) -> List[Tag]:
         query = select(Tag)
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         return result.scalars().all()
 
     async def create_tag(self, data: dict) -> Tag:
@@ -44,7 +44,7 @@ class TagRepository(TagRepositoryInterface):
             .join(Post)
             .where(PostTag.post_id == post_id, Post.published.is_(True))
         )
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         return result.scalars().all()
 
     async def set_tag_on_post(self, post_tag_data: dict) -> PostTag:
@@ -1,9 +1,22 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import (
+    Select,
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
 from sqlalchemy.orm import load_only
 
 from app.infrastructure.db.interfaces.repositories.users import UserRepositoryInterface
+from app.infrastructure.db.models.jwt import RefreshToken
+from app.infrastructure.db.models.posts import Post
+from app.infrastructure.db.models.tags import Tag
 from app.infrastructure.db.models.users import User
 
 
@@ -25,14 +38,30 @@ class UserRepository(UserRepositoryInterface):
         result = await self.session.execute(query)
         return result.scalar()
 
-    async def get_users(self, is_superuser: bool = False) -> List[User]:
+    @staticmethod
+    def get_users_query(is_superuser: bool = False) -> Select:
         fields = [User.id, User.email, User.username]
         if is_superuser:
             fields += [User.registered_at, User.is_superuser, User.is_active, User.is_verified]
-        query = select(User).where(User.is_active.is_(True)).options(load_only(*fields))
-        result = await self.session.execute(query)
+        return select(User).where(User.is_active.is_(True)).options(load_only(*fields))
+
+    async def get_users(self, is_superuser: bool = False) -> List[User]:
+        result = await self.read_session.execute(self.get_users_query(is_superuser))
         return result.scalars().all()
 
+    async def stream_users(
+        self,
+        batch_size: int,
+        is_superuser: bool = False,
+    ) -> AsyncIterator[Sequence[User]]:
+        """SERVER SIDE CURSOR, ONLY ONE BATCH OF USERS IS IN MEMORY AT A TIME"""
+        query = self.get_users_query(is_superuser).order_by(User.id)
+        result = await self.read_session.stream_scalars(
+            query.execution_options(yield_per=batch_size),
+        )
+        async for users in result.partitions():
+            yield users
+
     async def get_user(
         self,
         user_id: int,
@@ -42,7 +71,7 @@ class UserRepository(UserRepositoryInterface):
         if is_superuser:
             fields += [User.registered_at, User.is_superuser, User.is_active, User.is_verified]
         query = select(User).where(User.id == user_id).options(load_only(*fields))
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         return result.scalar()
 
     async def create_user(
@@ -72,3 +101,30 @@ class UserRepository(UserRepositoryInterface):
     async def update_user_verified_status(self, email: str) -> None:
         stmt = update(User).values(is_verified=True).where(User.email == email)
         await self.session.execute(stmt)
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        stmt = update(User).values(password=hashed_password).where(User.id == user_id)
+        await self.session.execute(stmt)
+
+    async def delete_unverified_users(self, registered_before: datetime, batch_size: int) -> int:
+        """
+        ONE BATCH BY CTID, ROWS LOCKED BY OTHER TRANSACTIONS ARE SKIPPED.
+        ACCOUNTS WITH POSTS, TAGS OR TOKENS ARE KEPT
+        """
+        ctid = literal_column('ctid')
+        batch = (
+            select(ctid)
+            .select_from(User)
+            .where(
+                User.is_verified.is_(False),
+                User.registered_at < registered_before,
+                ~exists().where(Post.user_id == User.id),
+                ~exists().where(Tag.user_id == User.id),
+                ~exists().where(RefreshToken.user_id == User.id),
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(User).where(ctid == func.any(func.array(batch.scalar_subquery())))
+        result = await self.session.execute(stmt)
+        return result.rowcount
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.infrastructure.db.interfaces.repositories.versions import (
+    EntityVersionRepositoryInterface,
+)
+from app.infrastructure.db.models.versions import EntityName, EntityVersion
+
+
+class EntityVersionRepository(EntityVersionRepositoryInterface):
+    async def get_versions(self, names: Sequence[EntityName]) -> List[EntityVersion]:
+        query = select(EntityVersion).where(EntityVersion.name.in_(names))
+        result = await self.read_session.execute(query)
+        return result.scalars().all()
+
+    async def bump(self, *names: EntityName) -> None:
+        """
+        THE ROW LOCK IS HELD UNTIL COMMIT, SO CALL IT RIGHT BEFORE THE COMMIT,
+        NAMES ARE SORTED TO TAKE THE LOCKS IN THE SAME ORDER
+        """
+        now = datetime.utcnow()
+        stmt = insert(EntityVersion).values(
+            [{'name': name, 'version': 1, 'updated_at': now} for name in sorted(set(names))],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EntityVersion.name],
+            set_={
+                'version': EntityVersion.version + 1,
+                'updated_at': stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
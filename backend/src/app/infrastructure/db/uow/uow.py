@@ -1,22 +1,48 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.db.interfaces.repositories.uow import UnitOfWorkInterface
 from app.infrastructure.db.repositories.jwt import JWTRepository
+from app.infrastructure.db.repositories.outbox import OutboxRepository
 from app.infrastructure.db.repositories.posts import PostRepository
 from app.infrastructure.db.repositories.tags import TagRepository
 from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.repositories.versions import EntityVersionRepository
 
 
 class UnitOfWork(UnitOfWorkInterface):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
-        self.user_repo = UserRepository(self.session)
-        self.post_repo = PostRepository(self.session)
-        self.tag_repo = TagRepository(self.session)
-        self.jwt_repo = JWTRepository(self.session)
+        self.read_session = read_session or session
+        self.user_repo = UserRepository(self.session, self.read_session)
+        self.post_repo = PostRepository(self.session, self.read_session)
+        self.tag_repo = TagRepository(self.session, self.read_session)
+        self.jwt_repo = JWTRepository(self.session, self.read_session)
+        self.version_repo = EntityVersionRepository(self.session, self.read_session)
+        self.outbox_repo = OutboxRepository(self.session, self.read_session)
+        self.repos = (
+            self.user_repo,
+            self.post_repo,
+            self.tag_repo,
+            self.jwt_repo,
+            self.version_repo,
+            self.outbox_repo,
+        )
 
     async def commit(self):
         await self.session.commit()
 
     async def rollback(self):
         await self.session.rollback()
+
+    @contextmanager
+    def read_from_primary(self) -> Iterator[None]:
+        for repo in self.repos:
+            repo.read_session = self.session
+        try:
+            yield
+        finally:
+            for repo in self.repos:
+                repo.read_session = self.read_session
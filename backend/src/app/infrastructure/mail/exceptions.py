@@ -0,0 +1,9 @@
+from email.message import EmailMessage
+
+
+class MailDeliveryError(Exception):
+    """THE SMTP SERVER STAYED UNAVAILABLE, unsent ARE THE MESSAGES OF THE BATCH NOT DELIVERED"""
+
+    def __init__(self, unsent: list[EmailMessage]):
+        super().__init__(f'{len(unsent)} messages were not sent')
+        self.unsent = unsent
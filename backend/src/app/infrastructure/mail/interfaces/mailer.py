@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+
+
+class MailerInterface(ABC):
+    @abstractmethod
+    def send_batch(self, messages: list[EmailMessage]) -> int:
+        """
+        RETURNS THE NUMBER OF DELIVERED MESSAGES, PERMANENTLY REJECTED ONES ARE DROPPED.
+        RAISES MailDeliveryError WITH THE REST OF THE BATCH IF THE SERVER STAYS UNAVAILABLE
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
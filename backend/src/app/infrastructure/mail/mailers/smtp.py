@@ -0,0 +1,157 @@
+import smtplib
+import time
+from email.message import EmailMessage
+
+from loguru import logger
+
+from app.infrastructure.mail.exceptions import MailDeliveryError
+from app.infrastructure.mail.interfaces.mailer import MailerInterface
+
+
+def is_transient(ex: OSError) -> bool:
+    """4XX REPLIES AND LOST CONNECTIONS ARE WORTH A RETRY ON A NEW SESSION"""
+    if isinstance(ex, smtplib.SMTPRecipientsRefused):
+        return all(code < 500 for code, _ in ex.recipients.values())
+    if isinstance(ex, smtplib.SMTPResponseException):
+        return ex.smtp_code < 500
+    return isinstance(ex, smtplib.SMTPServerDisconnected) or not isinstance(
+        ex,
+        smtplib.SMTPException,
+    )
+
+
+def is_rejected(ex: Exception) -> bool:
+    """THE SERVER REFUSED THIS MESSAGE FOR GOOD, NOT THE SESSION OR THE SENDER"""
+    if isinstance(ex, smtplib.SMTPRecipientsRefused):
+        return not is_transient(ex)
+    return isinstance(ex, smtplib.SMTPDataError) and ex.smtp_code >= 500
+
+
+class RateLimiter:
+    """TOKEN BUCKET, RATE = 0 DISABLES IT"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> None:
+        if not self.rate:
+            return
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.updated = time.monotonic()
+            self.tokens = 1
+        self.tokens -= 1
+
+
+class SMTPMailer(MailerInterface):
+    """
+    ONE LONG LIVED SMTP SESSION PER PROCESS: STARTTLS AND LOGIN HAPPEN ONCE, NOT PER MESSAGE.
+    THE SESSION IS RECYCLED AFTER max_messages_per_connection MESSAGES, AN IDLE ONE IS
+    CHECKED WITH NOOP BEFORE USE. NOT THREAD SAFE, CELERY PREFORK RUNS ONE TASK PER PROCESS
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = '',
+        password: str = '',
+        starttls: bool = True,
+        timeout: float = 30,
+        max_messages_per_connection: int = 100,
+        idle_seconds: float = 60,
+        rate_per_second: float = 0,
+        retries: int = 3,
+        backoff_seconds: float = 1,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_seconds = idle_seconds
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.connection: smtplib.SMTP | None = None
+        self.connection_messages = 0
+        self.last_used = 0.0
+        self.connections_opened = 0
+
+    def connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password)
+        except BaseException:
+            connection.close()
+            raise
+        self.connections_opened += 1
+        self.connection_messages = 0
+        return connection
+
+    def is_alive(self) -> bool:
+        try:
+            return self.connection.noop()[0] == 250
+        except OSError:
+            return False
+
+    def get_connection(self) -> smtplib.SMTP:
+        if self.connection is not None:
+            recycle = self.connection_messages >= self.max_messages_per_connection
+            idle = time.monotonic() - self.last_used > self.idle_seconds
+            if recycle or (idle and not self.is_alive()):
+                self.close()
+        if self.connection is None:
+            self.connection = self.connect()
+        return self.connection
+
+    def deliver(self, message: EmailMessage) -> None:
+        self.get_connection().send_message(message)
+        self.connection_messages += 1
+        self.last_used = time.monotonic()
+
+    def send(self, message: EmailMessage) -> None:
+        """A TRANSIENT FAILURE DROPS THE SESSION AND RETRIES ON A NEW ONE AFTER A BACKOFF"""
+        for attempt in range(self.retries + 1):
+            try:
+                return self.deliver(message)
+            except OSError as ex:
+                if not is_transient(ex) or attempt == self.retries:
+                    raise
+            self.close()
+            time.sleep(self.backoff_seconds * 2**attempt)
+
+    def send_batch(self, messages: list[EmailMessage]) -> int:
+        sent = 0
+        for number, message in enumerate(messages):
+            self.rate_limiter.acquire()
+            try:
+                self.send(message)
+            except OSError as ex:
+                if is_rejected(ex):
+                    logger.error(f'Message to {message["To"]} was rejected: {ex}')
+                    continue
+                logger.error(f'Mail was not sent: {ex}')
+                raise MailDeliveryError(messages[number:]) from ex
+            sent += 1
+        return sent
+
+    def close(self) -> None:
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        try:
+            connection.quit()
+        except OSError:
+            connection.close()
@@ -0,0 +1,27 @@
+import threading
+
+from app.infrastructure.tasks.interfaces.dispatcher import TaskDispatcherInterface
+
+
+class CeleryTaskDispatcher(TaskDispatcherInterface):
+    """
+    A PRODUCER ONLY CELERY APP WITHOUT THE TASK REGISTRY, BUILT ON THE FIRST SEND:
+    A PROCESS THAT NEVER QUEUES A TASK NEVER IMPORTS CELERY OR CONNECTS TO THE BROKER
+    """
+
+    def __init__(self, broker_url: str):
+        self.broker_url = broker_url
+        self.app = None
+        self.lock = threading.Lock()
+
+    def get_app(self):
+        with self.lock:
+            if self.app is None:
+                from celery import Celery
+
+                self.app = Celery('blog', broker=self.broker_url, set_as_current=False)
+            return self.app
+
+    def send(self, name: str, *args) -> None:
+        """WITHOUT CELERY'S OWN RETRIES A BROKER ERROR IS RAISED AT ONCE, THE CALLER RETRIES"""
+        self.get_app().send_task(name, args=args, retry=False)
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class TaskDispatcherInterface(ABC):
+    @abstractmethod
+    def send(self, name: str, *args) -> None:
+        """QUEUES THE TASK REGISTERED UNDER name, RAISES IF THE BROKER DOES NOT ACCEPT IT"""
+        raise NotImplementedError
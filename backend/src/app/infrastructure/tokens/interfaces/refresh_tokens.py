@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+
+class RefreshTokenRepositoryInterface(ABC):
+    """
+    A FAMILY IS THE CHAIN OF REFRESH TOKENS STARTED BY ONE LOGIN,
+    ONLY THE LAST TOKEN OF A FAMILY CAN BE ROTATED
+    """
+
+    @abstractmethod
+    async def save(
+        self,
+        user_id: int,
+        family_id: str,
+        token: str,
+        ttl: int,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rotate(
+        self,
+        user_id: int,
+        family_id: str,
+        old_token: str,
+        new_token: str,
+        ttl: int,
+    ) -> bool:
+        """FALSE IF THE OLD TOKEN WAS ALREADY USED, THE FAMILY IS REVOKED THEN"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke(
+        self,
+        user_id: int,
+        family_id: str,
+        token: str,
+    ) -> None:
+        raise NotImplementedError
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from app.infrastructure.db.interfaces.repositories.jwt import JWTRepositoryInterface
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+
+
+class PostgresRefreshTokenRepository(RefreshTokenRepositoryInterface):
+    """
+    ROWS IN THE UNIT OF WORK TRANSACTION, THE CALLER COMMITS.
+    THE OLD TOKEN IS DELETED BY ITS UNIQUE HASH BEFORE THE NEW ONE IS SAVED,
+    SO OF TWO CONCURRENT ROTATIONS ONLY ONE DELETES THE ROW
+    """
+
+    def __init__(self, jwt_repo: JWTRepositoryInterface):
+        self.jwt_repo = jwt_repo
+
+    async def save(self, user_id: int, family_id: str, token: str, ttl: int) -> None:
+        await self.jwt_repo.save_refresh_token(
+            user_id,
+            family_id,
+            token,
+            datetime.utcnow() + timedelta(seconds=ttl),
+        )
+
+    async def rotate(
+        self,
+        user_id: int,
+        family_id: str,
+        old_token: str,
+        new_token: str,
+        ttl: int,
+    ) -> bool:
+        if not await self.jwt_repo.delete_refresh_token(user_id, family_id, old_token):
+            await self.jwt_repo.delete_refresh_token_family(user_id, family_id)
+            return False
+        await self.save(user_id, family_id, new_token, ttl)
+        return True
+
+    async def revoke(self, user_id: int, family_id: str, token: str) -> None:
+        await self.jwt_repo.delete_refresh_token_family(user_id, family_id)
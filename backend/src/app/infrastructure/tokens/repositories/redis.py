@@ -0,0 +1,90 @@
+import hashlib
+
+from redis.asyncio import Redis
+
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+
+SAVE_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+redis.call('SADD', KEYS[2], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+"""
+
+REVOKE_FAMILY = """
+local function revoke_family(family_key, token_prefix)
+    for _, token_hash in ipairs(redis.call('SMEMBERS', family_key)) do
+        redis.call('DEL', token_prefix .. token_hash)
+    end
+    redis.call('DEL', family_key)
+end
+"""
+
+ROTATE_SCRIPT = REVOKE_FAMILY + """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    revoke_family(KEYS[3], ARGV[5])
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('SREM', KEYS[3], ARGV[2])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[4])
+redis.call('SADD', KEYS[3], ARGV[3])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+return 1
+"""
+
+REVOKE_SCRIPT = REVOKE_FAMILY + """
+revoke_family(KEYS[1], ARGV[1])
+"""
+
+
+class RedisRefreshTokenRepository(RefreshTokenRepositoryInterface):
+    """
+    <PREFIX>token:<SHA256> -> FAMILY ID AND <PREFIX>family:<ID> -> SET OF TOKEN HASHES,
+    BOTH EXPIRE WITH THE TOKEN. ROTATION AND REUSE DETECTION ARE ONE LUA SCRIPT, SO TWO
+    CONCURRENT REFRESHES WITH THE SAME TOKEN CAN NOT BOTH SUCCEED.
+    THE SCRIPTS TOUCH TOKEN KEYS THEY READ FROM THE FAMILY SET, SO NO REDIS CLUSTER
+    """
+
+    def __init__(self, client: Redis, prefix: str = 'refresh:'):
+        self.client = client
+        self.prefix = prefix
+        self.save_script = client.register_script(SAVE_SCRIPT)
+        self.rotate_script = client.register_script(ROTATE_SCRIPT)
+        self.revoke_script = client.register_script(REVOKE_SCRIPT)
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def token_key(self, token_hash: str) -> str:
+        return f'{self.prefix}token:{token_hash}'
+
+    def family_key(self, family_id: str) -> str:
+        return f'{self.prefix}family:{family_id}'
+
+    async def save(self, user_id: int, family_id: str, token: str, ttl: int) -> None:
+        token_hash = self.hash_token(token)
+        await self.save_script(
+            keys=[self.token_key(token_hash), self.family_key(family_id)],
+            args=[family_id, token_hash, ttl],
+        )
+
+    async def rotate(
+        self,
+        user_id: int,
+        family_id: str,
+        old_token: str,
+        new_token: str,
+        ttl: int,
+    ) -> bool:
+        old_hash, new_hash = self.hash_token(old_token), self.hash_token(new_token)
+        rotated = await self.rotate_script(
+            keys=[self.token_key(old_hash), self.token_key(new_hash), self.family_key(family_id)],
+            args=[family_id, old_hash, new_hash, ttl, self.token_key('')],
+        )
+        return bool(rotated)
+
+    async def revoke(self, user_id: int, family_id: str, token: str) -> None:
+        await self.revoke_script(keys=[self.family_key(family_id)], args=[self.token_key('')])
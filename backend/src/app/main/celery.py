@@ -0,0 +1,34 @@
+"""
+THE CELERY APP OF THE WORKER AND BEAT PROCESSES:
+    celery -A app.main.celery worker -l info
+THE WEB PROCESS NEVER IMPORTS THIS MODULE, IT PUBLISHES THROUGH A TaskDispatcherInterface
+"""
+
+import os
+
+from celery import Celery
+
+from app.domain.tasks.names import TaskName
+from app.main.config import Config, load_celery_config, load_maintenance_config
+
+celery_app = Celery(
+    'blog',
+    broker=load_celery_config().CELERY_BROKER_URL,
+    # IMPORTED WHEN THE WORKER STARTS, NOT WHEN THIS MODULE IS
+    include=[
+        f'app.domain.tasks.{name.removesuffix(".py")}'
+        for name in sorted(os.listdir(f'{Config.ROOT_DIR}/domain/tasks'))
+        if name.endswith('.py') and name != '__init__.py'
+    ],
+)
+maintenance_config = load_maintenance_config()
+celery_app.conf.beat_schedule = {
+    'reap-expired-rows': {
+        'task': TaskName.REAP_EXPIRED_ROWS.value,
+        'schedule': maintenance_config.MAINTENANCE_INTERVAL_SECONDS,
+    },
+    'collect-media-garbage': {
+        'task': TaskName.COLLECT_MEDIA_GARBAGE.value,
+        'schedule': maintenance_config.MEDIA_GC_INTERVAL_SECONDS,
+    },
+}
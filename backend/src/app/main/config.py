@@ -1,10 +1,8 @@
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from celery import Celery
-
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +20,12 @@ class Config:
 
     REDIS_HOST: str = 'localhost'
 
+    JWT_ACCESS_KEYS_DIR: str = ''
+    JWT_ACCESS_KEY_ID: str = ''
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    MEDIA_URL_SIGNING_KEY: str = ''
+    MEDIA_URL_TTL_SECONDS: int = 60 * 60
+
     ROOT_DIR = '%s' % Path(__file__).parent.parent
     MEDIA_DIR = 'media/images/'
 
@@ -29,15 +33,131 @@ class Config:
     def media_dir(self) -> str:
         return '%s/%s' % (self.ROOT_DIR, self.MEDIA_DIR)
 
+    @property
+    def symmetric_algorithm(self) -> str:
+        """REFRESH AND EMAIL TOKENS ARE VERIFIED ONLY BY US, SO THEY STAY ON HMAC"""
+        return self.ALGORITHM if self.ALGORITHM.startswith('HS') else 'HS256'
+
+
+@dataclass
+class DatabaseConfig:
+    DB_URI: str
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    DB_REPLICA_URIS: list[str] = field(default_factory=list)
+    DB_REPLICA_STICKY_SECONDS: int = 5
+
+
+@dataclass
+class CacheConfig:
+    """THE MEMORY BACKEND IS PER PROCESS, USE REDIS WITH SEVERAL WORKERS"""
+
+    CACHE_BACKEND: str = 'memory'
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_REDIS_URL: str = f'redis://{Config.REDIS_HOST}:6379/1'
+
+
+@dataclass
+class PasswordHasherConfig:
+    """ONE HASH PER THREAD AT A TIME, PENDING HASHES OVER THE LIMIT ARE ANSWERED WITH 503"""
+
+    PASSWORD_HASHER_THREADS: int = min(os.cpu_count() or 1, 4)
+    PASSWORD_HASHER_MAX_PENDING: int = 64
+
+    PASSWORD_HASH_ALGORITHM: str = 'pbkdf2_sha256'
+    PASSWORD_PBKDF2_ITERATIONS: int = 100000
+    PASSWORD_SCRYPT_N: int = 2**14
+    PASSWORD_SCRYPT_R: int = 8
+    PASSWORD_SCRYPT_P: int = 1
+
+
+@dataclass
+class ImageProcessorConfig:
+    """ONE IMAGE PER WORKER PROCESS AT A TIME, PENDING IMAGES OVER THE LIMIT GET 503"""
+
+    IMAGE_PROCESSOR_WORKERS: int = min(os.cpu_count() or 1, 2)
+    IMAGE_PROCESSOR_MAX_PENDING: int = 8
+    IMAGE_PROCESSING_TIMEOUT_SECONDS: int = 10
+    MAX_IMAGE_BYTES: int = 10 * 2**20
+    MAX_IMAGE_PIXELS: int = 40_000_000
 
-celery_app = Celery(
-    'blog',
-    broker=f'redis://{Config.REDIS_HOST}:6379/0',
-)
-celery_app.autodiscover_tasks(
-    [f'app.domain.tasks.{module}' for module in os.listdir(f'{Config.ROOT_DIR}/domain/tasks')],
-    force=True,
-)
+    IMAGE_VARIANTS: dict[str, tuple[int, int]] = field(
+        default_factory=lambda: {
+            'thumbnail': (400, 400),
+            'medium': (1000, 1000),
+            'full': (2000, 1000),
+        },
+    )
+    IMAGE_FORMATS: list[str] = field(default_factory=lambda: ['webp', 'jpeg'])
+    IMAGE_QUALITY: int = 80
+
+
+@dataclass
+class RefreshTokenConfig:
+    """REDIS KEEPS TOKEN FAMILIES WITH NATIVE EXPIRY, POSTGRES ROWS ARE THE FALLBACK"""
+
+    REFRESH_TOKEN_BACKEND: str = 'postgres'
+    REFRESH_TOKEN_REDIS_URL: str = f'redis://{Config.REDIS_HOST}:6379/2'
+
+
+@dataclass
+class MaintenanceConfig:
+    """UNVERIFIED ACCOUNTS OUTLIVE THEIR 3 DAY VERIFY TOKEN BY DEFAULT"""
+
+    MAINTENANCE_INTERVAL_SECONDS: int = 60 * 60
+    MAINTENANCE_BATCH_SIZE: int = 1000
+    UNVERIFIED_ACCOUNT_MAX_AGE_HOURS: int = 24 * 7
+    MEDIA_GC_INTERVAL_SECONDS: int = 24 * 60 * 60
+    MEDIA_GC_GRACE_HOURS: int = 24
+
+
+@dataclass
+class MailConfig:
+    """ONE SMTP SESSION PER CELERY WORKER PROCESS, KEPT FOR SMTP_MAX_MESSAGES_PER_CONNECTION"""
+
+    SMTP_HOST: str = 'smtp.gmail.com'
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: str = ''
+    SMTP_PASSWORD: str = ''
+    SMTP_STARTTLS: bool = True
+    SMTP_TIMEOUT_SECONDS: int = 30
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_IDLE_SECONDS: int = 60
+    MAIL_FROM: str = ''
+    MAIL_RATE_PER_SECOND: int = 5
+    MAIL_RETRIES: int = 3
+    MAIL_BACKOFF_SECONDS: int = 1
+    MAIL_TASK_RETRIES: int = 5
+    MAIL_TASK_BACKOFF_SECONDS: int = 30
+
+
+@dataclass
+class OutboxConfig:
+    """
+    EVERY WEB PROCESS DRAINS THE OUTBOX, A FAILED PUBLISH IS RETRIED WITH A BACKOFF.
+    CLAIMED MESSAGES ARE LEASED FOR OUTBOX_LEASE_SECONDS, THEN ANOTHER PROCESS MAY TAKE THEM
+    """
+
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: int = 1
+    OUTBOX_LEASE_SECONDS: int = 60
+    OUTBOX_RETRY_SECONDS: int = 5
+    OUTBOX_MAX_RETRY_SECONDS: int = 5 * 60
+
+
+@dataclass
+class CeleryConfig:
+    """THE WEB PROCESS ONLY PUBLISHES TO THE BROKER, WORKERS IMPORT THE TASK MODULES"""
+
+    CELERY_BROKER_URL: str = f'redis://{Config.REDIS_HOST}:6379/0'
 
 
 def get_str_env(key: str) -> str:
@@ -48,10 +168,257 @@ def get_str_env(key: str) -> str:
     return value
 
 
+def get_int_env(key: str, default: int) -> int:
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.error(f'{key} must be integer')
+        raise ConfigParseError(f'{key} must be integer')
+
+
+def get_bool_env(key: str, default: bool) -> bool:
+    value = os.getenv(key)
+    if not value:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
 def load_config():
+    """
+    CALLED ONCE AT STARTUP, THE APP SHARES ONE INSTANCE.
+    WITH AN ASYMMETRIC ALGORITHM (RS256, EdDSA) ACCESS TOKENS ARE SIGNED WITH
+    JWT_ACCESS_KEYS_DIR/<JWT_ACCESS_KEY_ID>.pem INSTEAD OF JWT_ACCESS_SECRET_KEY
+    """
+    algorithm = get_str_env('ALGORITHM')
+    if algorithm.startswith('HS'):
+        access_secret_key, keys_dir, key_id = get_str_env('JWT_ACCESS_SECRET_KEY'), '', ''
+    else:
+        access_secret_key = os.getenv('JWT_ACCESS_SECRET_KEY', '')
+        keys_dir, key_id = get_str_env('JWT_ACCESS_KEYS_DIR'), get_str_env('JWT_ACCESS_KEY_ID')
     return Config(
-        JWT_ACCESS_SECRET_KEY=get_str_env('JWT_ACCESS_SECRET_KEY'),
+        JWT_ACCESS_SECRET_KEY=access_secret_key,
         JWT_REFRESH_SECRET_KEY=get_str_env('JWT_REFRESH_SECRET_KEY'),
-        ALGORITHM=get_str_env('ALGORITHM'),
+        ALGORITHM=algorithm,
         SECRET_TOKEN_FOR_EMAIL=get_str_env('SECRET_TOKEN_FOR_EMAIL'),
+        JWT_ACCESS_KEYS_DIR=keys_dir,
+        JWT_ACCESS_KEY_ID=key_id,
+        ACCESS_TOKEN_CACHE_MAX_ENTRIES=get_int_env(
+            'ACCESS_TOKEN_CACHE_MAX_ENTRIES',
+            Config.ACCESS_TOKEN_CACHE_MAX_ENTRIES,
+        ),
+        MEDIA_URL_SIGNING_KEY=os.getenv('MEDIA_URL_SIGNING_KEY', Config.MEDIA_URL_SIGNING_KEY),
+        MEDIA_URL_TTL_SECONDS=get_int_env('MEDIA_URL_TTL_SECONDS', Config.MEDIA_URL_TTL_SECONDS),
+    )
+
+
+def load_database_config() -> DatabaseConfig:
+    """
+    DB_MAX_CONNECTIONS IS A CONNECTION BUDGET FOR THE WHOLE INSTANCE,
+    IT IS SPLIT BETWEEN GUNICORN WORKERS (WEB_CONCURRENCY) WITHOUT OVERFLOW
+    AND WINS OVER DB_POOL_SIZE AND DB_MAX_OVERFLOW
+    """
+    pool_size = get_int_env('DB_POOL_SIZE', DatabaseConfig.DB_POOL_SIZE)
+    max_overflow = get_int_env('DB_MAX_OVERFLOW', DatabaseConfig.DB_MAX_OVERFLOW)
+    max_connections = get_int_env('DB_MAX_CONNECTIONS', 0)
+    if max_connections:
+        if os.getenv('DB_POOL_SIZE') or os.getenv('DB_MAX_OVERFLOW'):
+            logger.warning(
+                'DB_MAX_CONNECTIONS is set, DB_POOL_SIZE and DB_MAX_OVERFLOW are ignored',
+            )
+        workers = max(get_int_env('WEB_CONCURRENCY', 1), 1)
+        pool_size, max_overflow = max(max_connections // workers, 1), 0
+    return DatabaseConfig(
+        DB_URI=get_str_env('db_uri'),
+        DB_POOL_SIZE=pool_size,
+        DB_MAX_OVERFLOW=max_overflow,
+        DB_POOL_TIMEOUT=get_int_env('DB_POOL_TIMEOUT', DatabaseConfig.DB_POOL_TIMEOUT),
+        DB_POOL_RECYCLE=get_int_env('DB_POOL_RECYCLE', DatabaseConfig.DB_POOL_RECYCLE),
+        DB_POOL_PRE_PING=get_bool_env('DB_POOL_PRE_PING', DatabaseConfig.DB_POOL_PRE_PING),
+        DB_STATEMENT_TIMEOUT_MS=get_int_env(
+            'DB_STATEMENT_TIMEOUT_MS',
+            DatabaseConfig.DB_STATEMENT_TIMEOUT_MS,
+        ),
+        DB_PREPARED_STATEMENT_CACHE_SIZE=get_int_env(
+            'DB_PREPARED_STATEMENT_CACHE_SIZE',
+            DatabaseConfig.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        ),
+        DB_REPLICA_URIS=[uri for uri in os.getenv('db_replica_uris', '').split(',') if uri],
+        DB_REPLICA_STICKY_SECONDS=get_int_env(
+            'DB_REPLICA_STICKY_SECONDS',
+            DatabaseConfig.DB_REPLICA_STICKY_SECONDS,
+        ),
+    )
+
+
+def load_cache_config() -> CacheConfig:
+    backend = os.getenv('CACHE_BACKEND', CacheConfig.CACHE_BACKEND).lower()
+    if backend not in ('memory', 'redis', 'none'):
+        logger.error('CACHE_BACKEND must be one of memory, redis, none')
+        raise ConfigParseError('CACHE_BACKEND must be one of memory, redis, none')
+    return CacheConfig(
+        CACHE_BACKEND=backend,
+        CACHE_TTL_SECONDS=get_int_env('CACHE_TTL_SECONDS', CacheConfig.CACHE_TTL_SECONDS),
+        CACHE_MAX_ENTRIES=get_int_env('CACHE_MAX_ENTRIES', CacheConfig.CACHE_MAX_ENTRIES),
+        CACHE_REDIS_URL=os.getenv('CACHE_REDIS_URL') or CacheConfig.CACHE_REDIS_URL,
+    )
+
+
+def load_password_hasher_config() -> PasswordHasherConfig:
+    """STORED HASHES WITH OTHER ALGORITHM OR WORK FACTOR ARE REHASHED ON THE NEXT LOGIN"""
+    algorithm = os.getenv('PASSWORD_HASH_ALGORITHM', PasswordHasherConfig.PASSWORD_HASH_ALGORITHM)
+    if algorithm not in ('pbkdf2_sha256', 'scrypt'):
+        logger.error('PASSWORD_HASH_ALGORITHM must be one of pbkdf2_sha256, scrypt')
+        raise ConfigParseError('PASSWORD_HASH_ALGORITHM must be one of pbkdf2_sha256, scrypt')
+    return PasswordHasherConfig(
+        PASSWORD_HASHER_THREADS=get_int_env(
+            'PASSWORD_HASHER_THREADS',
+            PasswordHasherConfig.PASSWORD_HASHER_THREADS,
+        ),
+        PASSWORD_HASHER_MAX_PENDING=get_int_env(
+            'PASSWORD_HASHER_MAX_PENDING',
+            PasswordHasherConfig.PASSWORD_HASHER_MAX_PENDING,
+        ),
+        PASSWORD_HASH_ALGORITHM=algorithm,
+        PASSWORD_PBKDF2_ITERATIONS=get_int_env(
+            'PASSWORD_PBKDF2_ITERATIONS',
+            PasswordHasherConfig.PASSWORD_PBKDF2_ITERATIONS,
+        ),
+        PASSWORD_SCRYPT_N=get_int_env('PASSWORD_SCRYPT_N', PasswordHasherConfig.PASSWORD_SCRYPT_N),
+        PASSWORD_SCRYPT_R=get_int_env('PASSWORD_SCRYPT_R', PasswordHasherConfig.PASSWORD_SCRYPT_R),
+        PASSWORD_SCRYPT_P=get_int_env('PASSWORD_SCRYPT_P', PasswordHasherConfig.PASSWORD_SCRYPT_P),
+    )
+
+
+def get_image_variants_env(key: str, default: dict[str, tuple[int, int]]) -> dict:
+    """thumbnail=400x400,full=2000x1000"""
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        variants = {
+            name.strip(): tuple(int(side) for side in size.split('x'))
+            for name, size in (variant.split('=', 1) for variant in value.split(','))
+        }
+    except ValueError:
+        variants = {}
+    if not variants or any(len(size) != 2 or min(size) < 1 for size in variants.values()):
+        logger.error(f'{key} must look like thumbnail=400x400,full=2000x1000')
+        raise ConfigParseError(f'{key} must look like thumbnail=400x400,full=2000x1000')
+    return variants
+
+
+def load_image_processor_config() -> ImageProcessorConfig:
+    formats = os.getenv('IMAGE_FORMATS')
+    return ImageProcessorConfig(
+        IMAGE_PROCESSOR_WORKERS=get_int_env(
+            'IMAGE_PROCESSOR_WORKERS',
+            ImageProcessorConfig.IMAGE_PROCESSOR_WORKERS,
+        ),
+        IMAGE_PROCESSOR_MAX_PENDING=get_int_env(
+            'IMAGE_PROCESSOR_MAX_PENDING',
+            ImageProcessorConfig.IMAGE_PROCESSOR_MAX_PENDING,
+        ),
+        IMAGE_PROCESSING_TIMEOUT_SECONDS=get_int_env(
+            'IMAGE_PROCESSING_TIMEOUT_SECONDS',
+            ImageProcessorConfig.IMAGE_PROCESSING_TIMEOUT_SECONDS,
+        ),
+        IMAGE_VARIANTS=get_image_variants_env(
+            'IMAGE_VARIANTS',
+            ImageProcessorConfig().IMAGE_VARIANTS,
+        ),
+        IMAGE_FORMATS=(
+            [image_format.strip().lower() for image_format in formats.split(',')]
+            if formats
+            else ImageProcessorConfig().IMAGE_FORMATS
+        ),
+        IMAGE_QUALITY=get_int_env('IMAGE_QUALITY', ImageProcessorConfig.IMAGE_QUALITY),
+        MAX_IMAGE_BYTES=get_int_env('MAX_IMAGE_BYTES', ImageProcessorConfig.MAX_IMAGE_BYTES),
+        MAX_IMAGE_PIXELS=get_int_env('MAX_IMAGE_PIXELS', ImageProcessorConfig.MAX_IMAGE_PIXELS),
+    )
+
+
+def load_refresh_token_config() -> RefreshTokenConfig:
+    backend = os.getenv('REFRESH_TOKEN_BACKEND', RefreshTokenConfig.REFRESH_TOKEN_BACKEND).lower()
+    if backend not in ('postgres', 'redis'):
+        logger.error('REFRESH_TOKEN_BACKEND must be one of postgres, redis')
+        raise ConfigParseError('REFRESH_TOKEN_BACKEND must be one of postgres, redis')
+    return RefreshTokenConfig(
+        REFRESH_TOKEN_BACKEND=backend,
+        REFRESH_TOKEN_REDIS_URL=(
+            os.getenv('REFRESH_TOKEN_REDIS_URL') or RefreshTokenConfig.REFRESH_TOKEN_REDIS_URL
+        ),
+    )
+
+
+def load_mail_config() -> MailConfig:
+    """EMAIl_HOST AND EMAIL_PASSWORD ARE THE ORIGINAL NAMES OF THE LOGIN AND THE SENDER"""
+    username = os.getenv('SMTP_USERNAME') or os.getenv('EMAIl_HOST', MailConfig.SMTP_USERNAME)
+    return MailConfig(
+        SMTP_HOST=os.getenv('SMTP_HOST', MailConfig.SMTP_HOST),
+        SMTP_PORT=get_int_env('SMTP_PORT', MailConfig.SMTP_PORT),
+        SMTP_USERNAME=username,
+        SMTP_PASSWORD=os.getenv('SMTP_PASSWORD') or os.getenv('EMAIL_PASSWORD', ''),
+        SMTP_STARTTLS=get_bool_env('SMTP_STARTTLS', MailConfig.SMTP_STARTTLS),
+        SMTP_TIMEOUT_SECONDS=get_int_env('SMTP_TIMEOUT_SECONDS', MailConfig.SMTP_TIMEOUT_SECONDS),
+        SMTP_MAX_MESSAGES_PER_CONNECTION=get_int_env(
+            'SMTP_MAX_MESSAGES_PER_CONNECTION',
+            MailConfig.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        ),
+        SMTP_IDLE_SECONDS=get_int_env('SMTP_IDLE_SECONDS', MailConfig.SMTP_IDLE_SECONDS),
+        MAIL_FROM=os.getenv('MAIL_FROM') or username,
+        MAIL_RATE_PER_SECOND=get_int_env('MAIL_RATE_PER_SECOND', MailConfig.MAIL_RATE_PER_SECOND),
+        MAIL_RETRIES=get_int_env('MAIL_RETRIES', MailConfig.MAIL_RETRIES),
+        MAIL_BACKOFF_SECONDS=get_int_env('MAIL_BACKOFF_SECONDS', MailConfig.MAIL_BACKOFF_SECONDS),
+        MAIL_TASK_RETRIES=get_int_env('MAIL_TASK_RETRIES', MailConfig.MAIL_TASK_RETRIES),
+        MAIL_TASK_BACKOFF_SECONDS=get_int_env(
+            'MAIL_TASK_BACKOFF_SECONDS',
+            MailConfig.MAIL_TASK_BACKOFF_SECONDS,
+        ),
+    )
+
+
+def load_celery_config() -> CeleryConfig:
+    return CeleryConfig(
+        CELERY_BROKER_URL=os.getenv('CELERY_BROKER_URL') or CeleryConfig.CELERY_BROKER_URL,
+    )
+
+
+def load_outbox_config() -> OutboxConfig:
+    return OutboxConfig(
+        OUTBOX_BATCH_SIZE=get_int_env('OUTBOX_BATCH_SIZE', OutboxConfig.OUTBOX_BATCH_SIZE),
+        OUTBOX_POLL_SECONDS=get_int_env('OUTBOX_POLL_SECONDS', OutboxConfig.OUTBOX_POLL_SECONDS),
+        OUTBOX_LEASE_SECONDS=get_int_env('OUTBOX_LEASE_SECONDS', OutboxConfig.OUTBOX_LEASE_SECONDS),
+        OUTBOX_RETRY_SECONDS=get_int_env('OUTBOX_RETRY_SECONDS', OutboxConfig.OUTBOX_RETRY_SECONDS),
+        OUTBOX_MAX_RETRY_SECONDS=get_int_env(
+            'OUTBOX_MAX_RETRY_SECONDS',
+            OutboxConfig.OUTBOX_MAX_RETRY_SECONDS,
+        ),
+    )
+
+
+def load_maintenance_config() -> MaintenanceConfig:
+    return MaintenanceConfig(
+        MAINTENANCE_INTERVAL_SECONDS=get_int_env(
+            'MAINTENANCE_INTERVAL_SECONDS',
+            MaintenanceConfig.MAINTENANCE_INTERVAL_SECONDS,
+        ),
+        MAINTENANCE_BATCH_SIZE=get_int_env(
+            'MAINTENANCE_BATCH_SIZE',
+            MaintenanceConfig.MAINTENANCE_BATCH_SIZE,
+        ),
+        UNVERIFIED_ACCOUNT_MAX_AGE_HOURS=get_int_env(
+            'UNVERIFIED_ACCOUNT_MAX_AGE_HOURS',
+            MaintenanceConfig.UNVERIFIED_ACCOUNT_MAX_AGE_HOURS,
+        ),
+        MEDIA_GC_INTERVAL_SECONDS=get_int_env(
+            'MEDIA_GC_INTERVAL_SECONDS',
+            MaintenanceConfig.MEDIA_GC_INTERVAL_SECONDS,
+        ),
+        MEDIA_GC_GRACE_HOURS=get_int_env(
+            'MEDIA_GC_GRACE_HOURS',
+            MaintenanceConfig.MEDIA_GC_GRACE_HOURS,
+        ),
     )
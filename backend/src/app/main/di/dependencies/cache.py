@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import Depends
+from starlette.requests import Request
+
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.cache.response_cache import (
+    RoutedResponseCache,
+    get_response_cache_stub,
+)
+from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.main.di.stub import Stub
+from app.main.middlewares.replicas import PRIMARY_STICKY_COOKIE
+
+
+async def get_response_cache(
+    response_cache: Annotated[ResponseCacheInterface, Depends(get_response_cache_stub)],
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    request: Request,
+) -> ResponseCacheInterface:
+    return RoutedResponseCache(
+        response_cache,
+        uow,
+        bypass=bool(request.cookies.get(PRIMARY_STICKY_COOKIE)),
+    )
@@ -2,30 +2,40 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from app.application.auth.encoders.jwt import JWTEncoder
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
 from app.domain.services.jwt import JWTService
 from app.infrastructure.db.interfaces.repositories.uow import UnitOfWorkInterface
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+from app.infrastructure.tokens.repositories.postgres import (
+    PostgresRefreshTokenRepository,
+)
 from app.main.config import Config
 from app.main.di.stub import Stub
 
 
-def get_jwt_service(
-    uow: Annotated[UnitOfWorkInterface, Depends()],
-    jwt_encoder: Annotated[JWTEncoderInterface, Depends()],
+async def get_jwt_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    jwt_encoder: Annotated[JWTEncoderInterface, Depends(Stub(JWTEncoderInterface))],
     settings: Annotated[Config, Depends(Stub(Config))],
+    access_key_set: Annotated[JWTKeySetInterface, Depends(Stub(JWTKeySetInterface))],
+    refresh_token_repo: Annotated[
+        RefreshTokenRepositoryInterface,
+        Depends(Stub(RefreshTokenRepositoryInterface)),
+    ],
 ) -> JWTService:
     return JWTService(
         jwt_encoder,
-        settings.JWT_ACCESS_SECRET_KEY,
+        access_key_set,
         settings.JWT_REFRESH_SECRET_KEY,
         uow,
+        refresh_token_repo,
     )
 
 
-def get_jwt_encoder(
-    config: Annotated[Config, Depends(Stub(Config))],
-):
-    return JWTEncoder(
-        config.ALGORITHM,
-    )
+async def get_postgres_refresh_token_repository(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+) -> RefreshTokenRepositoryInterface:
+    return PostgresRefreshTokenRepository(uow.jwt_repo)
@@ -1,12 +1,20 @@
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.application.interfaces.images.processors import ImageProcessorInterface
 from app.domain.services.posts import PostService
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.database import get_stream_session_maker_stub
 from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.main.di.stub import Stub
 
 
-def get_post_service(
-    uow: Annotated[UnitOfWorkInterface, Depends()],
+async def get_post_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    response_cache: Annotated[ResponseCacheInterface, Depends(Stub(ResponseCacheInterface))],
+    image_processor: Annotated[ImageProcessorInterface, Depends(Stub(ImageProcessorInterface))],
+    stream_session_maker: Annotated[async_sessionmaker, Depends(get_stream_session_maker_stub)],
 ) -> PostService:
-    return PostService(uow)
+    return PostService(uow, response_cache, image_processor, stream_session_maker)
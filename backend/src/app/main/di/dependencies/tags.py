@@ -3,10 +3,13 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.domain.services.tags import TagService
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
 from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.main.di.stub import Stub
 
 
-def get_tag_service(
-    uow: Annotated[UnitOfWorkInterface, Depends()],
+async def get_tag_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    response_cache: Annotated[ResponseCacheInterface, Depends(Stub(ResponseCacheInterface))],
 ) -> TagService:
-    return TagService(uow)
+    return TagService(uow, response_cache)
@@ -1,13 +1,39 @@
-from typing import Annotated
+from typing import Annotated, AsyncGenerator, Iterator
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.requests import Request
 
-from app.infrastructure.db.database import get_session_stub
+from app.infrastructure.db.database import get_read_session_stub, get_session_stub
 from app.infrastructure.db.uow import UnitOfWork
+from app.main.middlewares.replicas import PRIMARY_STICKY_COOKIE
+
+
+async def get_read_session(
+    replica_session_makers: Iterator[async_sessionmaker] | None,
+    request: Request,
+) -> AsyncGenerator[AsyncSession | None, None]:
+    """NONE MEANS THAT READS GO TO THE PRIMARY SESSION"""
+    if replica_session_makers is None or request.cookies.get(PRIMARY_STICKY_COOKIE):
+        yield None
+        return
+    async with next(replica_session_makers)() as session:
+        yield session
+
+
+async def get_stream_session_maker(
+    async_session_maker: async_sessionmaker,
+    replica_session_makers: Iterator[async_sessionmaker] | None,
+    request: Request,
+) -> async_sessionmaker:
+    """STREAMED RESPONSES OUTLIVE THE REQUEST SESSION, SO THEY OPEN A SESSION OF THEIR OWN"""
+    if replica_session_makers is None or request.cookies.get(PRIMARY_STICKY_COOKIE):
+        return async_session_maker
+    return next(replica_session_makers)
 
 
 async def get_uow(
     session: Annotated[AsyncSession, Depends(get_session_stub)],
+    read_session: Annotated[AsyncSession | None, Depends(get_read_session_stub)],
 ) -> UnitOfWork:
-    return UnitOfWork(session)
+    return UnitOfWork(session, read_session)
@@ -1,34 +1,45 @@
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.hashers.passwords import PasswordHasherInterface
+from app.domain.interfaces.users import SendVerifyMessageServiceInterface
 from app.domain.services.users import (
     SendVerifyMessageService,
     UserService,
     UserVerifyService,
 )
+from app.infrastructure.db.database import get_stream_session_maker_stub
 from app.infrastructure.db.uow import UnitOfWorkInterface
 from app.main.config import Config
 from app.main.di.stub import Stub
 
 
-def get_user_service(
-    uow: Annotated[UnitOfWorkInterface, Depends()],
+async def get_user_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    password_hasher: Annotated[PasswordHasherInterface, Depends(Stub(PasswordHasherInterface))],
+    send_verify_message_service: Annotated[
+        SendVerifyMessageServiceInterface,
+        Depends(Stub(SendVerifyMessageServiceInterface)),
+    ],
+    stream_session_maker: Annotated[async_sessionmaker, Depends(get_stream_session_maker_stub)],
 ) -> UserService:
-    return UserService(uow)
+    return UserService(uow, password_hasher, send_verify_message_service, stream_session_maker)
 
 
-def get_send_verify_message_service(
-    jwt_encoder: Annotated[JWTEncoderInterface, Depends()],
+async def get_send_verify_message_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    jwt_encoder: Annotated[JWTEncoderInterface, Depends(Stub(JWTEncoderInterface))],
     config: Annotated[Config, Depends(Stub(Config))],
 ):
-    return SendVerifyMessageService(jwt_encoder, config.SECRET_TOKEN_FOR_EMAIL)
+    return SendVerifyMessageService(uow, jwt_encoder, config.SECRET_TOKEN_FOR_EMAIL)
 
 
-def get_user_verify_service(
-    uow: Annotated[UnitOfWorkInterface, Depends()],
-    jwt_encoder: Annotated[JWTEncoderInterface, Depends()],
+async def get_user_verify_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+    jwt_encoder: Annotated[JWTEncoderInterface, Depends(Stub(JWTEncoderInterface))],
     config: Annotated[Config, Depends(Stub(Config))],
 ):
     return UserVerifyService(uow, jwt_encoder, config.SECRET_TOKEN_FOR_EMAIL)
@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.domain.services.versions import EntityVersionService
+from app.infrastructure.db.uow import UnitOfWorkInterface
+from app.main.di.stub import Stub
+
+
+async def get_entity_version_service(
+    uow: Annotated[UnitOfWorkInterface, Depends(Stub(UnitOfWorkInterface))],
+) -> EntityVersionService:
+    return EntityVersionService(uow)
@@ -1,48 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
+from itertools import cycle
+from multiprocessing import get_context
 
 from fastapi import FastAPI
+from redis.asyncio import Redis
 
+from app.application.auth.caches.tokens import VerifiedTokenCache
+from app.application.auth.encoders.jwt import JWTEncoder
+from app.application.auth.encoders.keys import create_access_key_set
+from app.application.auth.hashers.passwords import (
+    PasswordHasher,
+    create_password_hashing,
+)
+from app.application.images.processors import ImageProcessor, limit_image_pixels
 from app.application.interfaces.encoders.jwt import JWTEncoderInterface
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
+from app.application.interfaces.hashers.passwords import PasswordHasherInterface
+from app.application.interfaces.images.processors import ImageProcessorInterface
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
+from app.application.media.signers import MediaUrlSigner
 from app.domain.interfaces.users import (
     SendVerifyMessageServiceInterface,
     UserVerifyServiceInterface,
 )
+from app.domain.managers.users import UserManager
 from app.domain.services.jwt import JWTServiceInterface
+from app.domain.services.outbox import OutboxDispatcher
 from app.domain.services.posts import PostServiceInterface
 from app.domain.services.tags import TagServiceInterface
 from app.domain.services.users import UserServiceInterface
+from app.domain.services.versions import EntityVersionServiceInterface
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.cache.response_cache import (
+    create_response_cache,
+    get_response_cache_stub,
+)
 from app.infrastructure.db.database import (
     create_async_session_maker,
+    create_replica_session_makers,
     get_async_session,
+    get_read_session_stub,
     get_session_stub,
+    get_stream_session_maker_stub,
 )
 from app.infrastructure.db.uow import UnitOfWorkInterface
-from app.main.config import Config, load_config
-from app.main.di.dependencies.jwt import get_jwt_encoder, get_jwt_service
+from app.infrastructure.tasks.dispatchers.celery import CeleryTaskDispatcher
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+from app.infrastructure.tokens.repositories.redis import RedisRefreshTokenRepository
+from app.main.config import (
+    CacheConfig,
+    CeleryConfig,
+    Config,
+    DatabaseConfig,
+    ImageProcessorConfig,
+    OutboxConfig,
+    PasswordHasherConfig,
+    RefreshTokenConfig,
+    load_config,
+)
+from app.main.di.dependencies.cache import get_response_cache
+from app.main.di.dependencies.jwt import (
+    get_jwt_service,
+    get_postgres_refresh_token_repository,
+)
 from app.main.di.dependencies.posts import get_post_service
 from app.main.di.dependencies.tags import get_tag_service
-from app.main.di.dependencies.uow import get_uow
+from app.main.di.dependencies.uow import (
+    get_read_session,
+    get_stream_session_maker,
+    get_uow,
+)
 from app.main.di.dependencies.users import (
     get_send_verify_message_service,
     get_user_service,
     get_user_verify_service,
 )
+from app.main.di.dependencies.versions import get_entity_version_service
+from app.main.di.providers import cached_signature, singleton
+
 
+def init_dependencies(
+    app: FastAPI,
+    db_config: DatabaseConfig,
+    cache_config: CacheConfig,
+    password_hasher_config: PasswordHasherConfig,
+    image_processor_config: ImageProcessorConfig,
+    refresh_token_config: RefreshTokenConfig,
+    outbox_config: OutboxConfig,
+    celery_config: CeleryConfig,
+) -> None:
+    async_session_maker = create_async_session_maker(db_config)
 
-def init_dependencies(app: FastAPI, db_uri: str) -> None:
-    async_session_maker = create_async_session_maker(db_uri)
+    app.dependency_overrides[get_session_stub] = cached_signature(
+        partial(get_async_session, async_session_maker),
+    )
+    replica_session_makers = create_replica_session_makers(db_config)
+    replicas = cycle(replica_session_makers) if replica_session_makers else None
+    app.dependency_overrides[get_read_session_stub] = cached_signature(
+        partial(get_read_session, replicas),
+    )
+    app.dependency_overrides[get_stream_session_maker_stub] = cached_signature(
+        partial(get_stream_session_maker, async_session_maker, replicas),
+    )
 
-    app.dependency_overrides[get_session_stub] = partial(
-        get_async_session,
+    outbox_dispatcher = OutboxDispatcher(
         async_session_maker,
+        CeleryTaskDispatcher(celery_config.CELERY_BROKER_URL).send,
+        batch_size=outbox_config.OUTBOX_BATCH_SIZE,
+        poll_seconds=outbox_config.OUTBOX_POLL_SECONDS,
+        lease_seconds=outbox_config.OUTBOX_LEASE_SECONDS,
+        retry_seconds=outbox_config.OUTBOX_RETRY_SECONDS,
+        max_retry_seconds=outbox_config.OUTBOX_MAX_RETRY_SECONDS,
     )
+    app.add_event_handler('startup', outbox_dispatcher.start)
+    app.add_event_handler('shutdown', outbox_dispatcher.stop)
 
-    app.dependency_overrides[UnitOfWorkInterface] = get_uow
-    app.dependency_overrides[PostServiceInterface] = get_post_service
-    app.dependency_overrides[TagServiceInterface] = get_tag_service
-    app.dependency_overrides[UserServiceInterface] = get_user_service
-    app.dependency_overrides[SendVerifyMessageServiceInterface] = get_send_verify_message_service
-    app.dependency_overrides[UserVerifyServiceInterface] = get_user_verify_service
-    app.dependency_overrides[JWTServiceInterface] = get_jwt_service
-    app.dependency_overrides[JWTEncoderInterface] = get_jwt_encoder
-    app.dependency_overrides[Config] = load_config
+    app.dependency_overrides[get_response_cache_stub] = singleton(
+        create_response_cache(cache_config),
+    )
+
+    password_hasher = PasswordHasher(
+        ThreadPoolExecutor(
+            max_workers=password_hasher_config.PASSWORD_HASHER_THREADS,
+            thread_name_prefix='password_hasher',
+        ),
+        max_pending=password_hasher_config.PASSWORD_HASHER_MAX_PENDING,
+        hashing=create_password_hashing(password_hasher_config),
+    )
+    app.dependency_overrides[PasswordHasherInterface] = singleton(password_hasher)
+    app.add_event_handler('shutdown', password_hasher.close)
+
+    # SPAWNED WORKERS, FORKING A PROCESS WITH RUNNING THREADS AND AN EVENT LOOP IS NOT SAFE
+    image_processor = ImageProcessor(
+        partial(
+            ProcessPoolExecutor,
+            max_workers=image_processor_config.IMAGE_PROCESSOR_WORKERS,
+            mp_context=get_context('spawn'),
+            initializer=limit_image_pixels,
+            initargs=(image_processor_config.MAX_IMAGE_PIXELS,),
+        ),
+        max_pending=image_processor_config.IMAGE_PROCESSOR_MAX_PENDING,
+        timeout=image_processor_config.IMAGE_PROCESSING_TIMEOUT_SECONDS,
+        variants=image_processor_config.IMAGE_VARIANTS,
+        formats=tuple(image_processor_config.IMAGE_FORMATS),
+        quality=image_processor_config.IMAGE_QUALITY,
+        max_bytes=image_processor_config.MAX_IMAGE_BYTES,
+        max_pixels=image_processor_config.MAX_IMAGE_PIXELS,
+    )
+    app.dependency_overrides[ImageProcessorInterface] = singleton(image_processor)
+    app.add_event_handler('shutdown', image_processor.close)
+
+    if refresh_token_config.REFRESH_TOKEN_BACKEND == 'redis':
+        app.dependency_overrides[RefreshTokenRepositoryInterface] = singleton(
+            RedisRefreshTokenRepository(
+                Redis.from_url(refresh_token_config.REFRESH_TOKEN_REDIS_URL),
+            ),
+        )
+    else:
+        app.dependency_overrides[RefreshTokenRepositoryInterface] = cached_signature(
+            get_postgres_refresh_token_repository,
+        )
+
+    for interface, provider in (
+        (UnitOfWorkInterface, get_uow),
+        (ResponseCacheInterface, get_response_cache),
+        (PostServiceInterface, get_post_service),
+        (TagServiceInterface, get_tag_service),
+        (EntityVersionServiceInterface, get_entity_version_service),
+        (UserServiceInterface, get_user_service),
+        (SendVerifyMessageServiceInterface, get_send_verify_message_service),
+        (UserVerifyServiceInterface, get_user_verify_service),
+        (JWTServiceInterface, get_jwt_service),
+    ):
+        app.dependency_overrides[interface] = cached_signature(provider)
+
+    config = load_config()
+    jwt_encoder = JWTEncoder(config.symmetric_algorithm)
+    access_key_set = create_access_key_set(config)
+    app.dependency_overrides[Config] = singleton(config)
+    app.dependency_overrides[JWTEncoderInterface] = singleton(jwt_encoder)
+    app.dependency_overrides[JWTKeySetInterface] = singleton(access_key_set)
+    app.dependency_overrides[MediaUrlSignerInterface] = singleton(
+        MediaUrlSigner(config.MEDIA_URL_SIGNING_KEY, config.MEDIA_URL_TTL_SECONDS),
+    )
+    app.dependency_overrides[UserManager] = singleton(
+        UserManager(
+            access_key_set,
+            jwt_encoder,
+            VerifiedTokenCache(config.ACCESS_TOKEN_CACHE_MAX_ENTRIES),
+        ),
+    )
@@ -0,0 +1,29 @@
+"""
+PROVIDERS FOR app.dependency_overrides:
+    singleton(instance) RETURNS THE SAME OBJECT FOR EVERY REQUEST (CONFIG, ENCODERS, POOLS)
+    cached_signature(provider) ONLY PRECOMPUTES THE SIGNATURE OF A PROVIDER, IT CREATES NO
+    SCOPE, FastAPI ALREADY CALLS A DEPENDENCY ONCE PER REQUEST AND CACHES THE RESULT FOR
+    EVERY OTHER DEPENDENCY OF THE SAME REQUEST (UNIT OF WORK, SERVICES)
+FastAPI ANALYSES THE SIGNATURE OF AN OVERRIDE ON EVERY REQUEST AND RUNS A SYNC ONE IN THE
+THREADPOOL, SO PROVIDERS ARE ASYNC AND THEIR SIGNATURES ARE COMPUTED ONCE HERE
+"""
+
+import inspect
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+Provider = TypeVar('Provider', bound=Callable[..., Any])
+
+
+def singleton(instance: T) -> Callable[[], Awaitable[T]]:
+    async def provide() -> T:
+        return instance
+
+    provide.__signature__ = inspect.Signature()
+    provide.instance = instance
+    return provide
+
+
+def cached_signature(provider: Provider) -> Provider:
+    provider.__signature__ = inspect.signature(provider)
+    return provider
@@ -1,10 +1,22 @@
+import inspect
 from typing import Callable
 
 
 class Stub:
+    """
+    STANDS FOR dependency UNTIL IT IS OVERRIDDEN. THE HASH AND THE (EMPTY) SIGNATURE ARE
+    COMPUTED ONCE, FastAPI ASKS FOR THEM ON EVERY REQUEST
+    """
+
+    __signature__ = inspect.Signature()
+
     def __init__(self, dependency: Callable, **kwargs):
         self._dependency = dependency
         self._kwargs = kwargs
+        if not kwargs:
+            self._hash = hash(dependency)
+        else:
+            self._hash = hash((dependency, *kwargs.items()))
 
     def __call__(self):
         raise NotImplementedError
@@ -18,10 +30,4 @@ class Stub:
             return False
 
     def __hash__(self):
-        if not self._kwargs:
-            return hash(self._dependency)
-        serial = (
-            self._dependency,
-            *self._kwargs.items(),
-        )
-        return hash(serial)
+        return self._hash
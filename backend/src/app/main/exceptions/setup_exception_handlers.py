@@ -9,7 +9,9 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from app.domain.exceptions.base import DomainException, NotFound, PermissionDenied
-from app.domain.exceptions.images import InvalidImageType
+from app.domain.exceptions.images import ImageTooLarge, InvalidImageType
+from app.domain.exceptions.jwt import RefreshTokenReused
+from app.domain.exceptions.pagination import InvalidCursor
 from app.domain.exceptions.users import (
     AccountAlreadyActivated,
     AccountIsNotActive,
@@ -66,6 +68,18 @@ def setup_exception_handlers(app: FastAPI) -> None:
         InvalidImageType,
         error_handler('Invalid image type', status.HTTP_422_UNPROCESSABLE_ENTITY),
     )
+    app.add_exception_handler(
+        ImageTooLarge,
+        error_handler('Image too large', status.HTTP_413_REQUEST_ENTITY_TOO_LARGE),
+    )
+    app.add_exception_handler(
+        InvalidCursor,
+        error_handler('Invalid cursor', status.HTTP_422_UNPROCESSABLE_ENTITY),
+    )
+    app.add_exception_handler(
+        RefreshTokenReused,
+        error_handler('Refresh token reused', status.HTTP_401_UNAUTHORIZED),
+    )
     app.add_exception_handler(
         PasswordTooShort,
         error_handler(
@@ -1,10 +1,20 @@
-import os
-
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.main.config import (
+    load_cache_config,
+    load_celery_config,
+    load_database_config,
+    load_image_processor_config,
+    load_outbox_config,
+    load_password_hasher_config,
+    load_refresh_token_config,
+)
 from app.main.di.init_dependencies import init_dependencies
 from app.main.exceptions.setup_exception_handlers import setup_exception_handlers
+from app.main.metrics import create_metrics_app
+from app.main.middlewares.body_size import BodySizeLimitMiddleware
+from app.main.middlewares.replicas import PrimaryStickyMiddleware
 from app.presentators.api.routers.root import root_router
 
 
@@ -12,8 +22,30 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title='First fastapi blog',
     )
-    init_dependencies(app, os.environ['db_uri'])
+    db_config = load_database_config()
+    image_processor_config = load_image_processor_config()
+    init_dependencies(
+        app,
+        db_config,
+        load_cache_config(),
+        load_password_hasher_config(),
+        image_processor_config,
+        load_refresh_token_config(),
+        load_outbox_config(),
+        load_celery_config(),
+    )
     app.include_router(root_router)
+    app.mount('/metrics', create_metrics_app())
+    if db_config.DB_REPLICA_URIS:
+        app.add_middleware(
+            PrimaryStickyMiddleware,
+            sticky_seconds=db_config.DB_REPLICA_STICKY_SECONDS,
+        )
+    # THE SLACK LEAVES ROOM FOR THE TEXT FIELDS OF A MULTIPART FORM NEXT TO THE IMAGE
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        max_body_size=image_processor_config.MAX_IMAGE_BYTES + 2**20,
+    )
     setup_exception_handlers(app)
     return app
 
@@ -0,0 +1,16 @@
+import os
+
+from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
+from starlette.types import ASGIApp
+
+
+def create_metrics_app() -> ASGIApp:
+    """
+    WITH SEVERAL GUNICORN WORKERS SET PROMETHEUS_MULTIPROC_DIR TO AGGREGATE THEIR METRICS.
+    /METRICS HAS NO AUTH, NGINX DOES NOT PROXY IT, SO SCRAPE IT FROM THE INTERNAL NETWORK ONLY
+    """
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
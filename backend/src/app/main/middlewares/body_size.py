@@ -0,0 +1,44 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.exceptions.requests import RequestBodyTooLarge
+
+
+class BodySizeLimitMiddleware:
+    """
+    A DECLARED CONTENT-LENGTH OVER THE LIMIT IS ANSWERED BEFORE THE BODY IS READ,
+    A CHUNKED BODY IS COUNTED WHILE IT IS READ AND STOPPED ONCE IT PASSES THE LIMIT
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope['headers']).get(b'content-length', b'')
+        if content_length.isdigit() and int(content_length) > self.max_body_size:
+            exception = RequestBodyTooLarge()
+            response = JSONResponse(
+                {'detail': exception.detail},
+                status_code=exception.status_code,
+                headers={'Connection': 'close'},
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_with_limit() -> Message:
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > self.max_body_size:
+                    raise RequestBodyTooLarge
+            return message
+
+        await self.app(scope, receive_with_limit, send)
@@ -0,0 +1,31 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PRIMARY_STICKY_COOKIE = 'read_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class PrimaryStickyMiddleware:
+    """
+    AFTER A SUCCESSFUL WRITE THE CLIENT READS FROM THE PRIMARY FOR sticky_seconds,
+    SO AN AUTHOR SEES OWN CHANGES EVEN IF REPLICAS LAG BEHIND
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: int):
+        self.app = app
+        self.cookie = '%s=1; Max-Age=%s; Path=/; HttpOnly; SameSite=lax' % (
+            PRIMARY_STICKY_COOKIE,
+            sticky_seconds,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_sticky_cookie(message: Message) -> None:
+            if message['type'] == 'http.response.start' and message['status'] < 400:
+                MutableHeaders(scope=message).append('set-cookie', self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_sticky_cookie)
@@ -0,0 +1,86 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Sequence
+
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.infrastructure.db.models.versions import EntityVersion
+
+
+@dataclass
+class Validators:
+    """
+    ETAG AND LAST-MODIFIED ARE DERIVED FROM ENTITY VERSIONS ONLY,
+    SO A CONDITIONAL REQUEST IS ANSWERED WITHOUT LOADING THE RESPONSE DATA
+    """
+
+    etag: str
+    last_modified: datetime | None
+    private: bool = False
+
+    @classmethod
+    def from_versions(
+        cls,
+        request: Request,
+        versions: Sequence[EntityVersion],
+        variant: str = '',
+        private: bool = False,
+    ) -> 'Validators':
+        digest = hashlib.sha256()
+        for version in sorted(versions, key=lambda version: version.name):
+            digest.update(f'{version.name}:{version.version};'.encode())
+        digest.update(f'{request.url.path}?{request.url.query};{variant}'.encode())
+        last_modified = max((version.updated_at for version in versions), default=None)
+        if last_modified:
+            last_modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        return cls(f'"{digest.hexdigest()[:32]}"', last_modified, private)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {'ETag': self.etag}
+        if self.last_modified:
+            headers['Last-Modified'] = format_datetime(self.last_modified, usegmt=True)
+        if self.private:
+            headers['Cache-Control'] = 'private, no-cache'
+            headers['Vary'] = 'Authorization'
+        else:
+            headers['Cache-Control'] = 'no-cache'
+        return headers
+
+    @staticmethod
+    def get_if_none_match(request: Request) -> list[str] | None:
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is None:
+            return None
+        return [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+
+    @classmethod
+    def matches_any(cls, request: Request) -> bool:
+        """
+        IF-NONE-MATCH: * MATCHES ANY CURRENT REPRESENTATION, A SINGLE RESOURCE ENDPOINT
+        CHECKS THAT THE RESOURCE EXISTS BEFORE ANSWERING 304
+        """
+        return '*' in (cls.get_if_none_match(request) or [])
+
+    def is_not_modified(self, request: Request) -> bool:
+        """IF-MODIFIED-SINCE IS IGNORED WHEN IF-NONE-MATCH IS PRESENT"""
+        tags = self.get_if_none_match(request)
+        if tags is not None:
+            return '*' in tags or self.etag in tags
+        if_modified_since = request.headers.get('if-modified-since')
+        if not if_modified_since or not self.last_modified:
+            return False
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=timezone.utc)
+        return self.last_modified <= modified_since
+
+    def not_modified(self) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
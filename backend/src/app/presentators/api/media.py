@@ -0,0 +1,229 @@
+import mimetypes
+import os
+import re
+import time
+from email.utils import formatdate
+
+import anyio
+from starlette import status
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
+
+mimetypes.add_type('image/webp', '.webp')
+mimetypes.add_type('image/avif', '.avif')
+
+CONTENT_ADDRESSED = re.compile(r'([0-9a-f]{2})/([0-9a-f]{2})/(\1\2[0-9a-f]{60})\.\w+')
+BYTE_RANGE = re.compile(r'bytes=(\d*)-(\d*)', re.IGNORECASE)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+ZEROCOPY = 'http.response.zerocopysend'
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_suffix_range(length: int, size: int) -> tuple[int, int]:
+    """bytes=-N IS THE LAST N BYTES"""
+    if not length or not size:
+        raise RangeNotSatisfiable
+    return max(size - length, 0), size - 1
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    ONE bytes RANGE AS (FIRST, LAST), BOTH INCLUSIVE. A MALFORMED OR MULTIPART RANGE
+    IS IGNORED AND THE WHOLE FILE IS SENT, AS RFC 9110 ALLOWS
+    """
+    match = BYTE_RANGE.fullmatch(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        return parse_suffix_range(int(last), size)
+    start, end = int(first), int(last or size - 1)
+    if start >= size:
+        raise RangeNotSatisfiable
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def get_etag(relative_path: str, stat_result: os.stat_result) -> str:
+    """A CONTENT ADDRESSED FILE IS TAGGED BY ITS HASH, ANY OTHER ONE THE WAY NGINX DOES IT"""
+    match = CONTENT_ADDRESSED.fullmatch(relative_path)
+    if match:
+        return f'"{match.group(3)}"'
+    return f'"{int(stat_result.st_mtime):x}-{stat_result.st_size:x}"'
+
+
+def get_cache_control(relative_path: str, max_age: int | None = None) -> str:
+    """
+    A CONTENT ADDRESSED FILE NEVER CHANGES UNDER ITS NAME, A SIGNED URL IS CACHED ONLY
+    UNTIL IT EXPIRES. ANY OTHER FILE IS REVALIDATED BY ITS ETAG
+    """
+    if not CONTENT_ADDRESSED.fullmatch(relative_path):
+        return 'public, no-cache'
+    if max_age is None:
+        max_age = IMMUTABLE_MAX_AGE
+    return f'public, max-age={max_age}, immutable'
+
+
+class MediaFileResponse(FileResponse):
+    """
+    SENDS BYTES START..END OF THE FILE. WHEN THE SERVER SUPPORTS THE ASGI ZERO COPY
+    EXTENSION THE KERNEL COPIES THEM WITH sendfile, OTHERWISE THEY ARE READ IN CHUNKS
+    """
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        start: int,
+        end: int,
+        headers: dict[str, str],
+        status_code: int = status.HTTP_200_OK,
+        method: str | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        super().__init__(
+            path,
+            status_code=status_code,
+            headers={**headers, 'Content-Length': str(end - start + 1)},
+            stat_result=stat_result,
+            method=method,
+            background=background,
+        )
+        self.start = start
+        self.length = end - start + 1
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': self.status_code,
+                'headers': self.raw_headers,
+            },
+        )
+        if self.send_header_only:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        elif ZEROCOPY in scope.get('extensions', {}):
+            await self.send_zerocopy(send)
+        else:
+            await self.send_chunks(send)
+        if self.background is not None:
+            await self.background()
+
+    async def send_zerocopy(self, send: Send) -> None:
+        with open(self.path, 'rb') as file:
+            await send(
+                {
+                    'type': ZEROCOPY,
+                    'file': file,
+                    'offset': self.start,
+                    'count': self.length,
+                    'more_body': False,
+                },
+            )
+
+    async def send_chunks(self, send: Send) -> None:
+        remaining = self.length
+        async with await anyio.open_file(self.path, mode='rb') as file:
+            await file.seek(self.start)
+            more_body = True
+            while more_body:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                remaining -= len(chunk)
+                more_body = bool(chunk) and remaining > 0
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': more_body})
+
+
+def get_range(request: Request, etag: str, last_modified: str, size: int) -> tuple[int, int] | None:
+    """IF-RANGE WITH AN OUTDATED VALIDATOR ASKS FOR THE WHOLE NEW FILE"""
+    header = request.headers.get('range')
+    if_range = request.headers.get('if-range')
+    if not header or (if_range is not None and if_range not in (etag, last_modified)):
+        return None
+    return parse_range(header, size)
+
+
+def media_response(
+    request: Request,
+    path: str,
+    relative_path: str,
+    stat_result: os.stat_result,
+    max_age: int | None = None,
+) -> Response:
+    etag = get_etag(relative_path, stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        'Accept-Ranges': 'bytes',
+        'Cache-Control': get_cache_control(relative_path, max_age),
+        'ETag': etag,
+        'Last-Modified': last_modified,
+    }
+    if_none_match = request.headers.get('if-none-match', '')
+    if etag in [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    size = stat_result.st_size
+    try:
+        byte_range = get_range(request, etag, last_modified, size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, 'Content-Range': f'bytes */{size}'},
+        )
+    if byte_range is None:
+        return MediaFileResponse(path, stat_result, 0, size - 1, headers, method=request.method)
+    start, end = byte_range
+    return MediaFileResponse(
+        path,
+        stat_result,
+        start,
+        end,
+        {**headers, 'Content-Range': f'bytes {start}-{end}/{size}'},
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        method=request.method,
+    )
+
+
+class ImageUrlSigner:
+    """
+    SIGNS THE image AND image_variants PATHS OF SERIALIZED POSTS WHEN SIGNED MEDIA URLS ARE ON,
+    THE STORED PATHS STAY UNSIGNED. EVERY URL OF A RESPONSE IS SIGNED WITH THE SAME now AND
+    window GOES INTO ITS ETAG AND CACHE KEY, SO NEITHER OUTLIVES THE SIGNATURES IN IT
+    """
+
+    def __init__(self, media_url_signer: MediaUrlSignerInterface, now: float | None = None):
+        self.media_url_signer = media_url_signer
+        self.now = time.time() if now is None else now
+
+    @property
+    def window(self) -> str:
+        if not self.media_url_signer.enabled:
+            return ''
+        return self.media_url_signer.get_expires(self.now)
+
+    def sign(self, path: str) -> str:
+        return self.media_url_signer.sign(path, self.now)
+
+    def post(self, post: dict) -> dict:
+        if not self.media_url_signer.enabled:
+            return post
+        if post['image']:
+            post['image'] = self.sign(post['image'])
+        for variant in (post['image_variants'] or {}).values():
+            variant.update(
+                {key: self.sign(value) for key, value in variant.items() if isinstance(value, str)},
+            )
+        return post
+
+    def page(self, page: dict) -> dict:
+        if not self.media_url_signer.enabled:
+            return page
+        for post in page['items']:
+            self.post(post)
+        return page
@@ -0,0 +1,59 @@
+import os
+import stat
+import time
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
+from app.main.config import Config
+from app.presentators.api.media import media_response
+
+router = APIRouter(
+    tags=['Media'],
+)
+
+
+def resolve_media_path(relative_path: str) -> tuple[str, os.stat_result]:
+    """
+    THE RESOLVED PATH MUST STAY INSIDE THE MEDIA DIRECTORY AND BE A REGULAR FILE,
+    HIDDEN AND HALF WRITTEN (.tmp) FILES ARE NOT SERVED
+    """
+    media_root = os.path.realpath(f'{Config.ROOT_DIR}/{Config.MEDIA_DIR}')
+    path = os.path.realpath(os.path.join(media_root, relative_path))
+    name = os.path.basename(path)
+    if not path.startswith(media_root + os.sep) or name.startswith('.') or name.endswith('.tmp'):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND) from None
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return path, stat_result
+
+
+@router.api_route(
+    f'/{Config.MEDIA_DIR}{{relative_path:path}}',
+    methods=['GET', 'HEAD'],
+    include_in_schema=False,
+)
+async def get_media(
+    request: Request,
+    relative_path: str,
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
+    expires: str = '',
+    signature: str = '',
+) -> Response:
+    """THE SAME FILES NGINX SERVES FROM /media/, FOR DEPLOYMENTS WITHOUT IT"""
+    max_age, now = None, time.time()
+    if media_url_signer.enabled:
+        signed_path = f'{Config.MEDIA_DIR}{relative_path}'
+        if not media_url_signer.verify(signed_path, expires, signature, now):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+        max_age = int(expires) - int(now)
+    path, stat_result = resolve_media_path(relative_path)
+    return media_response(request, path, relative_path, stat_result, max_age)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
+from app.presentators.api.routers.media import router as media_router
 from app.presentators.api.routers.v1.router import v1_router
 
 root_router = APIRouter()
 
 root_router.include_router(v1_router)
+root_router.include_router(media_router)
@@ -5,9 +5,11 @@ from starlette import status
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from app.application.interfaces.encoders.keys import JWTKeySetInterface
 from app.application.models.jwt import AuthenticateSchema
-from app.domain.services.jwt import JWTServiceInterface
+from app.domain.services.jwt import REFRESH_TOKEN_LIFETIME_SECONDS, JWTServiceInterface
 from app.domain.services.users import UserServiceInterface
+from app.main.di.stub import Stub
 
 router = APIRouter(
     prefix='/auth',
@@ -31,7 +33,7 @@ async def login(
         key='refresh_token',
         value=tokens['refresh_token'],
         httponly=True,
-        max_age=60 * 60 * 24 * 7,
+        max_age=REFRESH_TOKEN_LIFETIME_SECONDS,
     )
     return response
 
@@ -50,7 +52,7 @@ async def refresh_access_token(
         key='refresh_token',
         value=tokens['refresh_token'],
         httponly=True,
-        max_age=60 * 60 * 24 * 7,
+        max_age=REFRESH_TOKEN_LIFETIME_SECONDS,
     )
     return response
 
@@ -64,3 +66,15 @@ async def logout(
     response = JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content=None)
     response.delete_cookie('refresh_token')
     return response
+
+
+@router.get('/jwks')
+async def get_jwks(
+    access_key_set: Annotated[JWTKeySetInterface, Depends(Stub(JWTKeySetInterface))],
+):
+    """PUBLIC KEYS TO VERIFY ACCESS TOKENS LOCALLY, EMPTY WITH A SYMMETRIC ALGORITHM"""
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=access_key_set.to_jwks(),
+        headers={'Cache-Control': 'public, max-age=300'},
+    )
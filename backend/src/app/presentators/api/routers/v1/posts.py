@@ -1,83 +1,173 @@
-from typing import Annotated, List
+from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
-from pydantic import parse_obj_as
+from fastapi import APIRouter, Depends, Query
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
 from app.application.models.posts import (
     PostCreateSchema,
+    PostPageSchema,
     PostReadBaseSchema,
     PostReadSchema,
     PostUpdateSchema,
 )
+from app.application.serializers.schemas import serialize
+from app.application.serializers.streaming import StreamFormat, stream_serialize
 from app.domain.services.posts import PostServiceInterface
+from app.domain.services.versions import EntityVersionServiceInterface
+from app.domain.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.cache import namespaces
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.models.versions import EntityName
 from app.main.di.dependencies.auth import get_current_user_info
+from app.presentators.api.conditional import Validators
+from app.presentators.api.media import ImageUrlSigner
 
 router = APIRouter(
     prefix='/posts',
     tags=['Posts'],
 )
 
+POST_ENTITIES = (EntityName.POST, EntityName.TAG)
+
 
 @router.post('')
 async def create_post(
     post: Annotated[PostCreateSchema, Depends(PostCreateSchema.as_form)],
     user_info: Annotated[dict, Depends(get_current_user_info)],
     post_service: Annotated[PostServiceInterface, Depends()],
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
 ):
     data = await post_service.create_post(post.dict(), user_info)
-    data = jsonable_encoder(
-        parse_obj_as(PostReadBaseSchema, data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_201_CREATED,
-        content=data,
+        content=serialize(PostReadBaseSchema, data, ImageUrlSigner(media_url_signer).post),
+        media_type='application/json',
     )
 
 
 @router.get('/user/{user_id}')
 async def get_user_posts(
+    request: Request,
     user_id: int,
     post_service: Annotated[PostServiceInterface, Depends()],
+    response_cache: Annotated[ResponseCacheInterface, Depends()],
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
 ):
-    data = await post_service.get_user_posts(user_id)
-    data = jsonable_encoder(
-        parse_obj_as(List[PostReadSchema], data),
+    image_urls = ImageUrlSigner(media_url_signer)
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions(POST_ENTITIES),
+        image_urls.window,
     )
-    return JSONResponse(
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    async def render() -> bytes:
+        data = await post_service.get_user_posts(user_id, limit, cursor)
+        return serialize(PostPageSchema, data, image_urls.page)
+
+    content = await response_cache.get_or_set(
+        f'user_posts:{user_id}:{limit}:{cursor}:{validators.etag}',
+        [namespaces.user_posts(user_id), namespaces.TAG_NAMES],
+        render,
+    )
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=content,
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
 @router.get('')
 async def get_posts(
+    request: Request,
     post_service: Annotated[PostServiceInterface, Depends()],
+    response_cache: Annotated[ResponseCacheInterface, Depends()],
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    stream: StreamFormat | None = None,
 ):
-    data = await post_service.get_posts()
-    data = jsonable_encoder(
-        parse_obj_as(List[PostReadSchema], data),
+    """WITH STREAM ALL PUBLISHED POSTS ARE SENT, LIMIT AND CURSOR ARE IGNORED"""
+    image_urls = ImageUrlSigner(media_url_signer)
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions(POST_ENTITIES),
+        image_urls.window,
     )
-    return JSONResponse(
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    if stream:
+        return StreamingResponse(
+            stream_serialize(
+                PostReadSchema,
+                post_service.stream_posts(),
+                stream,
+                image_urls.post,
+            ),
+            media_type=stream.media_type,
+            headers=validators.headers,
+        )
+
+    async def render() -> bytes:
+        data = await post_service.get_posts(limit, cursor)
+        return serialize(PostPageSchema, data, image_urls.page)
+
+    content = await response_cache.get_or_set(
+        f'posts:{limit}:{cursor}:{validators.etag}',
+        [namespaces.POSTS, namespaces.TAG_NAMES],
+        render,
+    )
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=content,
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
 @router.get('/{post_id}')
 async def get_post(
+    request: Request,
     post_id: int,
     post_service: Annotated[PostServiceInterface, Depends()],
+    response_cache: Annotated[ResponseCacheInterface, Depends()],
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
 ):
-    data = await post_service.get_post(post_id)
-    data = jsonable_encoder(
-        parse_obj_as(PostReadSchema, data),
+    image_urls = ImageUrlSigner(media_url_signer)
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions(POST_ENTITIES),
+        image_urls.window,
     )
-    return JSONResponse(
+    if validators.matches_any(request):
+        await post_service.get_post(post_id)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    async def render() -> bytes:
+        data = await post_service.get_post(post_id)
+        return serialize(PostReadSchema, data, image_urls.post)
+
+    content = await response_cache.get_or_set(
+        f'post:{post_id}:{validators.etag}',
+        [namespaces.post(post_id), namespaces.TAG_NAMES],
+        render,
+    )
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=content,
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
@@ -87,18 +177,17 @@ async def edit_post(
     update_data: Annotated[PostUpdateSchema, Depends(PostUpdateSchema.as_form)],
     post_service: Annotated[PostServiceInterface, Depends()],
     user_info: Annotated[dict, Depends(get_current_user_info)],
+    media_url_signer: Annotated[MediaUrlSignerInterface, Depends()],
 ):
     data = await post_service.edit_post(
         post_id,
         update_data.dict(exclude_none=True),
         user_info,
     )
-    data = jsonable_encoder(
-        parse_obj_as(PostReadBaseSchema, data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=serialize(PostReadBaseSchema, data, ImageUrlSigner(media_url_signer).post),
+        media_type='application/json',
     )
 
 
@@ -1,15 +1,20 @@
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
-from pydantic import parse_obj_as
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 
 from app.application.models.posts import PostTagBaseSchema, PostTagReadSchema
 from app.application.models.tags import TagCreateSchema, TagReadSchema, TagUpdateSchema
+from app.application.serializers.schemas import serialize
 from app.domain.services.tags import TagServiceInterface
+from app.domain.services.versions import EntityVersionServiceInterface
+from app.infrastructure.cache import namespaces
+from app.infrastructure.cache.interfaces.response_cache import ResponseCacheInterface
+from app.infrastructure.db.models.versions import EntityName
 from app.main.di.dependencies.auth import get_current_user_info
+from app.presentators.api.conditional import Validators
 
 router = APIRouter(
     prefix='/tags',
@@ -19,15 +24,32 @@ router = APIRouter(
 
 @router.get('')
 async def get_tags(
+    request: Request,
     tag_service: Annotated[TagServiceInterface, Depends()],
+    response_cache: Annotated[ResponseCacheInterface, Depends()],
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
 ):
-    data = await tag_service.get_tags()
-    data = jsonable_encoder(
-        parse_obj_as(List[TagReadSchema], data),
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions([EntityName.TAG]),
     )
-    return JSONResponse(
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    async def render() -> bytes:
+        data = await tag_service.get_tags()
+        return serialize(List[TagReadSchema], data)
+
+    content = await response_cache.get_or_set(
+        f'tags:{validators.etag}',
+        [namespaces.TAGS],
+        render,
+    )
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=content,
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
@@ -38,12 +60,10 @@ async def create_tag(
     user_info: Annotated[dict, Depends(get_current_user_info)],
 ):
     data = await tag_service.create_tag(tag.dict(), user_info)
-    data = jsonable_encoder(
-        parse_obj_as(TagReadSchema, data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_201_CREATED,
-        content=data,
+        content=serialize(TagReadSchema, data),
+        media_type='application/json',
     )
 
 
@@ -72,12 +92,10 @@ async def edit_tag(
         update_data.dict(),
         user_info,
     )
-    data = jsonable_encoder(
-        parse_obj_as(TagReadSchema, data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=serialize(TagReadSchema, data),
+        media_type='application/json',
     )
 
 
@@ -93,12 +111,10 @@ async def set_tag_on_post(
         data.dict(),
         user_info,
     )
-    data = jsonable_encoder(
-        parse_obj_as(PostTagReadSchema, data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_201_CREATED,
-        content=data,
+        content=serialize(PostTagReadSchema, data),
+        media_type='application/json',
     )
 
 
@@ -1,22 +1,23 @@
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
-from pydantic import parse_obj_as
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from app.application.models.users import (
     UserCreateSchema,
     UserReadBaseSchema,
     UserReadSchemaForAdmin,
 )
-from app.domain.interfaces.users import (
-    SendVerifyMessageServiceInterface,
-    UserVerifyServiceInterface,
-)
+from app.application.serializers.schemas import serialize
+from app.application.serializers.streaming import StreamFormat, stream_serialize
+from app.domain.interfaces.users import UserVerifyServiceInterface
 from app.domain.services.users import UserServiceInterface
+from app.domain.services.versions import EntityVersionServiceInterface
+from app.infrastructure.db.models.versions import EntityName
 from app.main.di.dependencies.auth import get_current_user_info
+from app.presentators.api.conditional import Validators
 
 router = APIRouter(
     prefix='/users',
@@ -26,32 +27,61 @@ router = APIRouter(
 
 @router.get('')
 async def get_users(
+    request: Request,
     user_info: Annotated[dict, Depends(get_current_user_info)],
     user_service: Annotated[UserServiceInterface, Depends()],
-) -> JSONResponse:
-    users = await user_service.get_users(user_info)
-    schema = UserReadSchemaForAdmin if user_info.get('is_superuser') else UserReadBaseSchema
-    data = jsonable_encoder(
-        parse_obj_as(List[schema], users),
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
+    stream: StreamFormat | None = None,
+) -> Response:
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions([EntityName.USER]),
+        variant=str(bool(user_info.get('is_superuser'))),
+        private=True,
     )
-    return JSONResponse(
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    schema = UserReadSchemaForAdmin if user_info.get('is_superuser') else UserReadBaseSchema
+    if stream:
+        return StreamingResponse(
+            stream_serialize(schema, user_service.stream_users(user_info), stream),
+            media_type=stream.media_type,
+            headers=validators.headers,
+        )
+    users = await user_service.get_users(user_info)
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=serialize(List[schema], users),
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
 @router.get('/{user_id}')
 async def get_user(
+    request: Request,
     user_id: int,
     user_info: Annotated[dict, Depends(get_current_user_info)],
     user_service: Annotated[UserServiceInterface, Depends()],
-) -> JSONResponse:
+    version_service: Annotated[EntityVersionServiceInterface, Depends()],
+) -> Response:
+    validators = Validators.from_versions(
+        request,
+        await version_service.get_versions([EntityName.USER]),
+        variant=str(bool(user_info.get('is_superuser'))),
+        private=True,
+    )
+    if validators.matches_any(request):
+        await user_service.get_user(user_info, user_id)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
     user = await user_service.get_user(user_info, user_id)
     schema = UserReadSchemaForAdmin if user_info.get('is_superuser') else UserReadBaseSchema
-    data = jsonable_encoder(parse_obj_as(schema, user))
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_200_OK,
-        content=data,
+        content=serialize(schema, user),
+        media_type='application/json',
+        headers=validators.headers,
     )
 
 
@@ -59,16 +89,12 @@ async def get_user(
 async def registration(
     user_data: UserCreateSchema,
     user_service: Annotated[UserServiceInterface, Depends()],
-    send_verify_message_service: Annotated[SendVerifyMessageServiceInterface, Depends()],
-) -> JSONResponse:
+) -> Response:
     user_data = await user_service.create_user(user_data.dict())
-    send_verify_message_service.send_verify_message(user_data)
-    data = jsonable_encoder(
-        parse_obj_as(UserReadBaseSchema, user_data),
-    )
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_201_CREATED,
-        content=data,
+        content=serialize(UserReadBaseSchema, user_data),
+        media_type='application/json',
     )
 
 
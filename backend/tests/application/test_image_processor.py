@@ -0,0 +1,241 @@
+import asyncio
+import os
+import re
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from multiprocessing import get_context
+from pathlib import Path
+
+import pytest
+from PIL import Image, features
+
+from app.application.exceptions.images import (
+    ImageProcessingTimeout,
+    ImageWorkerCrashed,
+    TooManyImages,
+)
+from app.application.images.processors import (
+    IMAGE_FORMATS,
+    IMAGE_QUALITY,
+    IMAGE_VARIANTS,
+    MAX_IMAGE_PIXELS,
+    ImageProcessor,
+    TooManyPixels,
+    blob_path,
+    save_variants,
+)
+
+
+def make_image(size: tuple[int, int], image_format: str = 'PNG', mode: str = 'RGB') -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, 'red').save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def slow(seconds: float) -> str:
+    time.sleep(seconds)
+    return 'done'
+
+
+class TestImageProcessor:
+    @pytest.fixture
+    def process_pool_processor(self) -> ImageProcessor:
+        image_processor = ImageProcessor(
+            partial(ProcessPoolExecutor, max_workers=1, mp_context=get_context('spawn')),
+            max_pending=2,
+            timeout=30,
+        )
+        yield image_processor
+        image_processor.close()
+
+    @pytest.fixture
+    def thread_pool_processor(self) -> ImageProcessor:
+        image_processor = ImageProcessor(
+            partial(ThreadPoolExecutor, max_workers=1),
+            max_pending=2,
+            timeout=0.2,
+        )
+        yield image_processor
+        image_processor.close()
+
+    @pytest.mark.parametrize(
+        'size, image_format, mode, expected_sizes',
+        [
+            ((4000, 1000), 'PNG', 'RGBA', [(400, 100), (1000, 250), (2000, 500)]),
+            ((1000, 3000), 'JPEG', 'RGB', [(133, 400), (333, 1000), (333, 1000)]),
+            ((10, 10), 'PNG', 'P', [(10, 10), (10, 10), (10, 10)]),
+        ],
+    )
+    async def test_variants(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+        size: tuple[int, int],
+        image_format: str,
+        mode: str,
+        expected_sizes: list[tuple[int, int]],
+    ):
+        data = make_image(size, image_format, mode)
+        variants = await process_pool_processor.process(data, str(tmp_path), 'media/')
+        assert list(variants) == ['thumbnail', 'medium', 'full']
+        for variant, expected_size in zip(variants.values(), expected_sizes):
+            assert (variant['width'], variant['height']) == expected_size
+            for image_format, path in [('WEBP', variant['webp']), ('JPEG', variant['jpeg'])]:
+                with Image.open(tmp_path / path) as img:
+                    assert img.format == image_format
+                    assert img.size == expected_size
+            for extension, path in [('webp', variant['webp']), ('jpg', variant['jpeg'])]:
+                assert path == f'media/{blob_path((tmp_path / path).read_bytes(), extension)}'
+
+    async def test_identical_files_are_stored_once(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+    ):
+        data = make_image((3000, 3000))
+        variants = await process_pool_processor.process(data, str(tmp_path), 'media/')
+        assert await process_pool_processor.process(data, str(tmp_path), 'media/') == variants
+        paths = {variant[key] for variant in variants.values() for key in ('webp', 'jpeg')}
+        assert sorted(paths) == sorted(
+            str(path.relative_to(tmp_path)) for path in tmp_path.rglob('*') if path.is_file()
+        )
+        path = paths.pop()
+        assert re.fullmatch(r'media/([0-9a-f]{2})/([0-9a-f]{2})/\1\2[0-9a-f]{60}\.\w+', path)
+
+    async def test_metadata_is_stripped(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+    ):
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = 'camera'
+        buffer = BytesIO()
+        Image.new('RGB', (300, 100), 'red').save(buffer, 'JPEG', exif=exif, icc_profile=b'icc')
+        variants = await process_pool_processor.process(buffer.getvalue(), str(tmp_path), 'media/')
+        assert (variants['full']['width'], variants['full']['height']) == (100, 300)
+        for path in (variants['full']['webp'], variants['full']['jpeg']):
+            with Image.open(tmp_path / path) as img:
+                assert not img.getexif()
+                assert 'icc_profile' not in img.info
+
+    @pytest.mark.skipif(not features.check('avif'), reason='Pillow is built without AVIF')
+    async def test_avif(self, tmp_path: Path):
+        image_processor = ImageProcessor(
+            partial(ThreadPoolExecutor, max_workers=1),
+            max_pending=1,
+            timeout=30,
+            variants={'small': (50, 50)},
+            formats=('avif', 'jpeg'),
+        )
+        variants = await image_processor.process(make_image((100, 100)), str(tmp_path), 'media/')
+        image_processor.close()
+        assert set(variants['small']) == {'width', 'height', 'avif', 'jpeg'}
+        with Image.open(tmp_path / variants['small']['avif']) as img:
+            assert img.format == 'AVIF'
+
+    @pytest.mark.parametrize('formats', [('webp',), ('gif', 'jpeg')])
+    async def test_unsupported_formats(self, formats: tuple[str, ...]):
+        with pytest.raises(ValueError):
+            ImageProcessor(ThreadPoolExecutor, max_pending=1, timeout=1, formats=formats)
+
+    async def test_not_an_image(self, process_pool_processor: ImageProcessor, tmp_path: Path):
+        with pytest.raises(ValueError):
+            await process_pool_processor.process(b'not an image', str(tmp_path), 'media/')
+        assert process_pool_processor.pending == 0
+
+    @pytest.mark.parametrize(
+        'image',
+        [make_image((10, 10), 'GIF'), make_image((10, 10), 'BMP')],
+        ids=['gif', 'bmp'],
+    )
+    async def test_not_allowed_decoder(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+        image: bytes,
+    ):
+        with pytest.raises(ValueError):
+            await process_pool_processor.process(image, str(tmp_path), 'media/')
+
+    async def test_too_many_pixels(self, process_pool_processor: ImageProcessor, tmp_path: Path):
+        process_pool_processor.max_pixels = 100 * 100 - 1
+        with pytest.raises(TooManyPixels):
+            await process_pool_processor.process(make_image((100, 100)), str(tmp_path), 'media/')
+        assert not list(tmp_path.iterdir())
+        assert process_pool_processor.pending == 0
+
+    async def test_crashed_worker_is_replaced(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+    ):
+        broken = process_pool_processor.executor
+        with pytest.raises(ImageWorkerCrashed):
+            await process_pool_processor.run(os._exit, 1)
+        assert process_pool_processor.executor is not broken
+        assert await process_pool_processor.process(make_image((10, 10)), str(tmp_path), 'media/')
+
+    async def test_idle_worker_crash_is_replaced(
+        self,
+        process_pool_processor: ImageProcessor,
+        tmp_path: Path,
+    ):
+        assert await process_pool_processor.run(abs, -2) == 2
+        broken = process_pool_processor.executor
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+        while not broken._broken:
+            await asyncio.sleep(0.01)
+        with pytest.raises(ImageWorkerCrashed):
+            await process_pool_processor.process(make_image((10, 10)), str(tmp_path), 'media/')
+        assert process_pool_processor.executor is not broken
+        assert process_pool_processor.pending == 0
+        assert await process_pool_processor.process(make_image((10, 10)), str(tmp_path), 'media/')
+
+    async def test_pending_limit(self, thread_pool_processor: ImageProcessor):
+        results = await asyncio.gather(
+            *[thread_pool_processor.run(slow, 0.05) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert results[:2] == ['done', 'done']
+        assert isinstance(results[2], TooManyImages)
+        assert thread_pool_processor.pending == 0
+
+    async def test_timeout(self, thread_pool_processor: ImageProcessor):
+        with pytest.raises(ImageProcessingTimeout):
+            await thread_pool_processor.run(slow, 0.5)
+        assert thread_pool_processor.pending == 1
+        await asyncio.sleep(0.5)
+        assert thread_pool_processor.pending == 0
+
+    async def test_timed_out_image_writes_no_files(self, tmp_path: Path):
+        image_processor = ImageProcessor(
+            partial(ThreadPoolExecutor, max_workers=1),
+            max_pending=1,
+            timeout=0.001,
+        )
+        with pytest.raises(ImageProcessingTimeout):
+            await image_processor.process(make_image((3000, 3000)), str(tmp_path), 'media/')
+        while image_processor.pending:
+            await asyncio.sleep(0.05)
+        image_processor.close()
+        assert not [path for path in tmp_path.rglob('*') if path.is_file()]
+
+
+def test_save_variants_after_deadline(tmp_path: Path):
+    with pytest.raises(TimeoutError):
+        save_variants(
+            make_image((100, 100)),
+            str(tmp_path),
+            'media/',
+            IMAGE_VARIANTS,
+            IMAGE_FORMATS,
+            IMAGE_QUALITY,
+            MAX_IMAGE_PIXELS,
+            time.time() - 1,
+        )
+    assert not [path for path in tmp_path.rglob('*') if path.is_file()]
@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+from app.application.auth.encoders.jwt import JWTEncoder
+from app.application.auth.encoders.keys import JWTKeySet
+from app.application.exceptions.auth import CouldNotValidateCredentials, TokenExpired
+
+GENERATE_KEY = {
+    'RS256': lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    'EdDSA': ed25519.Ed25519PrivateKey.generate,
+}
+
+
+def write_private_key(directory: Path, kid: str, algorithm: str):
+    private_key = GENERATE_KEY[algorithm]()
+    (directory / f'{kid}.pem').write_bytes(
+        private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()),
+    )
+    return private_key
+
+
+class TestJWTEncoder:
+    @pytest.fixture
+    def jwt_encoder(self) -> JWTEncoder:
+        return JWTEncoder('HS256')
+
+    async def test_signature_is_verified(self, jwt_encoder: JWTEncoder):
+        token = jwt_encoder.generate_jwt({'sub': '1'}, 60, 'secret')
+        assert jwt_encoder.decode_jwt(token, 'secret')['sub'] == '1'
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(token, 'other secret')
+
+        header, payload, signature = token.split('.')
+        forged_payload = jwt.utils.base64url_encode(b'{"sub":"2","exp":9999999999}').decode()
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(f'{header}.{forged_payload}.{signature}', 'secret')
+
+    async def test_none_algorithm_is_rejected(self, jwt_encoder: JWTEncoder):
+        token = jwt.encode({'sub': '1', 'exp': 9999999999}, None, algorithm='none')
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(token, 'secret')
+
+    @pytest.mark.parametrize('token', [None, '', 'invalid', 'a.b.c'])
+    async def test_malformed(self, jwt_encoder: JWTEncoder, token):
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(token, 'secret')
+
+    async def test_expired(self, jwt_encoder: JWTEncoder):
+        token = jwt.encode({'sub': '1', 'exp': 1}, 'secret', algorithm='HS256')
+        with pytest.raises(TokenExpired):
+            jwt_encoder.decode_jwt(token, 'secret')
+        assert jwt_encoder.decode_jwt(token, 'secret', soft=True)['sub'] == '1'
+
+        token = jwt.encode({'sub': '1'}, 'secret', algorithm='HS256')
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(token, 'secret')
+
+    async def test_secret_is_prepared_once(self, jwt_encoder: JWTEncoder):
+        jwt_encoder.generate_jwt({'sub': '1'}, 60, 'secret')
+        key_set = jwt_encoder.get_key_set('secret')
+        jwt_encoder.decode_jwt(jwt_encoder.generate_jwt({'sub': '1'}, 60, 'secret'), 'secret')
+        assert jwt_encoder.get_key_set('secret') is key_set
+        assert len(jwt_encoder.key_sets) == 1
+
+    @pytest.mark.parametrize('algorithm', GENERATE_KEY)
+    async def test_kid_rotation(self, jwt_encoder: JWTEncoder, tmp_path: Path, algorithm: str):
+        write_private_key(tmp_path, 'old', algorithm)
+        old_key_set = JWTKeySet.from_pem_dir(algorithm, str(tmp_path), 'old')
+        old_token = jwt_encoder.generate_jwt({'sub': '1'}, 60, old_key_set)
+        assert jwt.get_unverified_header(old_token) == {
+            'alg': algorithm,
+            'kid': 'old',
+            'typ': 'JWT',
+        }
+
+        write_private_key(tmp_path, 'new', algorithm)
+        key_set = JWTKeySet.from_pem_dir(algorithm, str(tmp_path), 'new')
+        new_token = jwt_encoder.generate_jwt({'sub': '2'}, 60, key_set)
+        assert jwt_encoder.decode_jwt(old_token, key_set)['sub'] == '1'
+        assert jwt_encoder.decode_jwt(new_token, key_set)['sub'] == '2'
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(new_token, old_key_set)
+
+    async def test_public_key_only_verifies(self, jwt_encoder: JWTEncoder, tmp_path: Path):
+        private_key = write_private_key(tmp_path, 'current', 'EdDSA')
+        token = jwt_encoder.generate_jwt(
+            {'sub': '1'},
+            60,
+            JWTKeySet.from_pem_dir('EdDSA', str(tmp_path), 'current'),
+        )
+        verify_dir = tmp_path / 'verify'
+        verify_dir.mkdir()
+        (verify_dir / 'current.pem').write_bytes(
+            private_key.public_key().public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo),
+        )
+        with pytest.raises(ValueError):
+            JWTKeySet.from_pem_dir('EdDSA', str(verify_dir), 'current')
+
+        write_private_key(verify_dir, 'next', 'EdDSA')
+        key_set = JWTKeySet.from_pem_dir('EdDSA', str(verify_dir), 'next')
+        assert jwt_encoder.decode_jwt(token, key_set)['sub'] == '1'
+
+    async def test_algorithm_confusion(self, jwt_encoder: JWTEncoder, tmp_path: Path):
+        private_key = write_private_key(tmp_path, 'current', 'RS256')
+        key_set = JWTKeySet.from_pem_dir('RS256', str(tmp_path), 'current')
+        public_pem = private_key.public_key().public_bytes(
+            Encoding.PEM,
+            PublicFormat.SubjectPublicKeyInfo,
+        )
+        header = jwt.utils.base64url_encode(b'{"alg":"HS256","kid":"current"}')
+        payload = jwt.utils.base64url_encode(b'{"sub":"1","exp":9999999999}')
+        signature = jwt.utils.base64url_encode(
+            jwt.get_algorithm_by_name('HS256').sign(header + b'.' + payload, public_pem),
+        )
+        token = b'.'.join((header, payload, signature)).decode()
+        with pytest.raises(CouldNotValidateCredentials):
+            jwt_encoder.decode_jwt(token, key_set)
+
+    async def test_jwks(self, tmp_path: Path):
+        write_private_key(tmp_path, 'first', 'EdDSA')
+        write_private_key(tmp_path, 'second', 'EdDSA')
+        key_set = JWTKeySet.from_pem_dir('EdDSA', str(tmp_path), 'second')
+        jwks = key_set.to_jwks()
+        assert [jwk['kid'] for jwk in jwks['keys']] == ['first', 'second']
+        assert all('d' not in jwk for jwk in jwks['keys'])
+
+        token = JWTEncoder('HS256').generate_jwt({'sub': '1'}, 60, key_set)
+        public_key = jwt.PyJWK(jwks['keys'][1]).key
+        assert jwt.decode(token, public_key, algorithms=['EdDSA'])['sub'] == '1'
+        assert JWTKeySet.from_secret('HS256', 'secret').to_jwks() == {'keys': []}
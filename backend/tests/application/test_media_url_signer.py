@@ -0,0 +1,35 @@
+from urllib.parse import parse_qs, urlsplit
+
+from app.application.media.signers import MediaUrlSigner
+
+TTL = 3600
+PATH = 'media/images/aa/bb/image.jpg'
+
+
+def get_query(url: str) -> tuple[str, str]:
+    query = parse_qs(urlsplit(url).query)
+    return query['expires'][0], query['signature'][0]
+
+
+class TestMediaUrlSigner:
+    def test_disabled_without_key(self):
+        assert not MediaUrlSigner('', TTL).enabled
+        assert MediaUrlSigner('key', TTL).enabled
+
+    def test_same_url_within_window(self):
+        signer = MediaUrlSigner('key', TTL)
+        url = signer.sign(PATH, now=TTL * 10)
+        assert urlsplit(url).path == PATH
+        assert signer.sign(PATH, now=TTL * 11 - 1) == url
+        assert signer.sign(PATH, now=TTL * 11) != url
+        assert get_query(url)[0] == signer.get_expires(now=TTL * 10) == str(TTL * 12)
+
+    def test_verify(self):
+        signer = MediaUrlSigner('key', TTL)
+        expires, signature = get_query(signer.sign(PATH, now=TTL * 10))
+        assert signer.verify(PATH, expires, signature, now=TTL * 12 - 1)
+        assert not signer.verify(PATH, expires, signature, now=TTL * 12)
+        assert not signer.verify('media/images/other.jpg', expires, signature, now=TTL * 10)
+        assert not signer.verify(PATH, str(int(expires) + 1), signature, now=TTL * 10)
+        assert not signer.verify(PATH, 'never', signature, now=TTL * 10)
+        assert not MediaUrlSigner('other', TTL).verify(PATH, expires, signature, now=TTL * 10)
@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.application.auth.hashers.passwords import (
+    LegacyPBKDF2PasswordHashAlgorithm,
+    PasswordHasher,
+    PasswordHashing,
+    PBKDF2PasswordHashAlgorithm,
+    ScryptPasswordHashAlgorithm,
+)
+from app.application.exceptions.auth import TooManyPasswordHashes
+from app.domain.managers.users import UserManager
+
+ALGORITHMS = [
+    LegacyPBKDF2PasswordHashAlgorithm(),
+    PBKDF2PasswordHashAlgorithm(iterations=1000),
+    ScryptPasswordHashAlgorithm(cost=2**10, block_size=8, parallelization=1),
+]
+
+
+class TestPasswordHashing:
+    @pytest.mark.parametrize('default', ALGORITHMS)
+    async def test_verify_side_by_side(self, default):
+        hashing = PasswordHashing(default)
+        for algorithm in ALGORITHMS:
+            hashed_password = algorithm.encode('test')
+            assert hashing.check_password('test', hashed_password)
+            assert not hashing.check_password('wrong', hashed_password)
+            is_legacy = isinstance(algorithm, LegacyPBKDF2PasswordHashAlgorithm)
+            assert hashing.needs_rehash(hashed_password) is (algorithm is not default or is_legacy)
+
+    async def test_self_describing(self):
+        algorithm = ScryptPasswordHashAlgorithm(cost=2**10, block_size=4, parallelization=2)
+        hashed_password = algorithm.encode('test')
+        assert hashed_password.split('$')[:4] == ['scrypt', '1024', '4', '2']
+        assert PBKDF2PasswordHashAlgorithm(1000).encode('test').startswith('pbkdf2_sha256$1000$')
+
+    async def test_work_factor_change_needs_rehash(self):
+        hashed_password = PBKDF2PasswordHashAlgorithm(1000).encode('test')
+        hashing = PasswordHashing(PBKDF2PasswordHashAlgorithm(2000))
+        assert hashing.check_password('test', hashed_password)
+        assert hashing.needs_rehash(hashed_password)
+        assert not hashing.needs_rehash(hashing.make_password('test'))
+
+    @pytest.mark.parametrize(
+        'password_from_db',
+        ['', 'test', 'unknown$1$2$3', 'pbkdf2_sha256$1000$!!$!!', 'scrypt$1024$8', 'zz' * 64],
+    )
+    async def test_malformed(self, password_from_db: str):
+        assert not PasswordHashing(ALGORITHMS[1]).check_password('test', password_from_db)
+
+
+class TestPasswordHasher:
+    @pytest.fixture
+    def password_hasher(self) -> PasswordHasher:
+        password_hasher = PasswordHasher(ThreadPoolExecutor(max_workers=1), max_pending=2)
+        yield password_hasher
+        password_hasher.close()
+
+    async def test_compatible_with_user_manager(self, password_hasher: PasswordHasher):
+        hashed_password = await password_hasher.make_password('test')
+        assert UserManager.check_password('test', hashed_password)
+        hashed_password = UserManager.make_password('test')
+        assert await password_hasher.check_password('test', hashed_password)
+        assert not await password_hasher.check_password('wrong', hashed_password)
+        assert not password_hasher.needs_rehash(hashed_password)
+
+    async def test_pending_limit(self, password_hasher: PasswordHasher):
+        results = await asyncio.gather(
+            *[password_hasher.make_password('test') for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert [isinstance(result, TooManyPasswordHashes) for result in results] == [
+            False,
+            False,
+            True,
+        ]
+        assert password_hasher.pending == 0
+        assert await password_hasher.make_password('test')
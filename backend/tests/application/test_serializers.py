@@ -0,0 +1,140 @@
+import json
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import parse_obj_as
+from sqlalchemy import select
+
+from app.application.models.posts import (
+    PostPageSchema,
+    PostReadBaseSchema,
+    PostReadSchema,
+    PostTagReadSchema,
+)
+from app.application.models.tags import TagReadSchema
+from app.application.models.users import UserReadBaseSchema, UserReadSchemaForAdmin
+from app.application.serializers.schemas import serialize
+from app.application.serializers.streaming import StreamFormat, stream_serialize
+from app.infrastructure.db.models.posts import Post
+from app.infrastructure.db.models.tags import PostTag, Tag
+from app.infrastructure.db.models.users import User
+from tests.conftest import async_session_maker
+
+TEXTS = ['plain', 'кириллица', 'quote " and \\ slash', 'emoji 🚀', 'tab\tcontrol\x01 \u2028 end']
+
+
+def render_json_response(schema, obj) -> bytes:
+    """THE PATH ROUTERS USED BEFORE: parse_obj_as + jsonable_encoder + JSONResponse.render"""
+    return json.dumps(
+        jsonable_encoder(parse_obj_as(schema, obj)),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def make_user(number: int) -> User:
+    return User(
+        id=number,
+        username=TEXTS[number % len(TEXTS)],
+        email=f'test{number}@test.ru',
+        registered_at=datetime(2023, 7, 13, 22, 28, number, 123456 * (number % 2)),
+        is_superuser=False,
+        is_verified=True,
+        is_active=True,
+    )
+
+
+def make_image_variants(number: int) -> dict:
+    return {
+        name: {
+            'width': size,
+            'height': size // 2,
+            'jpeg': f'media/images/{number}_{name}.jpg',
+            **({'webp': f'media/images/{number}_{name}.webp'} if number % 4 else {}),
+        }
+        for name, size in (('thumbnail', 400), ('full', 2000))
+    }
+
+
+def make_post(number: int) -> Post:
+    return Post(
+        id=number,
+        title=TEXTS[number % len(TEXTS)],
+        content=TEXTS[(number + 1) % len(TEXTS)],
+        published=bool(number % 2),
+        image=None if number % 2 else f'media/images/{number}_full.jpg',
+        image_variants=None if number % 2 else make_image_variants(number),
+        created_at=datetime(2023, 7, 13, 22, 28, number, 999999),
+        user=make_user(number),
+        tags=[
+            Tag(id=tag, name=TEXTS[tag], created_at=datetime(2023, 1, 1, 0, 0, tag))
+            for tag in range(number % 3)
+        ],
+    )
+
+
+class TestSerializers:
+    @pytest.mark.parametrize(
+        'schema, obj',
+        [
+            (List[PostReadSchema], [make_post(number) for number in range(10)]),
+            (PostReadSchema, make_post(4)),
+            (PostReadBaseSchema, make_post(5)),
+            (PostPageSchema, {'items': [make_post(1), make_post(2)], 'next_cursor': 'abc'}),
+            (PostPageSchema, {'items': [], 'next_cursor': None}),
+            (PostTagReadSchema, PostTag(id=1, post_id=2, tag_id=3)),
+            (List[TagReadSchema], make_post(2).tags),
+            (List[UserReadBaseSchema], [make_user(number) for number in range(6)]),
+            (UserReadSchemaForAdmin, make_user(1)),
+            (UserReadSchemaForAdmin, make_user(2)),
+        ],
+    )
+    async def test_byte_compatible(self, schema, obj):
+        assert serialize(schema, obj) == render_json_response(schema, obj)
+
+    async def test_rows(self):
+        async with async_session_maker() as session:
+            session.add(User(username='row', email='row@test.ru', password='test'))
+            await session.commit()
+            result = await session.execute(select(User.id, User.username))
+            rows = result.all()
+        assert serialize(List[UserReadBaseSchema], rows) == render_json_response(
+            List[UserReadBaseSchema],
+            [row._asdict() for row in rows],
+        )
+
+    @pytest.mark.parametrize('batch_sizes', [[], [0], [3], [1, 0, 2, 3]])
+    async def test_stream_json_array(self, batch_sizes: list[int]):
+        posts = [make_post(number) for number in range(sum(batch_sizes))]
+
+        async def batches():
+            rest = posts
+            for size in batch_sizes:
+                yield rest[:size]
+                rest = rest[size:]
+
+        chunks = [
+            chunk async for chunk in stream_serialize(PostReadSchema, batches(), StreamFormat.JSON)
+        ]
+        assert b''.join(chunks) == render_json_response(List[PostReadSchema], posts)
+
+    async def test_transform(self):
+        posts = [make_post(number) for number in range(3)]
+
+        def mark(item: dict) -> dict:
+            return {**item, 'title': f'{item["id"]} marked'}
+
+        async def batches():
+            yield posts
+
+        encoded = jsonable_encoder(parse_obj_as(List[PostReadSchema], posts))
+        expected = [mark(item) for item in encoded]
+        assert json.loads(serialize(List[PostReadSchema], posts, mark)) == expected
+        assert json.loads(serialize(PostReadSchema, posts[0], mark)) == expected[0]
+        stream = stream_serialize(PostReadSchema, batches(), StreamFormat.NDJSON, mark)
+        lines = b''.join([chunk async for chunk in stream]).splitlines()
+        assert [json.loads(line) for line in lines] == expected
@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+
+from app.application.auth.caches.tokens import VerifiedTokenCache
+from app.application.auth.encoders.jwt import JWTEncoder
+from app.application.exceptions.auth import CouldNotValidateCredentials
+from app.domain.managers.users import UserManager
+
+JWT_ACCESS_SECRET_KEY = os.environ['JWT_ACCESS_SECRET_KEY']
+
+
+class CountingJWTEncoder(JWTEncoder):
+    def __init__(self, algorithm: str):
+        super().__init__(algorithm)
+        self.decoded = 0
+
+    def decode_jwt(self, *args, **kwargs) -> dict:
+        self.decoded += 1
+        return super().decode_jwt(*args, **kwargs)
+
+
+class TestVerifiedTokenCache:
+    async def test_expires_with_token(self, monkeypatch: pytest.MonkeyPatch):
+        token_cache = VerifiedTokenCache(max_entries=10)
+        now = time.time()
+        token_cache.set('token', {'user_id': 1}, now + 60)
+        token_cache.set('expired', {'user_id': 2}, now - 1)
+        assert token_cache.get('token') == {'user_id': 1}
+        assert token_cache.get('expired') is None
+
+        monkeypatch.setattr(time, 'time', lambda: now + 60)
+        assert token_cache.get('token') is None
+        assert len(token_cache) == 0
+
+    async def test_lru_bound(self):
+        token_cache = VerifiedTokenCache(max_entries=2)
+        expires_at = time.time() + 60
+        token_cache.set('first', {}, expires_at)
+        token_cache.set('second', {}, expires_at)
+        token_cache.get('first')
+        token_cache.set('third', {}, expires_at)
+        assert token_cache.get('first') == {}
+        assert token_cache.get('second') is None
+        assert len(token_cache) == 2
+
+    async def test_disabled(self):
+        token_cache = VerifiedTokenCache(max_entries=0)
+        token_cache.set('token', {}, time.time() + 60)
+        assert token_cache.get('token') is None
+
+    async def test_returns_copy(self):
+        token_cache = VerifiedTokenCache(max_entries=1)
+        token_cache.set('token', {'user_id': 1}, time.time() + 60)
+        token_cache.get('token')['user_id'] = 2
+        assert token_cache.get('token') == {'user_id': 1}
+
+
+class TestUserManager:
+    async def test_decodes_once(self):
+        jwt_encoder = CountingJWTEncoder(os.environ['ALGORITHM'])
+        user_manager = UserManager(JWT_ACCESS_SECRET_KEY, jwt_encoder, VerifiedTokenCache(10))
+        access_token = jwt_encoder.generate_jwt(
+            data={'sub': 1, 'is_superuser': True},
+            lifetime_seconds=60,
+            secret=JWT_ACCESS_SECRET_KEY,
+        )
+        for _ in range(3):
+            assert user_manager.get_user_info_from_access_token(access_token) == {
+                'user_id': 1,
+                'is_superuser': True,
+            }
+        assert jwt_encoder.decoded == 1
+
+    async def test_invalid_token_is_not_cached(self):
+        jwt_encoder = CountingJWTEncoder(os.environ['ALGORITHM'])
+        token_cache = VerifiedTokenCache(10)
+        user_manager = UserManager(JWT_ACCESS_SECRET_KEY, jwt_encoder, token_cache)
+        for access_token in (None, 'invalid'):
+            with pytest.raises(CouldNotValidateCredentials):
+                user_manager.get_user_info_from_access_token(access_token)
+        assert len(token_cache) == 0
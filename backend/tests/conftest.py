@@ -13,8 +13,16 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.pool import NullPool
 
-from app.domain.interfaces.users import SendVerifyMessageServiceInterface
-from app.infrastructure.db.database import Base, get_session_stub
+from app.infrastructure.cache.backends.memory import MemoryCacheBackend
+from app.infrastructure.cache.response_cache import (
+    ResponseCache,
+    get_response_cache_stub,
+)
+from app.infrastructure.db.database import (
+    Base,
+    get_session_stub,
+    get_stream_session_maker_stub,
+)
 from app.main.main import app
 
 test_engine = create_async_engine(os.environ['test_db_uri'], poolclass=NullPool)
@@ -40,24 +48,15 @@ app.dependency_overrides[get_session_stub] = partial(
     get_test_async_session,
     async_session_maker,
 )
-
-
-class SendVerifyMessageServiceOverride(SendVerifyMessageServiceInterface):
-    def send_verify_message(self, user_data: dict):
-        pass
-
-
-def get_test_send_verify_message_service():
-    return SendVerifyMessageServiceOverride()
-
-
-app.dependency_overrides[SendVerifyMessageServiceInterface] = get_test_send_verify_message_service
+app.dependency_overrides[get_stream_session_maker_stub] = lambda: async_session_maker
 
 
 @pytest.fixture(autouse=True, scope='module')
 async def prepare_database():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    response_cache = ResponseCache(MemoryCacheBackend(max_entries=1000), ttl=60)
+    app.dependency_overrides[get_response_cache_stub] = lambda: response_cache
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.services.maintenance import MaintenanceService
+from app.infrastructure.db.models.jwt import RefreshToken
+from app.infrastructure.db.models.posts import Post
+from app.infrastructure.db.models.users import User
+from app.infrastructure.db.repositories.jwt import JWTRepository
+from app.infrastructure.db.uow import UnitOfWork
+from tests.conftest import async_session_maker
+
+MAX_AGE = timedelta(days=7)
+
+
+class TestMaintenance:
+    @pytest.fixture(autouse=True)
+    async def users(self) -> AsyncGenerator[dict[str, int], None]:
+        old, new = datetime.utcnow() - MAX_AGE * 2, datetime.utcnow()
+        async with async_session_maker() as session:
+            result = await session.execute(
+                insert(User).returning(User.username, User.id),
+                [
+                    {
+                        'username': name,
+                        'email': f'{name}@test.ru',
+                        'password': 'test',
+                        'registered_at': registered_at,
+                        'is_verified': is_verified,
+                    }
+                    for name, registered_at, is_verified in [
+                        ('owner', old, True),
+                        ('verified', old, True),
+                        ('fresh', new, False),
+                        ('author', old, False),
+                        *[(f'stale{number}', old, False) for number in range(5)],
+                    ]
+                ],
+            )
+            users = dict(result.all())
+            await session.execute(
+                insert(Post).values(user_id=users['author'], title='test', content='test'),
+            )
+            now = datetime.utcnow()
+            await session.execute(
+                insert(RefreshToken),
+                [
+                    {
+                        'user_id': users['owner'],
+                        'family_id': 'family',
+                        'token_hash': JWTRepository.hash_token(f'token{number}'),
+                        'expires_at': now + timedelta(minutes=1 if number % 3 else -1),
+                    }
+                    for number in range(10)
+                ],
+            )
+            await session.commit()
+        yield users
+        async with async_session_maker() as session:
+            ids = list(users.values())
+            await session.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(ids)))
+            await session.execute(delete(Post).where(Post.user_id.in_(ids)))
+            await session.execute(delete(User).where(User.id.in_(ids)))
+            await session.commit()
+
+    async def test_reap(self, session: AsyncSession, users: dict[str, int]):
+        report = await MaintenanceService(UnitOfWork(session)).reap(MAX_AGE, batch_size=2)
+        assert report['refresh_tokens'] == 4
+        assert report['unverified_users'] == 5
+        assert report['seconds'] >= 0
+
+        result = await session.execute(
+            select(User.username).where(User.id.in_(users.values())).order_by(User.id),
+        )
+        assert result.scalars().all() == ['owner', 'verified', 'fresh', 'author']
+        result = await session.execute(
+            select(RefreshToken.expires_at).where(RefreshToken.user_id == users['owner']),
+        )
+        expiries = result.scalars().all()
+        assert len(expiries) == 6
+        assert min(expiries) > datetime.utcnow()
+
+    async def test_nothing_to_reap(self, session: AsyncSession):
+        service = MaintenanceService(UnitOfWork(session))
+        await service.reap(MAX_AGE, batch_size=2)
+        report = await service.reap(MAX_AGE, batch_size=2)
+        assert (report['refresh_tokens'], report['unverified_users']) == (0, 0)
@@ -0,0 +1,84 @@
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.services.media import MediaService
+from app.infrastructure.db.models.posts import Post
+from app.infrastructure.db.models.users import User
+from app.infrastructure.db.uow import UnitOfWork
+from tests.conftest import async_session_maker
+
+GRACE = timedelta(hours=1)
+REFERENCED = ['media/legacy.jpg', 'media/aa/bb/thumbnail.jpg', 'media/aa/bb/thumbnail.webp']
+ORPHANS = ['media/cc/dd/orphan.jpg', 'media/cc/dd/orphan.webp']
+
+
+class TestMediaGarbageCollector:
+    @pytest.fixture(scope='class', autouse=True)
+    async def setup(self):
+        async with async_session_maker() as session:
+            user_id = await session.scalar(
+                insert(User)
+                .values(username='media', email='media@test.ru', password='test')
+                .returning(User.id),
+            )
+            await session.execute(
+                insert(Post),
+                [
+                    {'user_id': user_id, 'title': 'legacy', 'content': '', 'image': REFERENCED[0]},
+                    {
+                        'user_id': user_id,
+                        'title': 'variants',
+                        'content': '',
+                        'image': REFERENCED[1],
+                        'image_variants': {
+                            'thumbnail': {
+                                'width': 1,
+                                'height': 1,
+                                'jpeg': REFERENCED[1],
+                                'webp': REFERENCED[2],
+                            },
+                        },
+                    },
+                    {'user_id': user_id, 'title': 'no image', 'content': ''},
+                ],
+            )
+            await session.commit()
+
+    @pytest.fixture
+    def root_dir(self, tmp_path: Path) -> Path:
+        old = time.time() - GRACE.total_seconds() * 2
+        for path in [*REFERENCED, *ORPHANS, 'media/fresh.jpg', 'media/.gitkeep']:
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_bytes(b'x' * 10)
+            if path != 'media/fresh.jpg':
+                os.utime(tmp_path / path, (old, old))
+        return tmp_path
+
+    async def test_collect_garbage(self, session: AsyncSession, root_dir: Path):
+        media_service = MediaService(UnitOfWork(session))
+        report = await media_service.collect_garbage(str(root_dir), 'media/', GRACE, batch_size=1)
+        assert report['referenced'] == 3
+        assert report['scanned'] == 6
+        assert (report['deleted'], report['bytes_reclaimed']) == (2, 20)
+        assert report['seconds'] >= 0
+        assert sorted(
+            str(path.relative_to(root_dir)) for path in root_dir.rglob('*') if path.is_file()
+        ) == sorted([*REFERENCED, 'media/fresh.jpg', 'media/.gitkeep'])
+
+    async def test_dry_run(self, session: AsyncSession, root_dir: Path):
+        media_service = MediaService(UnitOfWork(session))
+        report = await media_service.collect_garbage(
+            str(root_dir),
+            'media/',
+            GRACE,
+            batch_size=1,
+            dry_run=True,
+        )
+        assert (report['deleted'], report['bytes_reclaimed']) == (2, 20)
+        assert all((root_dir / path).exists() for path in ORPHANS)
@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import anyio
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, insert, select
+
+from app.domain.services.outbox import OutboxDispatcher, OutboxService
+from app.infrastructure.db.models.outbox import OutboxMessage
+from app.infrastructure.db.uow import UnitOfWork
+from app.main.main import app
+from tests.conftest import async_session_maker
+
+
+class RecordingPublisher:
+    def __init__(self, fail_topics: tuple[str, ...] = ()):
+        self.fail_topics = fail_topics
+        self.published: list[tuple[str, list[dict]]] = []
+
+    def __call__(self, topic: str, payloads: list[dict]) -> None:
+        if topic in self.fail_topics:
+            raise ConnectionError('broker is down')
+        self.published.append((topic, payloads))
+
+
+async def add_messages(*topics: str) -> None:
+    async with async_session_maker() as session:
+        await session.execute(
+            insert(OutboxMessage),
+            [
+                {'topic': topic, 'payload': {'number': number}}
+                for number, topic in enumerate(topics)
+            ],
+        )
+        await session.commit()
+
+
+async def get_messages() -> list[OutboxMessage]:
+    async with async_session_maker() as session:
+        result = await session.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+        return list(result.scalars().all())
+
+
+async def dispatch(publish: RecordingPublisher, batch_size: int = 100) -> int:
+    async with async_session_maker() as session:
+        return await OutboxService(UnitOfWork(session)).dispatch(
+            publish,
+            batch_size=batch_size,
+            lease_seconds=60,
+            retry_seconds=5,
+            max_retry_seconds=60,
+        )
+
+
+class TestOutbox:
+    @pytest.fixture(autouse=True)
+    async def clear_outbox(self):
+        async with async_session_maker() as session:
+            await session.execute(delete(OutboxMessage))
+            await session.commit()
+
+    async def test_registration_queues_verify_message(self, client: AsyncClient):
+        response = await client.post(
+            url=app.url_path_for('registration'),
+            json={
+                'username': 'outbox',
+                'email': 'outbox@test.ru',
+                'password1': 'test',
+                'password2': 'test',
+            },
+        )
+        assert response.status_code == 201
+        [message] = await get_messages()
+        assert message.topic == 'mail.send_batch'
+        assert message.payload['to'] == 'outbox@test.ru'
+        assert '/users/activate/' in message.payload['body']
+
+    async def test_one_task_per_topic(self):
+        await add_messages('mail.send_batch', 'other', 'mail.send_batch')
+        publish = RecordingPublisher()
+        assert await dispatch(publish) == 3
+        assert publish.published == [
+            ('mail.send_batch', [{'number': 0}, {'number': 2}]),
+            ('other', [{'number': 1}]),
+        ]
+        assert await get_messages() == []
+
+    async def test_failed_publish_is_postponed(self):
+        await add_messages('mail.send_batch', 'other')
+        started = datetime.utcnow()
+        publish = RecordingPublisher(fail_topics=('mail.send_batch',))
+        assert await dispatch(publish) == 2
+        assert publish.published == [('other', [{'number': 1}])]
+        [message] = await get_messages()
+        assert message.attempts == 1
+        assert message.available_at > started
+        assert await dispatch(RecordingPublisher()) == 0
+
+    async def test_concurrent_dispatchers_skip_locked_rows(self):
+        await add_messages(*['mail.send_batch'] * 4)
+        async with async_session_maker() as session:
+            now = datetime.utcnow()
+            claimed = await UnitOfWork(session).outbox_repo.claim(now, 2, now)
+            publish = RecordingPublisher()
+            assert await dispatch(publish) == 2
+            assert publish.published == [('mail.send_batch', [{'number': 2}, {'number': 3}])]
+            assert [message.payload['number'] for message in claimed] == [0, 1]
+
+    async def test_claimed_rows_are_leased(self):
+        await add_messages('mail.send_batch', 'other')
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=60)
+        async with async_session_maker() as session:
+            uow = UnitOfWork(session)
+            assert len(await uow.outbox_repo.claim(now, 10, lease_until)) == 2
+            await uow.commit()
+
+        assert await dispatch(RecordingPublisher()) == 0
+        async with async_session_maker() as session:
+            uow = UnitOfWork(session)
+            assert await uow.outbox_repo.claim(lease_until - timedelta(seconds=1), 10, now) == []
+            assert len(await uow.outbox_repo.claim(lease_until, 10, now)) == 2
+
+    async def test_publish_runs_after_claim_is_committed(self):
+        await add_messages('mail.send_batch')
+        leased = []
+
+        def publish(topic: str, payloads: list[dict]) -> None:
+            leased.extend(anyio.from_thread.run(get_messages))
+
+        assert await dispatch(publish) == 1
+        [message] = leased
+        assert message.available_at > datetime.utcnow()
+
+    async def test_dispatcher_drains_in_background(self):
+        await add_messages(*['mail.send_batch'] * 5)
+        publish = RecordingPublisher()
+        dispatcher = OutboxDispatcher(
+            async_session_maker,
+            publish,
+            batch_size=2,
+            poll_seconds=60,
+            lease_seconds=60,
+            retry_seconds=5,
+            max_retry_seconds=60,
+        )
+        await dispatcher.start()
+        for _ in range(100):
+            if len(publish.published) == 3 and await get_messages() == []:
+                break
+            await asyncio.sleep(0.01)
+        await dispatcher.stop()
+        assert [len(payloads) for _, payloads in publish.published] == [2, 2, 1]
+        assert await get_messages() == []
@@ -0,0 +1,149 @@
+import json
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.managers.users import UserManager
+from app.infrastructure.db.interfaces.repositories.posts import PostLoadStrategy
+from app.infrastructure.db.models.jwt import RefreshToken
+from app.infrastructure.db.models.posts import Post
+from app.infrastructure.db.models.tags import PostTag, Tag
+from app.infrastructure.db.models.users import User
+from app.infrastructure.db.models.versions import EntityName
+from app.infrastructure.db.repositories.jwt import JWTRepository
+from app.infrastructure.db.repositories.posts import PostRepository
+from app.infrastructure.db.repositories.tags import TagRepository
+from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.repositories.versions import EntityVersionRepository
+from tests.conftest import async_session_maker, test_engine
+
+REPOSITORY_CALLS = {
+    'post.get_posts': lambda s: PostRepository(s).get_posts(10),
+    'post.get_posts.joined': lambda s: PostRepository(s).get_posts(
+        10,
+        load_strategy=PostLoadStrategy.JOINED,
+    ),
+    'post.get_posts.cursor': lambda s: PostRepository(s).get_posts(
+        10,
+        cursor=(datetime.utcnow(), 10),
+    ),
+    'post.get_user_posts': lambda s: PostRepository(s).get_user_posts(1, 10),
+    'post.get_post': lambda s: PostRepository(s).get_post(1),
+    'post.return_author_id': lambda s: PostRepository(s).return_author_id(1),
+    'tag.return_author_id': lambda s: TagRepository(s).return_author_id(1),
+    'tag.get_post_tags': lambda s: TagRepository(s).get_post_tags(1),
+    'tag.get_post_tag_id': lambda s: TagRepository(s).get_post_tag_id(1, 1),
+    'tag.check_post_author': lambda s: TagRepository(s).check_post_author(1),
+    'jwt.is_superuser': lambda s: JWTRepository(s).is_superuser(1),
+    'jwt.delete_refresh_token': lambda s: JWTRepository(s).delete_refresh_token(
+        1,
+        'family1',
+        'token1',
+    ),
+    'jwt.delete_refresh_token_family': lambda s: JWTRepository(s).delete_refresh_token_family(
+        1,
+        'family1',
+    ),
+    'jwt.delete_expired_refresh_tokens': lambda s: JWTRepository(
+        s,
+    ).delete_expired_refresh_tokens(datetime.utcnow(), 100),
+    'user.get_info_for_authenticate': lambda s: UserRepository(s).get_info_for_authenticate(
+        'test1@test.ru',
+    ),
+    'user.get_user': lambda s: UserRepository(s).get_user(1),
+    'version.get_versions': lambda s: EntityVersionRepository(s).get_versions(
+        [EntityName.POST, EntityName.TAG],
+    ),
+}
+
+
+class TestQueryPlans:
+    @pytest.fixture(scope='module', autouse=True)
+    async def setup(self):
+        async with async_session_maker() as session:
+            await session.execute(
+                insert(User),
+                [
+                    {
+                        'username': 'test',
+                        'email': f'test{i}@test.ru',
+                        'password': UserManager.make_password('test'),
+                    }
+                    for i in range(1, 3)
+                ],
+            )
+            await session.execute(
+                insert(Post),
+                [
+                    {
+                        'user_id': i % 2 + 1,
+                        'title': 'test',
+                        'content': 'test',
+                        'published': i % 3 > 0,
+                    }
+                    for i in range(50)
+                ],
+            )
+            await session.execute(insert(Tag), [{'user_id': 1, 'name': 'test'}] * 5)
+            await session.execute(
+                insert(PostTag),
+                [{'post_id': i // 5 + 1, 'tag_id': i % 5 + 1} for i in range(100)],
+            )
+            await session.execute(
+                insert(RefreshToken),
+                [
+                    {
+                        'user_id': i % 2 + 1,
+                        'family_id': f'family{i % 4}',
+                        'token_hash': JWTRepository.hash_token(f'token{i}'),
+                        'expires_at': datetime.utcnow() + timedelta(minutes=i - 10),
+                    }
+                    for i in range(20)
+                ],
+            )
+            await session.commit()
+
+    @staticmethod
+    async def capture_statements(call: Callable[[AsyncSession], Awaitable]) -> list:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(test_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            async with async_session_maker() as session:
+                await call(session)
+                await session.rollback()
+        finally:
+            event.remove(test_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+        return statements
+
+    @staticmethod
+    def get_node_types(plan: dict) -> set:
+        node_types = {plan['Node Type']}
+        for subplan in plan.get('Plans', []):
+            node_types |= TestQueryPlans.get_node_types(subplan)
+        return node_types
+
+    @pytest.mark.parametrize('call_name', REPOSITORY_CALLS)
+    async def test_no_seq_scan(self, call_name: str):
+        statements = await self.capture_statements(REPOSITORY_CALLS[call_name])
+        assert statements
+
+        async with test_engine.connect() as conn:
+            await conn.execute(text('SET enable_seqscan = off'))
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(
+                    'EXPLAIN (FORMAT JSON) %s' % statement,
+                    parameters,
+                )
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                node_types = self.get_node_types(plan[0]['Plan'])
+                assert 'Seq Scan' not in node_types, statement
+            await conn.rollback()
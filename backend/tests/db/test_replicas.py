@@ -0,0 +1,144 @@
+import os
+from functools import partial
+from itertools import cycle
+from typing import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.cache import namespaces
+from app.infrastructure.cache.response_cache import get_response_cache_stub
+from app.infrastructure.db.database import (
+    get_read_session_stub,
+    get_stream_session_maker_stub,
+)
+from app.infrastructure.db.uow import UnitOfWork
+from app.main.di.dependencies.uow import get_read_session
+from app.main.main import app
+from app.main.middlewares.replicas import PRIMARY_STICKY_COOKIE, PrimaryStickyMiddleware
+from tests.conftest import create_test_async_session_maker, test_engine
+
+replica_engine = create_async_engine(os.environ['test_db_uri'], poolclass=NullPool)
+replica_session_maker = create_test_async_session_maker(replica_engine)
+
+
+class StatementCounter:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine.sync_engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine.sync_engine, 'before_cursor_execute', self)
+
+
+class TestReplicas:
+    @pytest.fixture(scope='module', autouse=True)
+    def replica_overrides(self):
+        read_session_override = app.dependency_overrides[get_read_session_stub]
+        app.dependency_overrides[get_read_session_stub] = partial(
+            get_read_session,
+            cycle([replica_session_maker]),
+        )
+        yield
+        app.dependency_overrides[get_read_session_stub] = read_session_override
+
+    @pytest.fixture
+    def counters(self):
+        with StatementCounter(test_engine) as primary, StatementCounter(replica_engine) as replica:
+            yield primary, replica
+
+    @pytest.fixture
+    async def sticky_client(self) -> AsyncGenerator[AsyncClient, None]:
+        async with AsyncClient(
+            app=PrimaryStickyMiddleware(app, sticky_seconds=5),
+            base_url='http://test',
+        ) as client:
+            yield client
+
+    async def test_uow_routes_reads_to_replica(self, session: AsyncSession, counters: tuple):
+        primary, replica = counters
+        async with replica_session_maker() as read_session:
+            uow = UnitOfWork(session, read_session)
+            await uow.post_repo.get_posts(10)
+            await uow.tag_repo.get_tags()
+            await uow.user_repo.get_users()
+            assert primary.count == 0
+            assert replica.count > 0
+
+            replica.count = 0
+            await uow.user_repo.is_user_exists_by_email('test@test.ru')
+            await uow.rollback()
+            assert primary.count > 0
+            assert replica.count == 0
+
+    async def test_uow_without_replica(self, session: AsyncSession):
+        uow = UnitOfWork(session)
+        assert uow.post_repo.read_session is session
+
+    async def test_read_your_writes(self, sticky_client: AsyncClient, counters: tuple):
+        primary, replica = counters
+        response = await sticky_client.get(app.url_path_for('get_tags'))
+        assert response.status_code == 200
+        assert replica.count > 0
+        assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+        response = await sticky_client.post(
+            app.url_path_for('registration'),
+            json={
+                'username': 'test',
+                'email': 'replica@test.ru',
+                'password1': 'test',
+                'password2': 'test',
+            },
+        )
+        assert response.status_code == 201
+        assert response.cookies.get(PRIMARY_STICKY_COOKIE)
+
+        primary.count, replica.count = 0, 0
+        response = await sticky_client.get(app.url_path_for('get_tags'))
+        assert response.status_code == 200
+        assert primary.count > 0
+        assert replica.count == 0
+
+    async def test_cache_is_filled_from_primary(self, client: AsyncClient, counters: tuple):
+        primary, replica = counters
+        await app.dependency_overrides[get_response_cache_stub]().invalidate(namespaces.TAGS)
+        response = await client.get(app.url_path_for('get_tags'))
+        assert response.status_code == 200
+        assert primary.count > 0
+
+        primary.count = 0
+        response = await client.get(app.url_path_for('get_tags'))
+        assert response.status_code == 200
+        assert primary.count == 0
+        assert replica.count > 0
+
+    async def test_stream_reads_in_own_session(self, client: AsyncClient, counters: tuple):
+        _, replica = counters
+        stream_session_override = app.dependency_overrides[get_stream_session_maker_stub]
+        app.dependency_overrides[get_stream_session_maker_stub] = lambda: replica_session_maker
+        try:
+            response = await client.get(
+                app.url_path_for('get_posts'),
+                params={'stream': 'ndjson'},
+                cookies={PRIMARY_STICKY_COOKIE: '1'},
+            )
+        finally:
+            app.dependency_overrides[get_stream_session_maker_stub] = stream_session_override
+        assert response.status_code == 200
+        assert replica.count > 0
+
+    async def test_failed_write_is_not_sticky(self, sticky_client: AsyncClient):
+        response = await sticky_client.post(app.url_path_for('registration'), json={})
+        assert response.status_code == 422
+        assert PRIMARY_STICKY_COOKIE not in response.cookies
@@ -0,0 +1,47 @@
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+
+from app.domain.exceptions.images import ImageTooLarge, InvalidImageType
+from app.domain.utils.upload_image import CHUNK_SIZE, read_image, sniff_image_type
+from tests.application.test_image_processor import make_image
+
+
+@pytest.mark.parametrize(
+    'head, content_type',
+    [
+        (make_image((10, 10), 'JPEG'), 'image/jpeg'),
+        (make_image((10, 10), 'PNG'), 'image/png'),
+        (make_image((10, 10), 'WEBP'), 'image/webp'),
+        (make_image((10, 10), 'GIF'), None),
+        (b'RIFF\x00\x00\x00\x00WAVE', None),
+        (b'<svg xmlns="http://www.w3.org/2000/svg"/>', None),
+        (b'', None),
+    ],
+    ids=['jpeg', 'png', 'webp', 'gif', 'wav', 'svg', 'empty'],
+)
+def test_sniff_image_type(head: bytes, content_type: str | None):
+    assert sniff_image_type(head) == content_type
+
+
+class TestReadImage:
+    async def test_read(self):
+        image = make_image((10, 10))
+        assert await read_image(UploadFile(BytesIO(image)), len(image)) == image
+
+    @pytest.mark.parametrize('declared', [True, False], ids=['declared', 'streamed'])
+    async def test_over_limit(self, declared: bool):
+        data = b'\x89PNG\r\n\x1a\n' + b'\x00' * CHUNK_SIZE * 3
+        stream = BytesIO(data)
+        upload = UploadFile(stream, size=len(data) if declared else None)
+        with pytest.raises(ImageTooLarge):
+            await read_image(upload, CHUNK_SIZE * 2)
+        assert stream.tell() == (0 if declared else CHUNK_SIZE * 3)
+
+    @pytest.mark.parametrize('data', [b'', b'GIF89a' + b'\x00' * CHUNK_SIZE * 3])
+    async def test_not_an_image(self, data: bytes):
+        stream = BytesIO(data)
+        with pytest.raises(InvalidImageType):
+            await read_image(UploadFile(stream), CHUNK_SIZE)
+        assert stream.tell() <= CHUNK_SIZE
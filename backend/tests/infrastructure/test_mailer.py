@@ -0,0 +1,143 @@
+import socket
+import time
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.domain.tasks import mail
+from app.domain.tasks.mail import build_message, send_emails
+from app.infrastructure.mail.exceptions import MailDeliveryError
+from app.infrastructure.mail.mailers.smtp import SMTPMailer
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class RecordingHandler:
+    """DELIVERED MESSAGES, THEIR CONNECTIONS AND REPLIES TO SEND INSTEAD OF 250"""
+
+    def __init__(self):
+        self.messages: list[bytes] = []
+        self.peers: set[tuple] = set()
+        self.data_replies: list[str] = []
+
+    async def handle_RCPT(self, server, session, envelope, address: str, rcpt_options) -> str:
+        if address.startswith('rejected'):
+            return '550 No such user'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.peers.add(session.peer)
+        if self.data_replies:
+            return self.data_replies.pop(0)
+        self.messages.append(envelope.content)
+        return '250 OK'
+
+
+def make_messages(count: int, prefix: str = 'user') -> list[EmailMessage]:
+    return [
+        build_message(f'{prefix}{number}@test.ru', 'subject', 'body') for number in range(count)
+    ]
+
+
+class TestSMTPMailer:
+    @pytest.fixture
+    def handler(self) -> RecordingHandler:
+        return RecordingHandler()
+
+    @pytest.fixture
+    def port(self, handler: RecordingHandler) -> int:
+        controller = Controller(handler, hostname='127.0.0.1', port=get_free_port())
+        controller.start()
+        yield controller.port
+        controller.stop()
+
+    @pytest.fixture
+    def mailer(self, port: int) -> SMTPMailer:
+        mailer = SMTPMailer('127.0.0.1', port, starttls=False, retries=2, backoff_seconds=0)
+        yield mailer
+        mailer.close()
+
+    def test_batch_over_one_connection(self, mailer: SMTPMailer, handler: RecordingHandler):
+        assert mailer.send_batch(make_messages(5)) == 5
+        assert mailer.send_batch(make_messages(2)) == 2
+        assert len(handler.messages) == 7
+        assert len(handler.peers) == 1
+        assert mailer.connections_opened == 1
+
+    def test_connection_is_recycled(self, mailer: SMTPMailer, handler: RecordingHandler):
+        mailer.max_messages_per_connection = 2
+        assert mailer.send_batch(make_messages(5)) == 5
+        assert len(handler.peers) == mailer.connections_opened == 3
+
+    def test_dead_idle_connection_is_replaced(
+        self,
+        mailer: SMTPMailer,
+        handler: RecordingHandler,
+    ):
+        mailer.send_batch(make_messages(1))
+        mailer.connection.sock.shutdown(socket.SHUT_RDWR)
+        mailer.idle_seconds = 0
+        assert mailer.send_batch(make_messages(1)) == 1
+        assert mailer.connections_opened == 2
+
+    def test_transient_failure_is_retried(self, mailer: SMTPMailer, handler: RecordingHandler):
+        handler.data_replies = ['451 Try again later']
+        assert mailer.send_batch(make_messages(3)) == 3
+        assert len(handler.messages) == 3
+        assert mailer.connections_opened == 2
+
+    def test_rejected_recipient_is_dropped(self, mailer: SMTPMailer, handler: RecordingHandler):
+        messages = make_messages(2) + make_messages(1, prefix='rejected') + make_messages(1)
+        assert mailer.send_batch(messages) == 3
+        assert len(handler.messages) == 3
+
+    def test_authentication_failure_keeps_the_batch(self, port: int):
+        mailer = SMTPMailer('127.0.0.1', port, username='user', password='', starttls=False)
+        messages = make_messages(2)
+        with pytest.raises(MailDeliveryError) as ex:
+            mailer.send_batch(messages)
+        assert ex.value.unsent == messages
+
+    def test_unavailable_server(self, handler: RecordingHandler):
+        mailer = SMTPMailer('127.0.0.1', get_free_port(), starttls=False, backoff_seconds=0)
+        messages = make_messages(3)
+        with pytest.raises(MailDeliveryError) as ex:
+            mailer.send_batch(messages)
+        assert ex.value.unsent == messages
+
+    def test_rate_limit(self, mailer: SMTPMailer, handler: RecordingHandler):
+        mailer.send_batch(make_messages(1))
+        mailer.rate_limiter.rate = 20
+        started = time.monotonic()
+        assert mailer.send_batch(make_messages(5)) == 5
+        assert time.monotonic() - started >= 0.2
+
+
+class TestSendEmailsTask:
+    def test_unsent_rest_is_retried(self, monkeypatch: pytest.MonkeyPatch):
+        messages = [
+            {'to': f'user{number}@test.ru', 'subject': '', 'body': ''} for number in range(4)
+        ]
+
+        class FailingMailer:
+            def send_batch(self, batch: list[EmailMessage]) -> int:
+                raise MailDeliveryError(batch[2:])
+
+        retries = []
+
+        def retry(**kwargs) -> Exception:
+            retries.append(kwargs)
+            return RuntimeError('retry')
+
+        monkeypatch.setattr(mail, 'get_mailer', FailingMailer)
+        monkeypatch.setattr(send_emails, 'retry', retry)
+        with pytest.raises(RuntimeError):
+            send_emails(messages)
+        assert retries[0]['args'] == (messages[2:],)
+        assert retries[0]['countdown'] == mail.mail_config.MAIL_TASK_BACKOFF_SECONDS
@@ -0,0 +1,35 @@
+from prometheus_client import REGISTRY
+
+from app.infrastructure.db.metrics import InstrumentedAsyncAdaptedQueuePool
+
+
+def sample(name: str, pool: str):
+    return REGISTRY.get_sample_value(name, {'pool': pool})
+
+
+def test_bounded_pool_reports_saturation():
+    pool = InstrumentedAsyncAdaptedQueuePool(
+        lambda: None,
+        pool_size=2,
+        max_overflow=2,
+        logging_name='bounded_test',
+    )
+    pool.update_metrics()
+    assert sample('db_pool_size', 'bounded_test') == 4
+    assert sample('db_pool_saturation', 'bounded_test') == 0
+
+
+def test_unbounded_pool_reports_no_saturation():
+    for logging_name, pool_size, max_overflow in (
+        ('no_overflow_limit_test', 5, -1),
+        ('no_size_limit_test', 0, 0),
+    ):
+        pool = InstrumentedAsyncAdaptedQueuePool(
+            lambda: None,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            logging_name=logging_name,
+        )
+        pool.update_metrics()
+        assert sample('db_pool_checked_out_connections', logging_name) == 0
+        assert sample('db_pool_saturation', logging_name) is None
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.models.jwt import RefreshToken
+from app.infrastructure.db.models.users import User
+from app.infrastructure.db.uow import UnitOfWork
+from app.infrastructure.tokens.interfaces.refresh_tokens import (
+    RefreshTokenRepositoryInterface,
+)
+from app.infrastructure.tokens.repositories.postgres import (
+    PostgresRefreshTokenRepository,
+)
+from app.infrastructure.tokens.repositories.redis import RedisRefreshTokenRepository
+
+TTL = 60
+
+
+class TestRefreshTokenRepository:
+    """THE SAME CONTRACT FOR BOTH BACKENDS, POSTGRES ROWS STAY IN THE UNCOMMITTED SESSION"""
+
+    @pytest.fixture(params=['postgres', 'redis'])
+    async def repo_and_user_id(
+        self,
+        request,
+        session: AsyncSession,
+    ) -> tuple[RefreshTokenRepositoryInterface, int]:
+        if request.param == 'redis':
+            return RedisRefreshTokenRepository(FakeRedis(server=FakeServer())), 1
+        result = await session.execute(
+            insert(User)
+            .values(username='test', email='refresh@test.ru', password='test')
+            .returning(User.id),
+        )
+        return PostgresRefreshTokenRepository(UnitOfWork(session).jwt_repo), result.scalar_one()
+
+    async def test_rotate(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        await repo.save(user_id, 'family', 'token1', TTL)
+        assert await repo.rotate(user_id, 'family', 'token1', 'token2', TTL)
+        assert await repo.rotate(user_id, 'family', 'token2', 'token3', TTL)
+
+    async def test_reuse_revokes_family(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        await repo.save(user_id, 'family', 'token1', TTL)
+        assert await repo.rotate(user_id, 'family', 'token1', 'token2', TTL)
+        assert not await repo.rotate(user_id, 'family', 'token1', 'stolen', TTL)
+        assert not await repo.rotate(user_id, 'family', 'token2', 'token3', TTL)
+        assert not await repo.rotate(user_id, 'family', 'stolen', 'token3', TTL)
+
+    async def test_revoke(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        await repo.save(user_id, 'family', 'token1', TTL)
+        await repo.revoke(user_id, 'family', 'token1')
+        assert not await repo.rotate(user_id, 'family', 'token1', 'token2', TTL)
+        await repo.revoke(user_id, 'family', 'token1')
+
+    async def test_unknown_token(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        assert not await repo.rotate(user_id, 'family', 'unknown', 'token', TTL)
+
+    async def test_reuse_keeps_other_families(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        await repo.save(user_id, 'phone', 'phone1', TTL)
+        await repo.save(user_id, 'laptop', 'laptop1', TTL)
+        await repo.rotate(user_id, 'phone', 'phone1', 'phone2', TTL)
+        assert not await repo.rotate(user_id, 'phone', 'phone1', 'stolen', TTL)
+        assert not await repo.rotate(user_id, 'phone', 'phone2', 'phone3', TTL)
+        assert await repo.rotate(user_id, 'laptop', 'laptop1', 'laptop2', TTL)
+
+    async def test_token_of_other_family(self, repo_and_user_id: tuple):
+        repo, user_id = repo_and_user_id
+        await repo.save(user_id, 'phone', 'phone1', TTL)
+        assert not await repo.rotate(user_id, 'laptop', 'phone1', 'token', TTL)
+
+
+class TestPostgresRefreshTokenRepository:
+    async def test_stores_hash_and_expiry(self, session: AsyncSession):
+        result = await session.execute(
+            insert(User)
+            .values(username='test', email='refresh@test.ru', password='test')
+            .returning(User.id),
+        )
+        user_id = result.scalar_one()
+        jwt_repo = UnitOfWork(session).jwt_repo
+        await PostgresRefreshTokenRepository(jwt_repo).save(user_id, 'family', 'token1', TTL)
+
+        row = (await session.execute(select(RefreshToken))).scalar_one()
+        assert row.token_hash == jwt_repo.hash_token('token1') != b'token1'
+        assert len(row.token_hash) == 32
+        assert row.family_id == 'family'
+        expires_in = row.expires_at - datetime.utcnow()
+        assert timedelta(seconds=TTL - 5) < expires_in <= timedelta(seconds=TTL)
+
+
+class TestRedisRefreshTokenRepository:
+    @pytest.fixture
+    def client(self) -> FakeRedis:
+        return FakeRedis(server=FakeServer())
+
+    async def test_expiry(self, client: FakeRedis):
+        repo = RedisRefreshTokenRepository(client)
+        await repo.save(1, 'family', 'token1', TTL)
+        await repo.rotate(1, 'family', 'token1', 'token2', TTL * 2)
+        token_key = repo.token_key(repo.hash_token('token2'))
+        assert 0 < await client.ttl(token_key) <= TTL * 2
+        assert 0 < await client.ttl(repo.family_key('family')) <= TTL * 2
+        assert not await client.exists(repo.token_key(repo.hash_token('token1')))
+        family = await client.smembers(repo.family_key('family'))
+        assert family == {repo.hash_token('token2').encode()}
+
+    async def test_reuse_deletes_family_keys(self, client: FakeRedis):
+        repo = RedisRefreshTokenRepository(client)
+        await repo.save(1, 'phone', 'phone1', TTL)
+        await repo.save(1, 'laptop', 'laptop1', TTL)
+        await repo.rotate(1, 'phone', 'phone1', 'phone2', TTL)
+        assert not await repo.rotate(1, 'phone', 'phone1', 'stolen', TTL)
+        assert await client.keys('refresh:*phone*') == []
+        assert await client.exists(repo.family_key('laptop'))
@@ -0,0 +1,200 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from prometheus_client import REGISTRY
+
+from app.domain.exceptions.base import NotFound
+from app.infrastructure.cache.backends.memory import MemoryCacheBackend
+from app.infrastructure.cache.backends.redis import RedisCacheBackend
+from app.infrastructure.cache.response_cache import ResponseCache, RoutedResponseCache
+
+
+class Factory:
+    def __init__(self, content: bytes = b'[]'):
+        self.content = content
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.content
+
+
+def get_requests_count(name: str, result: str) -> float:
+    value = REGISTRY.get_sample_value(
+        'response_cache_requests_total',
+        {'name': name, 'result': result},
+    )
+    return value or 0
+
+
+class TestResponseCache:
+    @pytest.fixture(params=['memory', 'redis'])
+    def response_cache(self, request) -> ResponseCache:
+        if request.param == 'memory':
+            backend = MemoryCacheBackend(max_entries=100)
+        else:
+            backend = RedisCacheBackend(FakeRedis(server=FakeServer()))
+        return ResponseCache(backend, ttl=60)
+
+    async def test_hit_and_miss(self, response_cache: ResponseCache):
+        factory = Factory()
+        hits, misses = get_requests_count('tags', 'hit'), get_requests_count('tags', 'miss')
+        for _ in range(3):
+            assert await response_cache.get_or_set('tags', ['tags'], factory) == b'[]'
+        assert factory.calls == 1
+        assert get_requests_count('tags', 'hit') - hits == 2
+        assert get_requests_count('tags', 'miss') - misses == 1
+
+    async def test_invalidate_only_affected_namespaces(self, response_cache: ResponseCache):
+        first, second = Factory(), Factory()
+        await response_cache.get_or_set('post:1', ['post:1', 'tag_names'], first)
+        await response_cache.get_or_set('post:2', ['post:2', 'tag_names'], second)
+
+        await response_cache.invalidate('post:1')
+        await response_cache.get_or_set('post:1', ['post:1', 'tag_names'], first)
+        await response_cache.get_or_set('post:2', ['post:2', 'tag_names'], second)
+        assert (first.calls, second.calls) == (2, 1)
+
+        await response_cache.invalidate('tag_names')
+        await response_cache.get_or_set('post:1', ['post:1', 'tag_names'], first)
+        await response_cache.get_or_set('post:2', ['post:2', 'tag_names'], second)
+        assert (first.calls, second.calls) == (3, 2)
+
+    async def test_concurrent_misses_share_one_call(self, response_cache: ResponseCache):
+        factory = Factory()
+        results = await asyncio.gather(
+            *[response_cache.get_or_set('posts', ['posts'], factory) for _ in range(5)],
+        )
+        assert results == [b'[]'] * 5
+        assert factory.calls == 1
+
+    async def test_cancelled_leader_does_not_fail_waiters(self, response_cache: ResponseCache):
+        started, factory = asyncio.Event(), Factory()
+
+        async def hanging() -> bytes:
+            started.set()
+            await asyncio.Event().wait()
+
+        leader = asyncio.create_task(response_cache.get_or_set('posts', ['posts'], hanging))
+        await started.wait()
+        waiter = asyncio.create_task(response_cache.get_or_set('posts', ['posts'], factory))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter == b'[]'
+        assert factory.calls == 1
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_failed_write_does_not_fail_waiters(
+        self,
+        response_cache: ResponseCache,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        await response_cache.get_versions(['posts'])
+
+        async def broken_set(*args) -> None:
+            raise ConnectionError
+
+        monkeypatch.setattr(response_cache.backend, 'set', broken_set)
+        factory = Factory()
+        results = await asyncio.gather(
+            *[response_cache.get_or_set('posts', ['posts'], factory) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], ConnectionError)
+        assert results[1:] == [b'[]'] * 2
+        assert factory.calls == 1
+
+    async def test_errors_are_not_cached(self, response_cache: ResponseCache):
+        async def not_found() -> bytes:
+            raise NotFound
+
+        with pytest.raises(NotFound):
+            await response_cache.get_or_set('post:3', ['post:3'], not_found)
+        factory = Factory()
+        await response_cache.get_or_set('post:3', ['post:3'], factory)
+        assert factory.calls == 1
+
+
+class PrimaryReadsRecorder:
+    def __init__(self):
+        self.reading_from_primary = False
+        self.primary_reads = 0
+
+    @contextmanager
+    def read_from_primary(self) -> Iterator[None]:
+        self.reading_from_primary = True
+        try:
+            yield
+        finally:
+            self.reading_from_primary = False
+
+
+class TestRoutedResponseCache:
+    @pytest.fixture
+    def response_cache(self) -> ResponseCache:
+        return ResponseCache(MemoryCacheBackend(max_entries=100), ttl=60)
+
+    async def test_sticky_clients_bypass_cache(self, response_cache: ResponseCache):
+        uow = PrimaryReadsRecorder()
+        routed = RoutedResponseCache(response_cache, uow, bypass=True)
+        await response_cache.get_or_set('tags', ['tags'], Factory(b'cached'))
+        factory = Factory(b'fresh')
+        assert await routed.get_or_set('tags', ['tags'], factory) == b'fresh'
+        assert await routed.get_or_set('tags:other', ['tags'], factory) == b'fresh'
+        assert factory.calls == 2
+        assert await response_cache.get_or_set('tags:other', ['tags'], Factory(b'')) == b''
+
+    async def test_misses_are_filled_from_primary(self, response_cache: ResponseCache):
+        uow = PrimaryReadsRecorder()
+        routed = RoutedResponseCache(response_cache, uow, bypass=False)
+
+        async def factory() -> bytes:
+            uow.primary_reads += uow.reading_from_primary
+            return b'[]'
+
+        for _ in range(2):
+            assert await routed.get_or_set('tags', ['tags'], factory) == b'[]'
+        assert uow.primary_reads == 1
+        assert not uow.reading_from_primary
+
+    async def test_invalidate_is_not_bypassed(self, response_cache: ResponseCache):
+        routed = RoutedResponseCache(response_cache, PrimaryReadsRecorder(), bypass=True)
+        factory = Factory()
+        await response_cache.get_or_set('tags', ['tags'], factory)
+        await routed.invalidate('tags')
+        await response_cache.get_or_set('tags', ['tags'], factory)
+        assert factory.calls == 2
+
+
+class TestMemoryCacheBackend:
+    async def test_lru_eviction(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set('a', b'a')
+        await backend.set('b', b'b')
+        await backend.get_many(['a'])
+        await backend.set('c', b'c')
+        assert await backend.get_many(['a', 'b', 'c']) == [b'a', None, b'c']
+
+    async def test_ttl(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set('a', b'a', ttl=0)
+        await backend.set('b', b'b', ttl=60)
+        assert await backend.get_many(['a', 'b']) == [None, b'b']
+        assert len(backend) == 1
+
+
+class TestRedisCacheBackend:
+    async def test_unavailable_redis_is_a_miss(self):
+        server = FakeServer()
+        server.connected = False
+        response_cache = ResponseCache(RedisCacheBackend(FakeRedis(server=server)), ttl=60)
+        factory = Factory()
+        for _ in range(2):
+            assert await response_cache.get_or_set('tags', ['tags'], factory) == b'[]'
+        assert factory.calls == 2
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from app.infrastructure.tasks.dispatchers.celery import CeleryTaskDispatcher
+
+
+class TestCeleryTaskDispatcher:
+    def test_celery_app_is_built_on_first_send(self):
+        dispatcher = CeleryTaskDispatcher('memory://')
+        assert dispatcher.app is None
+        dispatcher.send('mail.send_batch', [{'to': 'user@test.ru', 'subject': '', 'body': ''}])
+        with dispatcher.app.connection() as connection:
+            queue = connection.SimpleQueue('celery')
+            message = queue.get(timeout=1)
+            queue.close()
+        assert message.headers['task'] == 'mail.send_batch'
+        assert message.decode()[0] == [[{'to': 'user@test.ru', 'subject': '', 'body': ''}]]
+
+    def test_web_app_does_not_import_celery(self):
+        code = (
+            'import sys; import app.main.main; '
+            'print(sorted({"celery", "kombu", "app.main.celery"} & set(sys.modules)))'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=Path(__file__).parents[2] / 'src',
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == '[]'
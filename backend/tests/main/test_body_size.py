@@ -0,0 +1,46 @@
+import pytest
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+
+from app.main.middlewares.body_size import BodySizeLimitMiddleware
+
+MAX_BODY_SIZE = 100
+
+
+@pytest.fixture
+def client() -> AsyncClient:
+    app = FastAPI()
+
+    @app.post('/')
+    async def echo(request: Request) -> int:
+        return len(await request.body())
+
+    app.add_middleware(BodySizeLimitMiddleware, max_body_size=MAX_BODY_SIZE)
+    return AsyncClient(app=app, base_url='http://test')
+
+
+async def chunks(size: int, count: int):
+    for _ in range(count):
+        yield b'x' * size
+
+
+class TestBodySizeLimitMiddleware:
+    @pytest.mark.parametrize('size', [0, MAX_BODY_SIZE])
+    async def test_under_limit(self, client: AsyncClient, size: int):
+        response = await client.post('/', content=b'x' * size)
+        assert response.status_code == 200
+        assert response.json() == size
+
+    async def test_content_length_over_limit(self, client: AsyncClient):
+        response = await client.post('/', content=b'x' * (MAX_BODY_SIZE + 1))
+        assert response.status_code == 413
+        assert response.headers['connection'] == 'close'
+
+    async def test_chunked_over_limit(self, client: AsyncClient):
+        response = await client.post('/', content=chunks(MAX_BODY_SIZE // 2, 3))
+        assert response.status_code == 413
+
+    async def test_chunked_under_limit(self, client: AsyncClient):
+        response = await client.post('/', content=chunks(MAX_BODY_SIZE // 2, 2))
+        assert response.status_code == 200
+        assert response.json() == MAX_BODY_SIZE
@@ -0,0 +1,92 @@
+import pytest
+
+from app.main.config import (
+    ConfigParseError,
+    DatabaseConfig,
+    load_config,
+    load_database_config,
+    load_image_processor_config,
+)
+
+
+class TestDatabaseConfig:
+    @pytest.mark.parametrize(
+        'env, pool_size, max_overflow',
+        [
+            ({}, DatabaseConfig.DB_POOL_SIZE, DatabaseConfig.DB_MAX_OVERFLOW),
+            ({'DB_MAX_CONNECTIONS': '100', 'WEB_CONCURRENCY': '4'}, 25, 0),
+            ({'DB_MAX_CONNECTIONS': '3', 'WEB_CONCURRENCY': '8'}, 1, 0),
+            ({'DB_POOL_SIZE': '20', 'DB_MAX_OVERFLOW': '5'}, 20, 5),
+        ],
+    )
+    def test_pool_sizing(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict,
+        pool_size: int,
+        max_overflow: int,
+    ):
+        for key in ('DB_MAX_CONNECTIONS', 'WEB_CONCURRENCY', 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW'):
+            monkeypatch.delenv(key, raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        db_config = load_database_config()
+        assert db_config.DB_POOL_SIZE == pool_size
+        assert db_config.DB_MAX_OVERFLOW == max_overflow
+
+    def test_max_connections_wins(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        monkeypatch.setenv('DB_MAX_CONNECTIONS', '100')
+        monkeypatch.setenv('WEB_CONCURRENCY', '4')
+        monkeypatch.setenv('DB_POOL_SIZE', '5')
+        monkeypatch.setenv('DB_MAX_OVERFLOW', '10')
+
+        db_config = load_database_config()
+        assert (db_config.DB_POOL_SIZE, db_config.DB_MAX_OVERFLOW) == (25, 0)
+        assert 'DB_POOL_SIZE and DB_MAX_OVERFLOW are ignored' in caplog.text
+
+    def test_invalid_integer(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv('DB_POOL_SIZE', 'many')
+        with pytest.raises(ConfigParseError):
+            load_database_config()
+
+
+class TestConfig:
+    def test_asymmetric_algorithm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv('ALGORITHM', 'EdDSA')
+        monkeypatch.delenv('JWT_ACCESS_SECRET_KEY')
+        monkeypatch.delenv('JWT_ACCESS_KEYS_DIR', raising=False)
+        with pytest.raises(ConfigParseError):
+            load_config()
+
+        monkeypatch.setenv('JWT_ACCESS_KEYS_DIR', '/keys')
+        monkeypatch.setenv('JWT_ACCESS_KEY_ID', '2026-10')
+        config = load_config()
+        assert (config.JWT_ACCESS_KEYS_DIR, config.JWT_ACCESS_KEY_ID) == ('/keys', '2026-10')
+        assert config.symmetric_algorithm == 'HS256'
+
+    def test_symmetric_algorithm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv('ALGORITHM', 'HS512')
+        assert load_config().symmetric_algorithm == 'HS512'
+
+
+class TestImageProcessorConfig:
+    def test_variants(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv('IMAGE_VARIANTS', 'thumbnail=200x100, full=1600x1600')
+        monkeypatch.setenv('IMAGE_FORMATS', 'AVIF,webp,jpeg')
+        image_processor_config = load_image_processor_config()
+        assert image_processor_config.IMAGE_VARIANTS == {
+            'thumbnail': (200, 100),
+            'full': (1600, 1600),
+        }
+        assert image_processor_config.IMAGE_FORMATS == ['avif', 'webp', 'jpeg']
+
+    @pytest.mark.parametrize('variants', ['thumbnail', 'thumbnail=200', 'full=0x100', 'a=1x2x3'])
+    def test_invalid_variants(self, monkeypatch: pytest.MonkeyPatch, variants: str):
+        monkeypatch.setenv('IMAGE_VARIANTS', variants)
+        with pytest.raises(ConfigParseError):
+            load_image_processor_config()
@@ -0,0 +1,82 @@
+import threading
+from abc import ABC
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+
+from app.main.di.providers import cached_signature, singleton
+from app.main.di.stub import Stub
+
+
+class Settings:
+    pass
+
+
+class ServiceInterface(ABC):
+    pass
+
+
+class Service(ServiceInterface):
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/')
+    async def route(
+        first: Annotated[ServiceInterface, Depends()],
+        second: Annotated[ServiceInterface, Depends()],
+        settings: Annotated[Settings, Depends(Stub(Settings))],
+    ) -> dict:
+        return {
+            'same_service': first is second,
+            'same_settings': first.settings is settings,
+            'settings': id(settings),
+        }
+
+    return app
+
+
+class TestProviders:
+    async def test_singleton_and_cached_signature(self, app: FastAPI):
+        settings, created, threads = Settings(), [], []
+
+        async def get_service(settings: Annotated[Settings, Depends(Stub(Settings))]) -> Service:
+            created.append(settings)
+            threads.append(threading.current_thread())
+            return Service(settings)
+
+        app.dependency_overrides[Settings] = singleton(settings)
+        app.dependency_overrides[ServiceInterface] = cached_signature(get_service)
+        async with AsyncClient(app=app, base_url='http://test') as client:
+            responses = [(await client.get('/')).json() for _ in range(2)]
+        assert (
+            responses
+            == [
+                {'same_service': True, 'same_settings': True, 'settings': id(settings)},
+            ]
+            * 2
+        )
+        assert len(created) == 2
+        assert threads == [threading.main_thread()] * 2
+
+    def test_singleton_exposes_instance(self):
+        settings = Settings()
+        assert singleton(settings).instance is settings
+
+
+class TestStub:
+    def test_equal_to_its_dependency(self):
+        assert Stub(Settings) == Settings
+        assert hash(Stub(Settings)) == hash(Settings)
+        assert {Settings: 1}[Stub(Settings)] == 1
+
+    def test_kwargs_are_part_of_the_key(self):
+        assert Stub(Settings, name='a') == Stub(Settings, name='a')
+        assert Stub(Settings, name='a') != Stub(Settings, name='b')
+        assert Stub(Settings, name='a') != Settings
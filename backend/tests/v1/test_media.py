@@ -0,0 +1,153 @@
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from app.application.images.processors import store_blob
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
+from app.application.media.signers import MediaUrlSigner
+from app.main.config import Config
+from app.main.di.providers import singleton
+from app.main.main import app
+from app.presentators.api.media import ZEROCOPY, MediaFileResponse
+from app.presentators.api.routers.media import resolve_media_path
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def media_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(Config, 'ROOT_DIR', str(tmp_path))
+    (tmp_path / Config.MEDIA_DIR).mkdir(parents=True)
+    (tmp_path / Config.MEDIA_DIR / 'legacy.jpg').write_bytes(CONTENT)
+    return store_blob(CONTENT, str(tmp_path), Config.MEDIA_DIR, 'jpg')
+
+
+class TestMedia:
+    async def test_get(self, client: AsyncClient, media_path: str):
+        response = await client.get(f'/{media_path}')
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers['content-type'] == 'image/jpeg'
+        assert response.headers['content-length'] == str(len(CONTENT))
+        assert response.headers['accept-ranges'] == 'bytes'
+        assert response.headers['cache-control'] == 'public, max-age=31536000, immutable'
+        assert response.headers['etag'] == f'"{Path(media_path).stem}"'
+
+        response = await client.head(f'/{media_path}')
+        assert response.status_code == 200
+        assert response.content == b''
+        assert response.headers['content-length'] == str(len(CONTENT))
+
+    async def test_not_content_addressed(self, client: AsyncClient, media_path: str):
+        response = await client.get(f'/{Config.MEDIA_DIR}legacy.jpg')
+        assert response.status_code == 200
+        assert response.headers['cache-control'] == 'public, no-cache'
+        etag = response.headers['etag']
+        response = await client.get(
+            f'/{Config.MEDIA_DIR}legacy.jpg',
+            headers={'If-None-Match': etag},
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize(
+        'header, status_code, content_range',
+        [
+            ('bytes=0-99', 206, 'bytes 0-99/1024'),
+            ('bytes=1000-', 206, 'bytes 1000-1023/1024'),
+            ('bytes=-10', 206, 'bytes 1014-1023/1024'),
+            ('bytes=1000-5000', 206, 'bytes 1000-1023/1024'),
+            ('bytes=0-1,5-6', 200, None),
+            ('bytes=5-1', 200, None),
+            ('items=0-1', 200, None),
+            ('bytes=1024-', 416, 'bytes */1024'),
+            ('bytes=-0', 416, 'bytes */1024'),
+        ],
+    )
+    async def test_range(
+        self,
+        client: AsyncClient,
+        media_path: str,
+        header: str,
+        status_code: int,
+        content_range: str | None,
+    ):
+        response = await client.get(f'/{media_path}', headers={'Range': header})
+        assert response.status_code == status_code
+        assert response.headers.get('content-range') == content_range
+        if status_code == 200:
+            assert response.content == CONTENT
+        elif status_code == 206:
+            start, end = map(int, content_range.split()[1].split('/')[0].split('-'))
+            stop = end + 1
+            assert response.content == CONTENT[start:stop]
+
+    async def test_if_range(self, client: AsyncClient, media_path: str):
+        etag = (await client.head(f'/{media_path}')).headers['etag']
+        for if_range, status_code in [(etag, 206), ('"outdated"', 200)]:
+            response = await client.get(
+                f'/{media_path}',
+                headers={'Range': 'bytes=0-9', 'If-Range': if_range},
+            )
+            assert response.status_code == status_code
+
+    @pytest.mark.parametrize(
+        'relative_path',
+        ['missing.jpg', '.hidden', 'aa', 'image.jpg.0123.tmp', '../legacy.jpg'],
+    )
+    async def test_not_found(self, client: AsyncClient, media_path: str, relative_path: str):
+        media_dir = Path(Config.ROOT_DIR) / Config.MEDIA_DIR
+        (media_dir / '.hidden').write_bytes(CONTENT)
+        (media_dir / 'image.jpg.0123.tmp').write_bytes(CONTENT)
+        (media_dir.parent / 'legacy.jpg').write_bytes(CONTENT)
+        with pytest.raises(HTTPException) as ex:
+            resolve_media_path(relative_path)
+        assert ex.value.status_code == 404
+        response = await client.get(f'/{Config.MEDIA_DIR}{relative_path}')
+        assert response.status_code == 404
+
+    async def test_signed(
+        self,
+        client: AsyncClient,
+        media_path: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        signer = MediaUrlSigner('key', 3600)
+        monkeypatch.setitem(
+            app.dependency_overrides,
+            MediaUrlSignerInterface,
+            singleton(signer),
+        )
+        assert (await client.get(f'/{media_path}')).status_code == 403
+        expired = signer.sign(media_path, now=time.time() - 3 * 3600)
+        assert (await client.get(f'/{expired}')).status_code == 403
+        assert (await client.get(f'/{signer.sign(media_path)}x')).status_code == 403
+
+        response = await client.get(f'/{signer.sign(media_path)}')
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        max_age = int(response.headers['cache-control'].split('max-age=')[1].split(',')[0])
+        assert 3600 <= max_age <= 2 * 3600
+
+
+async def test_zerocopy(tmp_path: Path):
+    path = tmp_path / 'file'
+    path.write_bytes(CONTENT)
+    messages = []
+
+    async def send(message: dict) -> None:
+        messages.append({**message, 'file': message['file'].name} if 'file' in message else message)
+
+    response = MediaFileResponse(str(path), path.stat(), 10, 19, {}, status_code=206)
+    await response({'type': 'http', 'extensions': {ZEROCOPY: {}}}, None, send)
+    assert messages[0]['status'] == 206
+    assert (b'content-length', b'10') in messages[0]['headers']
+    assert messages[1] == {
+        'type': ZEROCOPY,
+        'file': str(path),
+        'offset': 10,
+        'count': 10,
+        'more_body': False,
+    }
@@ -1,22 +1,31 @@
+import json
 import os
+from pathlib import Path
 from typing import List
 
 import pytest
 from fastapi import UploadFile
 from fastapi.encoders import jsonable_encoder
 from httpx import AsyncClient
+from PIL import Image
 from pydantic import parse_obj_as
 from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
 
 from app.application.auth.encoders.jwt import JWTEncoder
+from app.application.interfaces.images.processors import ImageProcessorInterface
+from app.application.interfaces.media.signers import MediaUrlSignerInterface
+from app.application.media.signers import MediaUrlSigner
 from app.application.models.posts import PostReadSchema
 from app.domain.managers.users import UserManager
 from app.infrastructure.db.models.posts import Post
 from app.infrastructure.db.models.users import User
 from app.infrastructure.db.repositories.posts import PostRepository
+from app.main.config import Config
+from app.main.di.providers import singleton
 from app.main.main import app
+from tests.application.test_image_processor import make_image
 from tests.conftest import async_session_maker
 
 JWT_ACCESS_SECRET_KEY = os.environ['JWT_ACCESS_SECRET_KEY']
@@ -179,12 +188,15 @@ class TestPost:
 
         query = await PostRepository.get_query_with_prefetched_user_and_tags()
         result = await session.execute(query)
-        assert response.json() == jsonable_encoder(
-            parse_obj_as(
-                List[PostReadSchema],
-                result.unique().scalars().all(),
+        assert response.json() == {
+            'items': jsonable_encoder(
+                parse_obj_as(
+                    List[PostReadSchema],
+                    result.unique().scalars().all(),
+                ),
             ),
-        )
+            'next_cursor': None,
+        }
 
     async def test_get_post(self, client: AsyncClient, session: AsyncSession):
         response = await client.get(app.url_path_for('get_post', post_id=1))
@@ -198,3 +210,308 @@ class TestPost:
                 result.unique().scalar(),
             ),
         )
+
+    @pytest.mark.parametrize(
+        'url_name, url_params',
+        [
+            ('get_posts', {}),
+            ('get_user_posts', {'user_id': 1}),
+        ],
+    )
+    async def test_get_posts_pagination(
+        self,
+        client: AsyncClient,
+        url_name: str,
+        url_params: dict,
+    ):
+        async with async_session_maker() as session:
+            for _ in range(3):
+                await session.execute(
+                    insert(Post).values(user_id=1, title='page', content='page', published=True),
+                )
+            await session.commit()
+            query = (
+                select(Post.id)
+                .where(Post.user_id == 1, Post.published.is_(True))
+                .order_by(Post.created_at.desc(), Post.id.desc())
+            )
+            result = await session.execute(query)
+            expected_ids = result.scalars().all()
+
+        ids, cursor = [], None
+        for _ in range(len(expected_ids)):
+            params = {'limit': 2}
+            if cursor:
+                params['cursor'] = cursor
+            response = await client.get(app.url_path_for(url_name, **url_params), params=params)
+            assert response.status_code == 200
+            ids += [post['id'] for post in response.json()['items']]
+            cursor = response.json()['next_cursor']
+            if not cursor:
+                break
+        assert ids == expected_ids
+
+    async def test_get_posts_invalid_cursor(self, client: AsyncClient):
+        response = await client.get(app.url_path_for('get_posts'), params={'cursor': 'invalid'})
+        assert response.status_code == 422
+
+    async def test_get_post_cache_invalidation(self, client: AsyncClient):
+        await self.set_current_access_token(client, by_author=True)
+        post_url = app.url_path_for('get_post', post_id=1)
+        user_posts_url = app.url_path_for('get_user_posts', user_id=1)
+        assert (await client.get(post_url)).json()['title'] != 'cached'
+        assert (await client.get(user_posts_url)).status_code == 200
+
+        response = await client.patch(
+            url=app.url_path_for('edit_post', post_id=1),
+            data={'title': 'cached', 'content': 'cached', 'published': True},
+        )
+        assert response.status_code == 200
+
+        assert (await client.get(post_url)).json()['title'] == 'cached'
+        response = await client.get(user_posts_url)
+        assert 'cached' in [post['title'] for post in response.json()['items']]
+
+    async def test_get_posts_conditional(self, client: AsyncClient):
+        url = app.url_path_for('get_posts')
+        response = await client.get(url)
+        assert response.status_code == 200
+        assert response.headers['cache-control'] == 'no-cache'
+        etag, last_modified = response.headers['etag'], response.headers['last-modified']
+
+        for headers in [
+            {'If-None-Match': etag},
+            {'If-None-Match': f'"other", W/{etag}'},
+            {'If-Modified-Since': last_modified},
+        ]:
+            response = await client.get(url, headers=headers)
+            assert response.status_code == 304
+            assert response.content == b''
+            assert response.headers['etag'] == etag
+
+        for params, headers in [
+            ({}, {'If-None-Match': '"other"'}),
+            ({}, {'If-None-Match': '"other"', 'If-Modified-Since': last_modified}),
+            ({}, {'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'}),
+            ({'limit': 1}, {'If-None-Match': etag}),
+        ]:
+            response = await client.get(url, params=params, headers=headers)
+            assert response.status_code == 200
+
+    async def test_get_post_validators_after_write(self, client: AsyncClient):
+        await self.set_current_access_token(client, by_author=True)
+        url = app.url_path_for('get_post', post_id=1)
+        etag = (await client.get(url)).headers['etag']
+
+        response = await client.patch(
+            url=app.url_path_for('edit_post', post_id=1),
+            data={'title': 'fresh', 'content': 'fresh', 'published': True},
+        )
+        assert response.status_code == 200
+
+        response = await client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.json()['title'] == 'fresh'
+        assert response.headers['etag'] != etag
+
+        response = await client.get(url, headers={'If-None-Match': response.headers['etag']})
+        assert response.status_code == 304
+
+    async def test_get_post_if_none_match_any(self, client: AsyncClient):
+        response = await client.get(
+            app.url_path_for('get_post', post_id=1),
+            headers={'If-None-Match': '*'},
+        )
+        assert response.status_code == 304
+
+        response = await client.get(
+            app.url_path_for('get_post', post_id=100500),
+            headers={'If-None-Match': '*'},
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize('stream', ['json', 'ndjson'])
+    async def test_get_posts_stream(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        stream: str,
+    ):
+        monkeypatch.setattr('app.domain.services.posts.STREAM_BATCH_SIZE', 2)
+        response = await client.get(app.url_path_for('get_posts'), params={'stream': stream})
+        assert response.status_code == 200
+
+        query = await PostRepository.get_query_with_prefetched_user_and_tags()
+        result = await session.execute(query.order_by(Post.created_at.desc(), Post.id.desc()))
+        expected = jsonable_encoder(parse_obj_as(List[PostReadSchema], result.scalars().all()))
+        assert len(expected) > 2
+        if stream == 'ndjson':
+            assert response.headers['content-type'] == 'application/x-ndjson'
+            assert [json.loads(line) for line in response.text.splitlines()] == expected
+        else:
+            assert response.headers['content-type'] == 'application/json'
+            assert response.json() == expected
+
+    @pytest.mark.parametrize(
+        'image, content_type, status_code',
+        [
+            (make_image((3000, 3000)), 'image/png', 201),
+            (b'not an image', 'image/png', 422),
+            (make_image((10, 10), 'GIF'), 'image/png', 422),
+        ],
+        ids=['png', 'garbage', 'gif'],
+    )
+    async def test_create_post_with_image(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        image: bytes,
+        content_type: str,
+        status_code: int,
+    ):
+        await self.set_current_access_token(client, by_author=True)
+        monkeypatch.setattr(Config, 'ROOT_DIR', str(tmp_path))
+        (tmp_path / Config.MEDIA_DIR).mkdir(parents=True)
+        response = await client.post(
+            url=app.url_path_for('create_post'),
+            data={'title': 'image', 'content': 'image', 'published': True},
+            files={'image': ('image.png', image, content_type)},
+        )
+        assert response.status_code == status_code
+        if status_code == 201:
+            post = await session.get(Post, response.json()['id'])
+            assert post.image in [variant['jpeg'] for variant in post.image_variants.values()]
+            assert post.image.startswith(Config.MEDIA_DIR)
+            assert response.json()['image_variants'] == {
+                name: {**variant, 'avif': None} for name, variant in post.image_variants.items()
+            }
+            with Image.open(tmp_path / post.image_variants['thumbnail']['webp']) as img:
+                assert img.size == (400, 400)
+            with Image.open(tmp_path / post.image) as img:
+                assert img.size == (1000, 1000)
+
+    async def test_signed_image_urls(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ):
+        await self.set_current_access_token(client, by_author=True)
+        monkeypatch.setattr(Config, 'ROOT_DIR', str(tmp_path))
+        monkeypatch.setitem(
+            app.dependency_overrides,
+            MediaUrlSignerInterface,
+            singleton(MediaUrlSigner('key', 3600)),
+        )
+        response = await client.post(
+            url=app.url_path_for('create_post'),
+            data={'title': 'image', 'content': 'image', 'published': True},
+            files={'image': ('image.png', make_image((500, 500)), 'image/png')},
+        )
+        assert response.status_code == 201
+        post = await session.get(Post, response.json()['id'])
+        assert (await client.get(f'/{post.image}')).status_code == 403
+
+        response = await client.get(app.url_path_for('get_post', post_id=post.id))
+        assert response.status_code == 200
+        await self.assert_signed_image_urls(client, response.json(), post, tmp_path)
+
+    async def test_signed_image_urls_on_edit(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ):
+        await self.set_current_access_token(client, by_author=True)
+        monkeypatch.setattr(Config, 'ROOT_DIR', str(tmp_path))
+        monkeypatch.setitem(
+            app.dependency_overrides,
+            MediaUrlSignerInterface,
+            singleton(MediaUrlSigner('key', 3600)),
+        )
+        response = await client.post(
+            url=app.url_path_for('create_post'),
+            data={'title': 'image', 'content': 'image', 'published': True},
+        )
+        assert response.status_code == 201
+        post_id = response.json()['id']
+        response = await client.patch(
+            url=app.url_path_for('edit_post', post_id=post_id),
+            files={'image': ('image.png', make_image((600, 600)), 'image/png')},
+        )
+        assert response.status_code == 200
+        post = await session.get(Post, post_id)
+        await self.assert_signed_image_urls(client, response.json(), post, tmp_path)
+
+    @staticmethod
+    async def assert_signed_image_urls(client: AsyncClient, data: dict, post: Post, tmp_path: Path):
+        urls = [data['image'], data['image_variants']['thumbnail']['webp']]
+        for url, path in zip(urls, [post.image, post.image_variants['thumbnail']['webp']]):
+            assert url.startswith(f'{path}?expires=')
+            image_response = await client.get(f'/{url}')
+            assert image_response.status_code == 200
+            assert image_response.content == (tmp_path / path).read_bytes()
+
+    async def test_create_post_with_duplicate_image(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ):
+        await self.set_current_access_token(client, by_author=True)
+        monkeypatch.setattr(Config, 'ROOT_DIR', str(tmp_path))
+        image_processor = app.dependency_overrides[ImageProcessorInterface].instance
+        process = image_processor.process
+        image = make_image((500, 500))
+
+        async def create_post() -> Post:
+            response = await client.post(
+                url=app.url_path_for('create_post'),
+                data={'title': 'image', 'content': 'image', 'published': True},
+                files={'image': ('image.png', image, 'image/png')},
+            )
+            assert response.status_code == 201
+            return await session.get(Post, response.json()['id'])
+
+        first = await create_post()
+        files = sorted(tmp_path.rglob('*.*'))
+
+        async def not_processed(*args):
+            raise AssertionError('identical upload was processed again')
+
+        monkeypatch.setattr(image_processor, 'process', not_processed)
+        second = await create_post()
+        assert second.image_digest == first.image_digest
+        assert second.image_variants == first.image_variants
+        assert sorted(tmp_path.rglob('*.*')) == files
+
+        (tmp_path / first.image).unlink()
+        monkeypatch.setattr(image_processor, 'process', process)
+        third = await create_post()
+        assert third.image_variants == first.image_variants
+        assert (tmp_path / first.image).exists()
+
+    async def test_create_post_with_too_large_image(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        await self.set_current_access_token(client, by_author=True)
+        image = make_image((100, 100))
+        image_processor = app.dependency_overrides[ImageProcessorInterface].instance
+        monkeypatch.setattr(image_processor, 'max_bytes', len(image) - 1)
+        posts_before = await session.scalar(select(count(Post.id)))
+        response = await client.post(
+            url=app.url_path_for('create_post'),
+            data={'title': 'image', 'content': 'image', 'published': True},
+            files={'image': ('image.png', image, 'image/png')},
+        )
+        assert response.status_code == 413
+        assert await session.scalar(select(count(Post.id))) == posts_before
@@ -119,6 +119,19 @@ class TestTag:
                 ),
             )
 
+    async def test_get_tags_validators_after_write(self, client: AsyncClient):
+        await self.set_current_access_token(client, by_author=True)
+        url = app.url_path_for('get_tags')
+        etag = (await client.get(url)).headers['etag']
+        assert (await client.get(url, headers={'If-None-Match': etag})).status_code == 304
+
+        response = await client.post(app.url_path_for('create_tag'), json={'name': 'fresh'})
+        assert response.status_code == 201
+
+        response = await client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert 'fresh' in [tag['name'] for tag in response.json()]
+
     @pytest.mark.parametrize(
         'name, by_author, should_match, status_code',
         [
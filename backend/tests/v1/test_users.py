@@ -1,3 +1,4 @@
+import json
 import os
 from typing import List
 
@@ -5,11 +6,12 @@ import pytest
 from fastapi.encoders import jsonable_encoder
 from httpx import AsyncClient
 from pydantic import parse_obj_as
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import load_only
 from sqlalchemy.sql.functions import count
 
 from app.application.auth.encoders.jwt import JWTEncoder
+from app.application.auth.hashers.passwords import LegacyPBKDF2PasswordHashAlgorithm
 from app.application.models.users import UserReadBaseSchema
 from app.infrastructure.db.models.jwt import RefreshToken
 from app.infrastructure.db.models.users import User
@@ -171,6 +173,24 @@ class TestUser:
                     ),
                 )
 
+    async def test_get_users_stream(self, client: AsyncClient):
+        await self.set_access_token(client)
+        response = await client.get(app.url_path_for('get_users'))
+        users = response.json()
+        response = await client.get(app.url_path_for('get_users'), params={'stream': 'ndjson'})
+        assert response.status_code == 200
+        assert [json.loads(line) for line in response.text.splitlines()] == users
+
+    async def test_get_users_conditional(self, client: AsyncClient):
+        await self.set_access_token(client)
+        url = app.url_path_for('get_users')
+        response = await client.get(url)
+        assert response.headers['cache-control'] == 'private, no-cache'
+        assert response.headers['vary'] == 'Authorization'
+
+        response = await client.get(url, headers={'If-None-Match': response.headers['etag']})
+        assert response.status_code == 304
+
     @pytest.mark.parametrize(
         'with_access_token, status_code',
         [
@@ -190,3 +210,60 @@ class TestUser:
             client.headers.pop('Authorization')
         response = await client.get(app.url_path_for('get_user', user_id=1))
         assert response.status_code == status_code
+
+    async def test_login_rehashes_legacy_password(self, client: AsyncClient):
+        async with async_session_maker() as session:
+            await session.execute(
+                insert(User).values(
+                    username='legacy',
+                    email='legacy@test.ru',
+                    password=LegacyPBKDF2PasswordHashAlgorithm().encode('test'),
+                    is_verified=True,
+                ),
+            )
+            await session.commit()
+
+        for _ in range(2):
+            response = await client.post(
+                url=app.url_path_for('login'),
+                json={'email': 'legacy@test.ru', 'input_password': 'test'},
+            )
+            assert response.status_code == 200
+
+            async with async_session_maker() as session:
+                query = select(User.password).where(User.email == 'legacy@test.ru')
+                result = await session.execute(query)
+                assert result.scalar().startswith('pbkdf2_sha256$100000$')
+
+    async def test_forged_access_token(self, client: AsyncClient):
+        client.headers['Authorization'] = jwt_encoder.generate_jwt(
+            data={'sub': 1, 'is_superuser': True},
+            secret='forged secret',
+            lifetime_seconds=60,
+        )
+        response = await client.get(app.url_path_for('get_users'))
+        assert response.status_code == 401
+
+    async def test_jwks(self, client: AsyncClient):
+        response = await client.get(app.url_path_for('get_jwks'))
+        assert response.status_code == 200
+        assert response.json() == {'keys': []}
+
+    async def test_refresh_token_reuse(self, client: AsyncClient):
+        response = await client.post(
+            url=app.url_path_for('login'),
+            json={'email': 'test@test.ru', 'input_password': 'test'},
+        )
+        first_token = response.cookies['refresh_token']
+        client.cookies.clear()
+
+        url = app.url_path_for('refresh_access_token')
+        response = await client.post(url, cookies={'refresh_token': first_token})
+        assert response.status_code == 200
+        second_token = response.cookies['refresh_token']
+        client.cookies.clear()
+
+        response = await client.post(url, cookies={'refresh_token': first_token})
+        assert response.status_code == 401
+        response = await client.post(url, cookies={'refresh_token': second_token})
+        assert response.status_code == 401
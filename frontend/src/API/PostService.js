@@ -6,7 +6,7 @@ class PostService {
         const response = await axios.get(
             `/api/v1/posts`,
         );
-        return response.data
+        return response.data.items
     }
 
    static async getPost(id) {
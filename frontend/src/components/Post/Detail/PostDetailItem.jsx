@@ -1,4 +1,5 @@
 import cl from './Post.module.css';
+import PostImage from '../PostImage';
 
 
 const TagDetail = ({tag}) => {
@@ -16,7 +17,7 @@ const PostDetailItem = ({post}) => {
 
             <div className={cl.imageContainer}>
                 {post.image
-                    ? <img src={`/${post.image}`} alt='post' />
+                    ? <PostImage post={post} sizes='(max-width: 1000px) 100vw, 60vw' />
                     : <div className={cl.noImage}> No image </div>
                 }
             </div>
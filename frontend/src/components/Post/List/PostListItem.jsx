@@ -1,5 +1,6 @@
 import { Link } from 'react-router-dom';
 import cl from './Post.module.css';
+import PostImage from '../PostImage';
 
 
 const PostListItem = ({post}) => {
@@ -8,7 +9,7 @@ const PostListItem = ({post}) => {
 
             <div className={cl.postImageContainer}>
                 {post.image
-                    ? <img className={cl.postImage} src={`/${post.image}`} alt='post' />
+                    ? <PostImage post={post} sizes='400px' className={cl.postImage} />
                     : <div className={cl.postNoImage}> No image </div>
                 }
             </div>
@@ -0,0 +1,36 @@
+const MODERN_FORMATS = ['avif', 'webp'];
+
+
+const getSrcSet = (variants, format) => {
+    return variants
+        .filter((variant) => variant[format])
+        .map((variant) => `/${variant[format]} ${variant.width}w`)
+        .join(', ');
+}
+
+
+const PostImage = ({post, sizes, className}) => {
+    const variants = Object.values(post.image_variants || {});
+    return(
+        <picture>
+            {MODERN_FORMATS.map((format) => getSrcSet(variants, format) &&
+                <source
+                    key={format}
+                    type={`image/${format}`}
+                    srcSet={getSrcSet(variants, format)}
+                    sizes={sizes}
+                />
+            )}
+            <img
+                className={className}
+                src={`/${post.image}`}
+                srcSet={getSrcSet(variants, 'jpeg') || undefined}
+                sizes={sizes}
+                loading='lazy'
+                alt='post'
+            />
+        </picture>
+    );
+}
+
+export default PostImage;